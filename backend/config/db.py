@@ -37,6 +37,26 @@ notification_collection = db.get_collection("notifications")
 category_collection = db.get_collection("categories")
 # --- NAYI LINE ---
 
+# Shared catalog version - cache keys aur ETags isi se (utils/cache_helper.py)
+catalog_meta_collection = db.get_collection("catalog_meta")
+
+# Model name alias table (utils/model_normalizer.py)
+model_alias_collection = db.get_collection("model_aliases")
+
+# Demand analytics ki materialized summary (utils/demand_helper.py)
+demand_collection = db.get_collection("demand_daily")
+# Summary ka refresh watermark - sab workers ke liye ek ('$out' summary ko replace karta hai, isliye alag)
+demand_meta_collection = db.get_collection("demand_meta")
+
+# Uploaded images ki content-hash registry, refCount ke saath (utils/image_store.py)
+image_collection = db.get_collection("images")
+
+# Storage se delete hone wale image assets ki queue (utils/image_gc.py)
+image_tombstone_collection = db.get_collection("image_tombstones")
+
+# Restock fan-out ke jo models abhi dispatch nahi hue / fail hue (utils/restock_worker.py)
+restock_pending_collection = db.get_collection("restock_pending")
+
 
 async def check_db_connection():
     """
@@ -0,0 +1,288 @@
+import asyncio
+import sys
+from typing import Dict, List, Any
+
+from pymongo import IndexModel, ASCENDING, DESCENDING
+from pymongo.errors import OperationFailure
+
+from config.db import db
+
+# --- Declarative Index Registry ---
+# Har collection ke indexes yahaan declare hote hain. 'ensure_indexes()' inhe
+# startup par idempotently apply karta hai (pehle se bane index par kuch nahi hota).
+# Compound indexes ESR rule (Equality, Sort, Range) ke hisaab se banaye gaye hain.
+
+INDEX_REGISTRY: Dict[str, List[IndexModel]] = {
+    "covers": [
+        # Shopper listing: is_available=True + keyset sort (createdAt, _id), price range baad mein.
+        # '_id' index mein na ho to har page par in-memory SORT hota hai
+        IndexModel([("is_available", ASCENDING), ("createdAt", DESCENDING), ("_id", DESCENDING)],
+                   name="covers_available_createdAt"),
+        IndexModel([("is_available", ASCENDING), ("coverType", ASCENDING), ("createdAt", DESCENDING),
+                    ("_id", DESCENDING)], name="covers_available_coverType_createdAt_id"),
+        IndexModel([("is_available", ASCENDING), ("color", ASCENDING), ("createdAt", DESCENDING),
+                    ("_id", DESCENDING)], name="covers_available_color_createdAt_id"),
+        IndexModel([("is_available", ASCENDING), ("genderPreference", ASCENDING), ("createdAt", DESCENDING),
+                    ("_id", DESCENDING)], name="covers_available_gender_createdAt_id"),
+        IndexModel([("is_available", ASCENDING), ("category_ids", ASCENDING), ("createdAt", DESCENDING),
+                    ("_id", DESCENDING)], name="covers_available_category_createdAt_id"),
+        # Admin mode (is_available filter ke bina)
+        IndexModel([("createdAt", DESCENDING), ("_id", DESCENDING)],
+                   name="covers_createdAt"),
+        # Admin dashboard: sabse kam stock wale products
+        IndexModel([("stock", ASCENDING)], name="covers_stock"),
+        # Model search (utils/search_helper.py)
+        IndexModel([("searchTokens", ASCENDING)], name="searchTokens_1"),
+        IndexModel([("modelKey", ASCENDING)], name="modelKey_1"),
+        # Canonical model par exact lookup (utils/model_normalizer.py)
+        IndexModel([("canonicalModel", ASCENDING), ("is_available", ASCENDING)],
+                   name="covers_canonicalModel"),
+        # Catalog import ke upserts ki key (utils/catalog_import.py)
+        IndexModel([("canonicalModel", ASCENDING), ("coverType", ASCENDING), ("color", ASCENDING)],
+                   name="covers_canonicalModel_type_color"),
+        # Content-hash image registry ke references (utils/image_store.py)
+        IndexModel([("imageHash", ASCENDING)], name="covers_imageHash", sparse=True),
+        # Image GC: delete se pehle "koi cover yeh storage key use kar raha hai?"
+        IndexModel([("imageKey", ASCENDING)], name="covers_imageKey", sparse=True),
+        IndexModel([("images.variants.key", ASCENDING)], name="covers_variantKey", sparse=True),
+    ],
+    "categories": [
+        IndexModel([("name", ASCENDING)], name="categories_name_unique", unique=True),
+    ],
+    "notifications": [
+        # Admin list (GET /api/notify): filter + sort (createdAt, _id) keyset pagination
+        IndexModel([("createdAt", DESCENDING), ("_id", DESCENDING)], name="notifications_createdAt_id"),
+        IndexModel([("status", ASCENDING), ("createdAt", DESCENDING), ("_id", DESCENDING)],
+                   name="notifications_status_createdAt_id"),
+        IndexModel([("phone", ASCENDING), ("createdAt", DESCENDING)], name="notifications_phone_createdAt"),
+        IndexModel([("canonicalModel", ASCENDING), ("status", ASCENDING), ("createdAt", DESCENDING)],
+                   name="notifications_canonicalModel_status_createdAt"),
+        # Admin list 'model' filter (status ke bina) - keyset sort index se hi
+        IndexModel([("canonicalModel", ASCENDING), ("createdAt", DESCENDING), ("_id", DESCENDING)],
+                   name="notifications_canonicalModel_createdAt_id"),
+        # Admin list 'q' search: model name / phone ke prefix tokens, keyset sort index se hi
+        IndexModel([("searchTokens", ASCENDING), ("createdAt", DESCENDING), ("_id", DESCENDING)],
+                   name="notifications_searchTokens_createdAt_id"),
+        IndexModel([("phoneTokens", ASCENDING), ("createdAt", DESCENDING), ("_id", DESCENDING)],
+                   name="notifications_phoneTokens_createdAt_id"),
+        # Ek phone + model ki sirf ek open request (POST /api/notify ka upsert isi par)
+        IndexModel([("phone", ASCENDING), ("canonicalModel", ASCENDING)],
+                   name="notifications_open_phone_model_unique", unique=True,
+                   partialFilterExpression={"isOpen": True}),
+        IndexModel([("idempotencyKey", ASCENDING)], name="notifications_idempotencyKey_unique",
+                   unique=True, partialFilterExpression={"idempotencyKey": {"$exists": True}}),
+        # Demand summary ka incremental refresh (badle hue notifications)
+        IndexModel([("updatedAt", ASCENDING)], name="notifications_updatedAt", sparse=True),
+    ],
+    # Rate limiter ka shared backend (utils/rate_limiter.py): purani keys TTL se hat jaati hain
+    "rate_limits": [
+        IndexModel([("expiresAt", ASCENDING)], name="rate_limits_ttl", expireAfterSeconds=0),
+    ],
+    # Restock markers: worker ka sweep bina lease wale markers dhoondhta hai (utils/restock_worker.py)
+    "restock_pending": [
+        IndexModel([("leaseUntil", ASCENDING)], name="restock_pending_leaseUntil"),
+    ],
+    "demand_daily": [
+        IndexModel([("_id.d", ASCENDING)], name="demand_daily_day"),
+    ],
+    # Image registry: '_id' hi sha256 hai; refCount se bina reference wali images
+    "images": [
+        IndexModel([("refCount", ASCENDING)], name="images_refCount"),
+        IndexModel([("imageKey", ASCENDING)], name="images_imageKey"),
+        IndexModel([("images.variants.key", ASCENDING)], name="images_variantKey", sparse=True),
+    ],
+}
+
+# Purane indexes jinki jagah naye compound indexes aa gaye hain. 'ensure_indexes()'
+# inhe drop karta hai taaki har write par bekaar index maintain na ho.
+RETIRED_INDEXES: Dict[str, List[str]] = {
+    "covers": [
+        "covers_available_coverType_createdAt",
+        "covers_available_color_createdAt",
+        "covers_available_gender_createdAt",
+        "covers_available_category_createdAt",
+    ],
+    "notifications": [
+        "notifications_createdAt",
+        "notifications_status_createdAt",
+        "notifications_canonicalModel_status",
+    ],
+}
+
+# --- Query Plan Checks ---
+# Har endpoint ki asli query (wahi filter + sort) ka ek namoona. 'check_indexes()' inka
+# explain() chalata hai aur report karta hai jab winning plan mein COLLSCAN ya in-memory
+# SORT ho, filter wali query poora index scan kare (pehle field ke bounds [MinKey, MaxKey]),
+# ya padhe gaye documents / keys lautaye gaye documents se bahut zyada hon.
+PLAN_CHECKS: List[Dict[str, Any]] = [
+    {"endpoint": "GET /api/covers (default)", "collection": "covers",
+     "filter": {"is_available": True, "price": {"$lte": 5000}}, "sort": [("createdAt", DESCENDING), ("_id", DESCENDING)]},
+    {"endpoint": "GET /api/covers (model)", "collection": "covers",
+     "filter": {"is_available": True, "$or": [{"canonicalModel": "apple iphone 14"},
+                                              {"searchTokens": {"$all": ["iphone", "14"]}},
+                                              {"searchTokens": "~iphone14"}]}},
+    {"endpoint": "GET /api/covers (coverType)", "collection": "covers",
+     "filter": {"is_available": True, "coverType": {"$in": ["Silicone"]}},
+     "sort": [("createdAt", DESCENDING), ("_id", DESCENDING)]},
+    {"endpoint": "GET /api/covers (color)", "collection": "covers",
+     "filter": {"is_available": True, "color": {"$in": ["Black"]}},
+     "sort": [("createdAt", DESCENDING), ("_id", DESCENDING)]},
+    {"endpoint": "GET /api/covers (gender)", "collection": "covers",
+     "filter": {"is_available": True, "genderPreference": "Ladies"},
+     "sort": [("createdAt", DESCENDING), ("_id", DESCENDING)]},
+    {"endpoint": "GET /api/covers (category)", "collection": "covers",
+     "filter": {"is_available": True, "category_ids": {"$in": ["605c72ef8f0b9f001f7b0e0a"]}},
+     "sort": [("createdAt", DESCENDING), ("_id", DESCENDING)]},
+    {"endpoint": "GET /api/covers (admin_mode)", "collection": "covers",
+     "filter": {}, "sort": [("createdAt", DESCENDING), ("_id", DESCENDING)]},
+    {"endpoint": "POST /api/categories (duplicate check)", "collection": "categories",
+     "filter": {"name": "Silicone Cases"}},
+    {"endpoint": "GET /api/admin/stats (low stock)", "collection": "covers",
+     "filter": {"stock": {"$lt": 10}}, "sort": [("stock", ASCENDING)]},
+    {"endpoint": "GET /api/admin/stats (available count)", "collection": "covers",
+     "filter": {"is_available": True}},
+    {"endpoint": "GET /api/admin/stats (status breakdown)", "collection": "notifications",
+     "filter": {}, "sort": [("status", ASCENDING)]},
+    {"endpoint": "GET /api/notify", "collection": "notifications",
+     "filter": {}, "sort": [("createdAt", DESCENDING), ("_id", DESCENDING)]},
+    {"endpoint": "GET /api/notify (status)", "collection": "notifications",
+     "filter": {"status": {"$in": ["Pending"]}}, "sort": [("createdAt", DESCENDING), ("_id", DESCENDING)]},
+    {"endpoint": "GET /api/notify (q search)", "collection": "notifications",
+     "filter": {"$or": [{"canonicalModel": "98765"},
+                        {"searchTokens": {"$all": ["98765"]}},
+                        {"searchTokens": "~98765"},
+                        {"phoneTokens": "98765"}]},
+     "sort": [("createdAt", DESCENDING), ("_id", DESCENDING)]},
+    {"endpoint": "Restock worker (pending by model)", "collection": "notifications",
+     "filter": {"canonicalModel": "apple iphone 14", "status": "Pending"}, "sort": [("createdAt", ASCENDING)]},
+    {"endpoint": "GET /api/notify (model)", "collection": "notifications",
+     "filter": {"canonicalModel": "apple iphone 14"},
+     "sort": [("createdAt", DESCENDING), ("_id", DESCENDING)]},
+    {"endpoint": "POST /api/covers/import (upsert key)", "collection": "covers",
+     "filter": {"canonicalModel": "apple iphone 14", "coverType": "Silicone", "color": "Black"}},
+    {"endpoint": "Image GC (key still referenced?)", "collection": "covers",
+     "filter": {"$or": [{"imageKey": {"$in": ["mobile_covers/abc"]}},
+                        {"images.variants.key": {"$in": ["mobile_covers/abc"]}}]}},
+]
+
+
+async def ensure_indexes() -> None:
+    """
+    Registry ke saare indexes banata hai. Ek index fail hone par (jaise purane
+    duplicate data ki wajah se unique index) baaki indexes phir bhi bante hain.
+    """
+    for coll_name, models in INDEX_REGISTRY.items():
+        coll = db.get_collection(coll_name)
+        for model in models:
+            try:
+                await coll.create_indexes([model])
+            except OperationFailure as e:
+                print(f"[Indexes] Warning: '{coll_name}.{model.document['name']}' nahi ban paaya: {e}")
+    for coll_name, names in RETIRED_INDEXES.items():
+        coll = db.get_collection(coll_name)
+        existing = await coll.index_information()
+        for name in names:
+            if name not in existing:
+                continue
+            try:
+                await coll.drop_index(name)
+                print(f"[Indexes] Purana index '{coll_name}.{name}' drop kiya.")
+            except OperationFailure as e:
+                # Doosre worker ne beech mein drop kar diya ho - startup nahi rukna chahiye
+                print(f"[Indexes] Warning: purana index '{coll_name}.{name}' drop nahi hua: {e}")
+    print("[Indexes] Index registry apply ho gayi.")
+
+
+# Itne se kam documents padhe gaye hon to ratio check nahi (chhota / dev database)
+PLAN_MIN_EXAMINED = 1000
+# Padhe gaye documents (ya keys) lautaye gaye documents ke itne guna se zyada = bekaar scan
+PLAN_MAX_EXAMINED_RATIO = 10
+
+# Index bounds jo poora index (ya poori string range) cover karte hain
+_UNBOUNDED = {"[MinKey, MaxKey]", "[MaxKey, MinKey]", '["", {})', '({}, ""]'}
+
+
+def _plan_stages(plan: Any) -> List[str]:
+    """Explain output se saare 'stage' naam nikaalta hai (nested plans bhi)."""
+    stages = []
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        for value in plan.values():
+            stages.extend(_plan_stages(value))
+    elif isinstance(plan, list):
+        for item in plan:
+            stages.extend(_plan_stages(item))
+    return stages
+
+
+def _unbounded_scans(plan: Any) -> List[str]:
+    """
+    Un IXSCAN stages ke index naam jinke pehle field ke bounds poori range hain, yaani
+    index shuru se aakhir tak padha jaata hai (jaise unanchored regex, ya filter jo sirf
+    FETCH mein lagta hai).
+    """
+    scans = []
+    if isinstance(plan, dict):
+        if plan.get("stage") == "IXSCAN":
+            key_pattern = list(plan.get("keyPattern", {}))
+            bounds = plan.get("indexBounds", {})
+            if key_pattern and _UNBOUNDED & set(bounds.get(key_pattern[0], [])):
+                scans.append(plan.get("indexName", key_pattern[0]))
+        for value in plan.values():
+            scans.extend(_unbounded_scans(value))
+    elif isinstance(plan, list):
+        for item in plan:
+            scans.extend(_unbounded_scans(item))
+    return scans
+
+
+async def check_indexes() -> List[str]:
+    """
+    Check mode: registry ke missing indexes aur COLLSCAN / in-memory SORT / poore index
+    scan / bahut zyada documents padhne wale query plans report karta hai.
+    Problems ki list return karta hai (khaali list = sab theek).
+    """
+    problems = []
+
+    for coll_name, models in INDEX_REGISTRY.items():
+        existing = await db.get_collection(coll_name).index_information()
+        for model in models:
+            name = model.document["name"]
+            if name not in existing:
+                problems.append(f"Missing index: {coll_name}.{name}")
+
+    for check in PLAN_CHECKS:
+        cursor = db.get_collection(check["collection"]).find(check["filter"])
+        if check.get("sort"):
+            cursor = cursor.sort(check["sort"])
+        explain = await cursor.explain()
+        winning_plan = explain.get("queryPlanner", {}).get("winningPlan", {})
+        stages = _plan_stages(winning_plan)
+        bad = [stage for stage in ("COLLSCAN", "SORT") if stage in stages]
+        # Khaali filter (poori listing, limit ke saath) mein poora index scan hi sahi hai
+        if check["filter"]:
+            bad += [f"UNBOUNDED IXSCAN {name}" for name in _unbounded_scans(winning_plan)]
+        stats = explain.get("executionStats", {})
+        examined = max(stats.get("totalDocsExamined", 0), stats.get("totalKeysExamined", 0))
+        returned = stats.get("nReturned", 0)
+        if examined >= PLAN_MIN_EXAMINED and examined > PLAN_MAX_EXAMINED_RATIO * max(returned, 1):
+            bad.append(f"EXAMINED {examined}/{returned}")
+        if bad:
+            problems.append(f"{'+'.join(bad)}: {check['endpoint']} ({check['collection']})")
+        else:
+            print(f"[Indexes] OK: {check['endpoint']} -> {' > '.join(stages)}")
+
+    for problem in problems:
+        print(f"[Indexes] {problem}")
+    return problems
+
+
+# --- CLI ---
+# python -m config.indexes          -> indexes apply karein
+# python -m config.indexes --check  -> sirf report (exit code 1 agar problem hai)
+if __name__ == "__main__":
+    if "--check" in sys.argv:
+        found = asyncio.run(check_indexes())
+        sys.exit(1 if found else 0)
+    asyncio.run(ensure_indexes())
@@ -0,0 +1,429 @@
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    status,
+    Query,
+    Response,
+    Body,
+    Path
+)
+from fastapi.responses import StreamingResponse
+from typing import List, Optional, Literal, Set
+from datetime import datetime, timedelta
+import asyncio
+
+# Database collections
+from config.db import (
+    category_collection,
+    collection as cover_collection,
+    notification_collection,
+    model_alias_collection,
+    demand_collection
+)
+# Data models and helpers
+from models.admin_model import (
+    AdminStats,
+    LowStockItem,
+    ModelAliasIn,
+    ModelAliasOut,
+    DemandRow,
+    DemandReport,
+    ImageGCReport
+)
+from models.notification_model import notification_helper, NotificationStatus, OPEN_STATUSES
+from utils.cache_helper import TTLCache, catalog_cache, bump_catalog_version
+from utils.model_normalizer import (
+    normalize_model_name,
+    parse_model_name,
+    load_aliases,
+    backfill_canonical_models
+)
+from utils.search_helper import backfill_search_fields
+from utils.demand_helper import (
+    STATUSES,
+    demand_summary,
+    build_live_demand_pipeline,
+    build_summary_demand_pipeline
+)
+from utils.image_gc import image_gc
+from utils.export_helper import (
+    EXPORT_FORMATS,
+    EXPORT_COLUMNS,
+    EXPORT_PROJECTIONS,
+    stream_export
+)
+from controllers.cover_controller import build_cover_query
+from controllers.notification_controller import build_notification_query, merge_open_conflicts
+
+# Naya router object
+router = APIRouter(
+    prefix="/api/admin",
+    tags=["Admin"]
+)
+
+# Stats ko kitne seconds tak cache karna hai
+STATS_TTL_SECONDS = 30
+_stats_cache = TTLCache(ttl=STATS_TTL_SECONDS)
+
+
+async def _status_breakdown() -> dict:
+    """
+    Notifications ke per-status counts. '$sort' pehle hai taaki 'status' wala index
+    use ho aur sirf index keys padhi jaayein (documents fetch nahi hote).
+    """
+    by_status: dict = {}
+    async for row in notification_collection.aggregate([
+        {"$sort": {"status": 1}},
+        {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+    ]):
+        name = row["_id"] or "Pending" # Bahut purane notifications mein status nahi hai
+        by_status[name] = by_status.get(name, 0) + row["count"]
+    return by_status
+
+
+async def fetch_stats(low_stock_threshold: int, top: int) -> dict:
+    """
+    Dashboard ke saare numbers. Har hissa apne index par chalta hai (ek '$facet'
+    mein koi index use nahi hota tha) aur saari queries ek saath (concurrently) chalti hain.
+    Totals collection metadata se aate hain - scan nahi.
+    """
+    (covers, available, categories, notifications, by_status, low_stock, recent) = await asyncio.gather(
+        cover_collection.estimated_document_count(),
+        cover_collection.count_documents({"is_available": True}),
+        category_collection.estimated_document_count(),
+        notification_collection.estimated_document_count(),
+        _status_breakdown(),
+        cover_collection.find(
+            {"stock": {"$lt": low_stock_threshold}}, {"modelName": 1, "color": 1, "stock": 1}
+        ).sort("stock", 1).limit(top).to_list(length=top),
+        notification_collection.find().sort([("createdAt", -1), ("_id", -1)]).limit(top).to_list(length=top),
+    )
+    return {
+        "covers": covers,
+        "available": available,
+        "categories": categories,
+        "notifications": notifications,
+        "byStatus": by_status,
+        "lowStock": low_stock,
+        "recent": recent,
+    }
+
+
+@router.get("/stats", response_model=AdminStats)
+async def get_admin_stats(
+    response: Response,
+    low_stock_threshold: int = Query(10, ge=1, description="Isse kam stock 'low' maana jaayega"),
+    top: int = Query(5, ge=1, le=20, description="Low-stock aur recent lists ka size")
+):
+    """
+    (Admin ke liye) Dashboard ke counts, notification status breakdown,
+    sabse kam stock wale products aur naye notifications.
+    """
+    response.headers["Cache-Control"] = f"private, max-age={STATS_TTL_SECONDS}"
+
+    cache_key = (low_stock_threshold, top)
+    cached = _stats_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        result = await fetch_stats(low_stock_threshold, top)
+        stats = AdminStats(
+            covers=result["covers"],
+            available_covers=result["available"],
+            categories=result["categories"],
+            notifications=result["notifications"],
+            notifications_by_status=result["byStatus"],
+            low_stock=[
+                LowStockItem(
+                    id=str(doc["_id"]),
+                    modelName=doc.get("modelName", ""),
+                    color=doc.get("color", ""),
+                    stock=doc.get("stock", 0)
+                )
+                for doc in result["lowStock"]
+            ],
+            recent_notifications=[notification_helper(doc) for doc in result["recent"]],
+            generated_at=datetime.utcnow()
+        )
+        _stats_cache.set(cache_key, stats)
+        return stats
+
+    except Exception as e:
+        print(f"Error fetching admin stats: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An error occurred: {e}"
+        )
+
+
+@router.get("/cache")
+async def get_cache_stats():
+    """
+    (Admin ke liye) Catalog cache ke hit/miss metrics.
+    """
+    return {
+        "catalog": catalog_cache.stats(),
+        "stats": _stats_cache.stats(),
+    }
+
+
+# --- Demand Analytics ---
+
+@router.get("/demand", response_model=DemandReport)
+async def get_demand_report(
+    response: Response,
+    days: int = Query(30, ge=0, le=3650, description="Pichle kitne din (0 = hamesha se)"),
+    status_filter: Optional[List[NotificationStatus]] = Query(None, alias="status", description="Default: Pending + In Progress"),
+    low_stock_threshold: int = Query(5, ge=1, description="Isse kam stock 'low' maana jaayega"),
+    only_low_stock: bool = Query(False, description="Sirf zero/low inventory wale models"),
+    limit: int = Query(50, ge=1, le=500),
+    source: Literal["summary", "live"] = Query("summary", description="Materialized summary ya seedha notifications")
+):
+    """
+    (Admin ke liye) Sabse zyada maange gaye models: canonical model ke hisaab se
+    notifications ke status-wise counts, current stock ke saath.
+    """
+    response.headers["Cache-Control"] = "private, no-cache"
+    statuses = list(dict.fromkeys(status_filter)) if status_filter else list(OPEN_STATUSES)
+    since = datetime.utcnow() - timedelta(days=days) if days else None
+    args = (since, statuses, low_stock_threshold, only_low_stock, limit)
+
+    try:
+        summary_state, refreshing = {}, False
+        if source == "summary":
+            # Refresh request ke raaste mein nahi: pichli summary turant, refresh background mein
+            refreshing = demand_summary.refresh_in_background(notification_collection)
+            summary_state = await demand_summary.state()
+            cursor = demand_collection.aggregate(build_summary_demand_pipeline(*args))
+        else:
+            cursor = notification_collection.aggregate(build_live_demand_pipeline(*args))
+
+        rows = [
+            DemandRow(
+                canonicalModel=row["_id"],
+                modelName=row.get("modelName") or row["_id"],
+                total=row["total"],
+                by_status={s: row.get(s, 0) for s in STATUSES if row.get(s, 0)},
+                stock=row.get("stock", 0),
+                covers=row.get("covers", 0),
+                low_stock=row.get("low_stock", True)
+            )
+            async for row in cursor
+        ]
+        return DemandReport(
+            days=days or None,
+            statuses=statuses,
+            source=source,
+            rows=rows,
+            generated_at=datetime.utcnow(),
+            summary_refreshed_at=summary_state.get("refreshed_at"),
+            refreshing=refreshing or summary_state.get("needs_full", False)
+        )
+    except Exception as e:
+        print(f"Error building demand report: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An error occurred: {e}"
+        )
+
+
+@router.post("/demand/refresh")
+async def refresh_demand_summary(full: bool = Query(False, description="Poori summary dobara banayein")):
+    """
+    (Admin ke liye) Demand summary ko abhi refresh karta hai.
+    """
+    try:
+        return await demand_summary.refresh(notification_collection, full=full)
+    except Exception as e:
+        print(f"Error refreshing demand summary: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An error occurred: {e}"
+        )
+
+
+# --- Model Aliases ---
+
+async def recompute_canonical_models() -> dict:
+    """
+    Alias table reload karke saare covers aur notifications ka 'canonicalModel'
+    dobara compute karta hai (batched bulk writes).
+    """
+    try:
+        await load_aliases(model_alias_collection)
+        covers = await backfill_search_fields(cover_collection, force=True)
+        # Alias se merge hui open requests (same phone) mein sabse purani rehti hai
+        notifications = await backfill_canonical_models(
+            notification_collection, force=True, on_conflict=merge_open_conflicts
+        )
+    finally:
+        # Backfill beech mein ruke tab bhi jo keys badal chuki hain unka cache saaf ho
+        await bump_catalog_version()
+        # Notifications ki keys badli hain - demand summary poori dobara banegi (background mein)
+        await demand_summary.invalidate()
+        demand_summary.refresh_in_background(notification_collection)
+    return {"covers": covers, "notifications": notifications}
+
+
+# Background recompute tasks ke references - bina reference ke task beech mein
+# garbage-collect ho sakta hai (image_gc / restock_worker ke '_task' jaisa)
+_recompute_tasks: Set[asyncio.Task] = set()
+
+
+def _recompute_done(task: asyncio.Task) -> None:
+    _recompute_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        print(f"[Models] Canonical backfill fail hua: {task.exception()}")
+
+
+def _schedule_recompute() -> None:
+    task = asyncio.create_task(recompute_canonical_models())
+    _recompute_tasks.add(task)
+    task.add_done_callback(_recompute_done)
+
+
+@router.get("/model-aliases", response_model=List[ModelAliasOut])
+async def get_model_aliases():
+    """
+    (Admin ke liye) Model name alias table.
+    """
+    aliases = []
+    async for doc in model_alias_collection.find().sort("_id", 1):
+        aliases.append(ModelAliasOut(alias=doc["_id"], canonical=doc["canonical"], createdAt=doc["createdAt"]))
+    return aliases
+
+
+@router.post("/model-aliases", response_model=ModelAliasOut, status_code=status.HTTP_201_CREATED)
+async def upsert_model_alias(alias_in: ModelAliasIn = Body(...)):
+    """
+    (Admin ke liye) Alias add/update karta hai. Existing documents background mein
+    naye canonical key par shift hote hain.
+    """
+    alias = normalize_model_name(alias_in.alias)
+    # Canonical hamesha rules se bani key hai (aliases ki chain nahi banti)
+    canonical = parse_model_name(alias_in.canonical).key
+    if not alias or not canonical:
+        raise HTTPException(status_code=400, detail="Alias aur canonical model dono zaroori hain.")
+
+    doc = {"_id": alias, "canonical": canonical, "createdAt": datetime.utcnow()}
+    await model_alias_collection.replace_one({"_id": alias}, doc, upsert=True)
+    _schedule_recompute()
+    return ModelAliasOut(alias=alias, canonical=canonical, createdAt=doc["createdAt"])
+
+
+@router.delete("/model-aliases/{alias}")
+async def delete_model_alias(alias: str = Path(..., description="Alias (jaisa list mein dikhta hai)")):
+    """
+    (Admin ke liye) Alias hataata hai.
+    """
+    result = await model_alias_collection.delete_one({"_id": normalize_model_name(alias)})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Alias not found.")
+    _schedule_recompute()
+    return {"message": "Alias deleted successfully."}
+
+
+@router.post("/model-aliases/backfill")
+async def backfill_model_aliases():
+    """
+    (Admin ke liye) Saare documents ka canonical model abhi dobara compute karta hai.
+    """
+    try:
+        return {"updated": await recompute_canonical_models()}
+    except Exception as e:
+        print(f"Error during canonical backfill: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An error occurred: {e}"
+        )
+
+
+# --- Image Garbage Collection ---
+
+@router.get("/images/gc")
+async def get_image_gc_status():
+    """
+    (Admin ke liye) Image GC queue ka haal: baaki tombstones, unke bytes, reclaimed bytes.
+    """
+    try:
+        return await image_gc.pending()
+    except Exception as e:
+        print(f"Error fetching image GC status: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An error occurred: {e}"
+        )
+
+
+@router.post("/images/gc", response_model=ImageGCReport)
+async def run_image_gc(
+    dry_run: bool = Query(True, description="Sirf report; kuch delete nahi hoga"),
+    reconcile: bool = Query(False, description="Storage ka full scan (bina tombstone wale orphans bhi)")
+):
+    """
+    (Admin ke liye) Orphaned images ka GC abhi chalata hai. Default dry run hai.
+    """
+    try:
+        if reconcile:
+            return await image_gc.reconcile(dry_run=dry_run)
+        return await image_gc.collect(dry_run=dry_run)
+    except NotImplementedError:
+        raise HTTPException(status_code=400, detail="Yeh storage backend asset listing support nahi karta.")
+    except Exception as e:
+        print(f"Error running image GC: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An error occurred: {e}"
+        )
+
+
+# --- Streaming Export ---
+
+@router.get("/export/{collection_name}")
+async def export_collection(
+    collection_name: Literal["covers", "notifications"] = Path(..., description="covers ya notifications"),
+    format: Literal["csv", "ndjson"] = Query("csv", description="csv ya ndjson"),
+    date_from: Optional[datetime] = Query(None, description="Is time se (createdAt >=)"),
+    date_to: Optional[datetime] = Query(None, description="Is time tak (createdAt <=)"),
+    # Notifications ke filters
+    status_filter: Optional[List[NotificationStatus]] = Query(None, alias="status", description="Notifications: status(es)"),
+    q: Optional[str] = Query(None, description="Notifications: phone number ya model name"),
+    # Covers ke filters
+    model: Optional[str] = Query(None, description="Model name (dono collections)"),
+    coverType: Optional[List[str]] = Query(None),
+    color: Optional[List[str]] = Query(None),
+    minPrice: Optional[float] = Query(None),
+    maxPrice: Optional[float] = Query(None),
+    gender: Optional[str] = Query(None),
+    category_ids: Optional[List[str]] = Query(None),
+    available_only: bool = Query(False, description="Covers: sirf available")
+):
+    """
+    (Admin ke liye) Covers ya notifications ko CSV / NDJSON mein stream karta hai.
+    Saare filters server par lagte hain; data batches mein cursor se aata hai.
+    """
+    if collection_name == "notifications":
+        query = build_notification_query(status_filter, q, date_from, date_to, model_name=model)
+        coll = notification_collection
+    else:
+        query = build_cover_query(model, coverType, color, minPrice, maxPrice, gender, category_ids,
+                                  admin_mode=not available_only)
+        if date_from or date_to:
+            query["createdAt"] = {}
+            if date_from:
+                query["createdAt"]["$gte"] = date_from
+            if date_to:
+                query["createdAt"]["$lte"] = date_to
+        coll = cover_collection
+
+    cursor = coll.find(query, EXPORT_PROJECTIONS[collection_name]).sort([("createdAt", -1), ("_id", -1)])
+    filename = f"{collection_name}-{datetime.utcnow():%Y%m%d-%H%M}.{format}"
+    return StreamingResponse(
+        stream_export(cursor, EXPORT_COLUMNS[collection_name], format),
+        media_type=EXPORT_FORMATS[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Cache-Control": "no-store",
+        }
+    )
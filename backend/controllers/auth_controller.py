@@ -4,13 +4,15 @@ from fastapi import (
     HTTPException, 
     status, 
     Body,
-    Depends
+    Depends,
+    Request
 )
 # HTTP Basic Auth ke liye (optional, lekin achha hai)
 from fastapi.security import OAuth2PasswordRequestForm
 
 # Data models
 from models.auth_model import AdminLoginSchema, AuthSuccessResponse
+from utils.rate_limiter import enforce_rate_limit, rate_limit_by_ip, client_ip
 
 # Naya router object
 router = APIRouter(
@@ -24,13 +26,22 @@ ADMIN_USERNAME = os.getenv("ADMIN_USERNAME", "admin")
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "password")
 # ------------------------------------------
 
-@router.post("/login", response_model=AuthSuccessResponse)
+@router.post(
+    "/login",
+    response_model=AuthSuccessResponse,
+    dependencies=[Depends(rate_limit_by_ip("login_ip"))]
+)
 async def login_admin(
+    request: Request,
     form_data: AdminLoginSchema = Body(...)
 ):
     """
-    Admin ko login karta hai.
+    Admin ko login karta hai. Password guessing rokne ke liye IP aur (username + IP)
+    dono par rate limit hai. Username ki limit IP ke saath hai, taaki koi doosra
+    'admin' naam se galat logins bhej kar asli admin ko lock out na kar sake.
     """
+    username_key = f"{form_data.username.strip().lower()}|{client_ip(request)}"
+    await enforce_rate_limit("login_user", username_key)
     
     # Check karein ki username aur password match ho rahe hain ya nahi
     if form_data.username != ADMIN_USERNAME or form_data.password != ADMIN_PASSWORD:
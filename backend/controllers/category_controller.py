@@ -3,9 +3,11 @@ from fastapi import (
     HTTPException, 
     status, 
     Body,
-    Path
+    Path,
+    Header,
+    Response
 )
-from typing import List
+from typing import List, Optional
 
 # Database collection
 from config.db import category_collection
@@ -19,6 +21,15 @@ from models.category_model import (
 # Valid ObjectId ke liye
 from models.cover_model import PyObjectId
 from datetime import datetime
+from utils.cache_helper import (
+    catalog_cache,
+    catalog_cache_key,
+    bump_catalog_version,
+    sync_catalog_version,
+    make_etag,
+    etag_matches,
+    PUBLIC_CATALOG_CACHE_CONTROL
+)
 
 # Naya router object
 router = APIRouter(
@@ -56,12 +67,10 @@ async def create_category(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Category banane mein fail hua."
             )
-        
-        created_doc = await category_collection.find_one({"_id": result.inserted_id})
-        if created_doc is None:
-            raise HTTPException(status_code=404, detail="Category banayi nahi ja saki.")
-            
-        return category_helper(created_doc)
+        await bump_catalog_version()
+
+        # Response usi document se banta hai jo abhi insert kiya (dobara read nahi)
+        return category_helper(insert_data)
         
     except HTTPException as e:
         raise e
@@ -74,14 +83,32 @@ async def create_category(
 
 
 @router.get("/", response_model=List[CategoryOut])
-async def get_all_categories():
+async def get_all_categories(
+    response: Response,
+    if_none_match: Optional[str] = Header(None)
+):
     """
     (Admin ke liye) Sabhi banayi gayi categories ki list fetch karta hai.
     """
+    await sync_catalog_version()
+    cache_key = catalog_cache_key("categories")
+
+    # Conditional request: catalog nahi badla to 304 (DB tak nahi jaate)
+    etag = make_etag(cache_key)
+    cache_headers = {"ETag": etag, "Cache-Control": PUBLIC_CATALOG_CACHE_CONTROL}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+    response.headers.update(cache_headers)
+
+    cached = catalog_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         categories = []
         async for doc in category_collection.find():
             categories.append(category_helper(doc))
+        catalog_cache.set(cache_key, categories)
         return categories
     except Exception as e:
         print(f"Error fetching categories: {e}")
@@ -105,6 +132,7 @@ async def delete_category(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Category ID '{id}' ke saath nahi mili."
             )
+        await bump_catalog_version()
         
         # HTTP 204 (No Content) return karega, jo success maana jaata hai
         return
@@ -7,25 +7,77 @@ from fastapi import (
     UploadFile, 
     File,
     Body,
-    Path
+    Path,
+    Header,
+    Response
 )
 from typing import List, Optional
 from datetime import datetime
 import json
-from pydantic import BaseModel
+import asyncio
+from pydantic import BaseModel, ValidationError
+from pymongo import ReturnDocument, UpdateOne, UpdateMany
+from pymongo.errors import BulkWriteError
 
 # --- NAYA IMPORT ---
 from bson import ObjectId # ID ko manually convert karne ke liye
 # --- NAYA IMPORT ---
 
 # --- "BEHTREEN" (AWESOME) IMPORT ---
-from utils.upload_helper import upload_to_cloudinary
+from utils.upload_helper import upload_cover_image
+from utils.image_store import release_image, release_cover_image
 # --- "BEHTREEN" (AWESOME) IMPORT ---
+from utils.search_helper import (
+    search_fields,
+    build_model_match,
+    build_rank_expression,
+    normalize_model_name
+)
+from utils.cache_helper import (
+    catalog_cache,
+    catalog_cache_key,
+    bump_catalog_version,
+    sync_catalog_version,
+    make_etag,
+    etag_matches,
+    PUBLIC_CATALOG_CACHE_CONTROL,
+    ADMIN_CATALOG_CACHE_CONTROL
+)
+from utils.suggest_index import suggest_index
+from utils.restock_worker import restock_worker, stock_raised
+from utils.catalog_import import import_catalog, CatalogImportError, IMPORT_CHUNK_SIZE
+from utils.pagination_helper import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    clamp_limit,
+    encode_cursor,
+    decode_cursor,
+    keyset_after,
+    ranked_keyset_after
+)
 
 # Database collection
 from config.db import collection
 # Data models and helper
-from models.cover_model import CoverOut, cover_helper, CoverInDB
+from models.cover_model import (
+    CoverOut,
+    CoverPage,
+    cover_helper,
+    cover_page_json,
+    COVER_PROJECTION,
+    CoverFacets,
+    facets_json,
+    ModelSuggestion,
+    ModelSuggestResponse,
+    PRICE_BUCKET_BOUNDARIES,
+    CoverInDB,
+    BulkVariantResult,
+    BulkCoverResponse,
+    CatalogImportReport,
+    CoverBulkPatch,
+    CoverBulkItemError,
+    CoverBulkPatchResult
+)
 
 
 # --- Update ke liye Pydantic Model (Updated) ---
@@ -52,45 +104,180 @@ router = APIRouter(
 # --- YEH ZAROORI HAI ---
 
 
-@router.get("/", response_model=List[CoverOut])
-async def get_covers(
-    model: Optional[str] = Query(None, description="Mobile model name (e.g., iPhone 13)"),
-    coverType: Optional[List[str]] = Query(None, description="List of cover types"),
-    color: Optional[List[str]] = Query(None, description="List of colors"),
-    minPrice: Optional[float] = Query(None, description="Minimum price"),
-    maxPrice: Optional[float] = Query(None, description="Maximum price"),
-    gender: Optional[str] = Query(None, description="Gender preference (Ladies, Gents, Unisex)"),
-    category_ids: Optional[List[str]] = Query(None, description="Filter by category IDs"),
-    admin_mode: bool = Query(False, description="Admin mode to see unavailable products")
-):
-    query: dict = {}
-
-    if model:
-        query["modelName"] = {"$regex": model, "$options": "i"}
+def build_dimension_filters(
+    coverType: Optional[List[str]] = None,
+    color: Optional[List[str]] = None,
+    minPrice: Optional[float] = None,
+    maxPrice: Optional[float] = None,
+    gender: Optional[str] = None,
+    category_ids: Optional[List[str]] = None
+) -> dict:
+    """Sidebar wale filters (har dimension ki apni condition), field name ke saath."""
+    filters: dict = {}
     if coverType:
-        query["coverType"] = {"$in": coverType}
+        filters["coverType"] = {"$in": coverType}
     if color:
-        query["color"] = {"$in": color}
+        filters["color"] = {"$in": color}
     
     price_query = {}
     if minPrice is not None: price_query["$gte"] = minPrice
     if maxPrice is not None: price_query["$lte"] = maxPrice
-    if price_query: query["price"] = price_query
+    if price_query: filters["price"] = price_query
         
     if gender and gender.strip():
-        query["genderPreference"] = gender
+        filters["genderPreference"] = gender
         
     if category_ids:
-        query["category_ids"] = {"$in": category_ids}
-        
+        filters["category_ids"] = {"$in": category_ids}
+    return filters
+
+
+def build_base_query(model: Optional[str] = None, admin_mode: bool = False) -> dict:
+    """Search text aur availability - yeh har facet par lagte hain."""
+    query: dict = {}
+    # Model search ab indexed 'searchTokens' par hota hai (regex nahi)
+    if model:
+        query.update(build_model_match(model))
     if not admin_mode:
         query["is_available"] = True
+    return query
+
+
+def build_cover_query(
+    model: Optional[str] = None,
+    coverType: Optional[List[str]] = None,
+    color: Optional[List[str]] = None,
+    minPrice: Optional[float] = None,
+    maxPrice: Optional[float] = None,
+    gender: Optional[str] = None,
+    category_ids: Optional[List[str]] = None,
+    admin_mode: bool = False
+) -> dict:
+    """Shopper/admin filters se MongoDB query banata hai."""
+    query = build_base_query(model, admin_mode)
+    query.update(build_dimension_filters(coverType, color, minPrice, maxPrice, gender, category_ids))
+    return query
+
+
+def build_facets_pipeline(base_query: dict, dimension_filters: dict) -> list:
+    """
+    Ek hi aggregation pass mein har dimension ke counts aur price histogram.
+    Har facet mein us dimension ka apna filter nahi lagta (baaki sab lagte hain),
+    taaki sidebar dikha sake ki doosra option chunne par kitne products milenge.
+    """
+    def others(field: str) -> list:
+        rest = {k: v for k, v in dimension_filters.items() if k != field}
+        return [{"$match": rest}] if rest else []
+
+    def counts(field: str, unwind: bool = False) -> list:
+        stages = others(field)
+        if unwind:
+            stages.append({"$unwind": f"${field}"})
+        stages += [
+            {"$group": {"_id": f"${field}", "count": {"$sum": 1}}},
+            {"$sort": {"count": -1, "_id": 1}},
+        ]
+        return stages
+
+    return [
+        {"$match": base_query},
+        {"$facet": {
+            "total": ([{"$match": dimension_filters}] if dimension_filters else []) + [{"$count": "n"}],
+            "coverType": counts("coverType"),
+            "color": counts("color"),
+            "gender": counts("genderPreference"),
+            "category": counts("category_ids", unwind=True),
+            "price": others("price") + [{"$bucket": {
+                "groupBy": "$price",
+                "boundaries": PRICE_BUCKET_BOUNDARIES,
+                "default": "other",
+                "output": {"count": {"$sum": 1}},
+            }}],
+        }},
+    ]
+
+
+@router.get("/", response_model=CoverPage)
+async def get_covers(
+    model: Optional[str] = Query(None, description="Mobile model name (e.g., iPhone 13)"),
+    coverType: Optional[List[str]] = Query(None, description="List of cover types"),
+    color: Optional[List[str]] = Query(None, description="List of colors"),
+    minPrice: Optional[float] = Query(None, description="Minimum price"),
+    maxPrice: Optional[float] = Query(None, description="Maximum price"),
+    gender: Optional[str] = Query(None, description="Gender preference (Ladies, Gents, Unisex)"),
+    category_ids: Optional[List[str]] = Query(None, description="Filter by category IDs"),
+    admin_mode: bool = Query(False, description="Admin mode to see unavailable products"),
+    cursor: Optional[str] = Query(None, description="Pichle response ka 'next_cursor'"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, description=f"Page size (max {MAX_PAGE_SIZE})"),
+    if_none_match: Optional[str] = Header(None)
+):
+    query = build_cover_query(
+        model, coverType, color, minPrice, maxPrice, gender, category_ids, admin_mode
+    )
+    is_search = bool(model and normalize_model_name(model))
+    page_size = clamp_limit(limit)
+    after = decode_cursor(cursor) if cursor else None
+
+    # Same (normalized) filters + same catalog version = cached page
+    await sync_catalog_version()
+    cache_key = catalog_cache_key(
+        "covers",
+        model=normalize_model_name(model) if model else None,
+        coverType=coverType, color=color, minPrice=minPrice, maxPrice=maxPrice,
+        gender=gender, category_ids=category_ids, admin_mode=admin_mode,
+        cursor=cursor, limit=page_size
+    )
+
+    # Conditional request: client ke paas yahi version hai to body/DB dono skip
+    etag = make_etag(cache_key)
+    cache_headers = {
+        "ETag": etag,
+        "Cache-Control": ADMIN_CATALOG_CACHE_CONTROL if admin_mode else PUBLIC_CATALOG_CACHE_CONTROL,
+    }
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    # Cache mein page pehle se serialized JSON bytes ki tarah rakha hai
+    cached_body = catalog_cache.get(cache_key)
+    if cached_body is not None:
+        return Response(content=cached_body, media_type="application/json", headers=cache_headers)
 
     try:
-        covers = []
-        async for cover_data in collection.find(query).sort("createdAt", -1):
-            covers.append(cover_helper(cover_data))
-        return covers
+        if is_search:
+            # Relevance ke hisaab se: exact model, phir prefix, phir fuzzy
+            pipeline = [
+                {"$match": query},
+                {"$project": {**COVER_PROJECTION, "modelKey": 1}},
+                {"$addFields": {"_rank": build_rank_expression(model)}},
+            ]
+            if after:
+                pipeline.append({"$match": ranked_keyset_after(after.get("r", 0), after.get("c"), after["i"])})
+            pipeline += [
+                {"$sort": {"_rank": 1, "createdAt": -1, "_id": -1}},
+                {"$limit": page_size + 1},
+            ]
+            db_cursor = collection.aggregate(pipeline)
+        else:
+            if after:
+                query = {"$and": [query, keyset_after(after.get("c"), after["i"])]}
+            db_cursor = collection.find(query, COVER_PROJECTION).sort(
+                [("createdAt", -1), ("_id", -1)]
+            ).limit(page_size + 1)
+
+        # Ek extra document mangwaya hai taaki pata chale ki agla page hai ya nahi
+        docs = await db_cursor.to_list(length=page_size + 1)
+        next_cursor = None
+        if len(docs) > page_size:
+            docs = docs[:page_size]
+            last = docs[-1]
+            key = {"c": last.get("createdAt"), "i": last["_id"]}
+            if is_search:
+                key["r"] = last.get("_rank", 0)
+            next_cursor = encode_cursor(key)
+
+        body = cover_page_json(docs, next_cursor)
+        catalog_cache.set(cache_key, body)
+        return Response(content=body, media_type="application/json", headers=cache_headers)
     
     except Exception as e:
         print(f"Error fetching covers: {e}")
@@ -100,6 +287,124 @@ async def get_covers(
         )
 
 
+@router.get("/facets", response_model=CoverFacets)
+async def get_cover_facets(
+    model: Optional[str] = Query(None, description="Mobile model name (e.g., iPhone 13)"),
+    coverType: Optional[List[str]] = Query(None, description="List of cover types"),
+    color: Optional[List[str]] = Query(None, description="List of colors"),
+    minPrice: Optional[float] = Query(None, description="Minimum price"),
+    maxPrice: Optional[float] = Query(None, description="Maximum price"),
+    gender: Optional[str] = Query(None, description="Gender preference (Ladies, Gents, Unisex)"),
+    category_ids: Optional[List[str]] = Query(None, description="Filter by category IDs"),
+    admin_mode: bool = Query(False, description="Admin mode to see unavailable products"),
+    if_none_match: Optional[str] = Header(None)
+):
+    """
+    Current filters ke liye har filter option ke product counts aur price buckets.
+    """
+    await sync_catalog_version()
+    cache_key = catalog_cache_key(
+        "facets",
+        model=normalize_model_name(model) if model else None,
+        coverType=coverType, color=color, minPrice=minPrice, maxPrice=maxPrice,
+        gender=gender, category_ids=category_ids, admin_mode=admin_mode
+    )
+    etag = make_etag(cache_key)
+    cache_headers = {
+        "ETag": etag,
+        "Cache-Control": ADMIN_CATALOG_CACHE_CONTROL if admin_mode else PUBLIC_CATALOG_CACHE_CONTROL,
+    }
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    cached_body = catalog_cache.get(cache_key)
+    if cached_body is not None:
+        return Response(content=cached_body, media_type="application/json", headers=cache_headers)
+
+    try:
+        pipeline = build_facets_pipeline(
+            build_base_query(model, admin_mode),
+            build_dimension_filters(coverType, color, minPrice, maxPrice, gender, category_ids)
+        )
+        results = await collection.aggregate(pipeline).to_list(length=1)
+        body = facets_json(results[0] if results else {})
+        catalog_cache.set(cache_key, body)
+        return Response(content=body, media_type="application/json", headers=cache_headers)
+
+    except Exception as e:
+        print(f"Error fetching facets: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An error occurred while fetching facets: {e}"
+        )
+
+
+@router.get("/suggest", response_model=ModelSuggestResponse)
+async def suggest_models(
+    response: Response,
+    q: str = Query(..., min_length=1, description="Model name ka shuruati hissa"),
+    limit: int = Query(8, ge=1, le=20, description="Kitne suggestions chahiye")
+):
+    """
+    Typeahead: 'q' se shuru hone wale available models aur unke product counts.
+    In-memory prefix index se aata hai (database query nahi).
+    """
+    suggest_index.refresh_if_stale(collection)
+    response.headers["Cache-Control"] = PUBLIC_CATALOG_CACHE_CONTROL
+    return ModelSuggestResponse(
+        query=q,
+        suggestions=[
+            ModelSuggestion(modelName=name, count=count)
+            for name, count in suggest_index.suggest(q, limit)
+        ]
+    )
+
+
+def build_cover_document(
+    modelName: str,
+    coverType: str,
+    color: str,
+    price: float,
+    stock: int,
+    image: dict,
+    genderPreference: str,
+    tags: List[str],
+    category_ids: List[str],
+    is_available: bool
+) -> dict:
+    """
+    Validate karke ek database-ready cover document (dict) banata hai.
+    'image' upload_cover_image() ka result hai (imageUrl, imageKey, images, imageHash).
+    Galat data par Pydantic ValidationError raise hota hai.
+    """
+    now = datetime.utcnow()
+    db_cover = CoverInDB(
+        modelName=modelName,
+        coverType=coverType,
+        color=color,
+        price=price,
+        stock=stock,
+        imageUrl=image["imageUrl"], # Pydantic model HttpUrl mein convert karega
+        genderPreference=genderPreference,
+        tags=tags,
+        category_ids=category_ids,
+        is_available=is_available,
+        createdAt=now,
+        updatedAt=now
+    )
+
+    # Hum 'imageUrl' ko string mein convert karke save karenge (HttpUrl error fix)
+    insert_data = db_cover.model_dump(by_alias=True)
+    insert_data["imageUrl"] = str(db_cover.imageUrl)
+    # Storage key (delete ke liye) aur responsive derivatives
+    insert_data["imageKey"] = image.get("imageKey")
+    insert_data["images"] = image.get("images")
+    # Image registry ka reference (delete par release hota hai)
+    insert_data["imageHash"] = image.get("imageHash")
+    insert_data.update(search_fields(modelName))
+    return insert_data
+
+
 @router.post("/", response_model=CoverOut, status_code=status.HTTP_201_CREATED)
 async def add_cover(
     modelName: str = Form(...),
@@ -113,8 +418,9 @@ async def add_cover(
     is_available: bool = Form(True), # Default value True hai
     image: UploadFile = File(...)
 ):
+    uploaded_image = None
     try:
-        image_url = await upload_to_cloudinary(image)
+        uploaded_image = await upload_cover_image(image)
         
         try:
             tags_list = json.loads(tags) if tags else []
@@ -124,25 +430,19 @@ async def add_cover(
         except (json.JSONDecodeError, ValueError) as e:
             raise HTTPException(status_code=400, detail=f"Invalid format for tags or category_ids: {e}")
 
-        db_cover = CoverInDB(
+        insert_data = build_cover_document(
             modelName=modelName,
             coverType=coverType,
             color=color,
             price=price,
             stock=stock,
-            imageUrl=image_url, # Pydantic model HttpUrl mein convert karega
+            image=uploaded_image,
             genderPreference=genderPreference,
             tags=tags_list,
             category_ids=category_ids_list,
-            is_available=is_available,
-            createdAt=datetime.utcnow(),
-            updatedAt=datetime.utcnow()
+            is_available=is_available
         )
 
-        # Hum 'imageUrl' ko string mein convert karke save karenge (HttpUrl error fix)
-        insert_data = db_cover.model_dump(by_alias=True)
-        insert_data["imageUrl"] = str(db_cover.imageUrl)
-
         result = await collection.insert_one(insert_data)
         
         if not result.inserted_id:
@@ -150,17 +450,349 @@ async def add_cover(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to insert new cover into database."
             )
-        
-        created_cover = await collection.find_one({"_id": result.inserted_id})
-        if created_cover is None:
-             raise HTTPException(status_code=404, detail="Newly created cover not found.")
+        await bump_catalog_version()
+        suggest_index.apply_change(None, insert_data)
+        # Pending "Order Now" requests background mein notify honge
+        if stock_raised(None, insert_data):
+            await restock_worker.enqueue(insert_data["canonicalModel"])
 
-        return cover_helper(created_cover)
+        # Response usi document se banta hai jo abhi insert kiya (dobara read nahi)
+        return cover_helper(insert_data)
 
     except HTTPException as e:
+        # Cover nahi bana to image ka reference wapas
+        if uploaded_image:
+            await release_image(uploaded_image.get("imageHash"))
         raise e
     except Exception as e:
         print(f"Error adding cover: {e}")
+        if uploaded_image:
+            await release_image(uploaded_image.get("imageHash"))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An error occurred: {e}"
+        )
+
+
+@router.post("/bulk", response_model=BulkCoverResponse)
+async def add_covers_bulk(
+    modelName: str = Form(...),
+    coverType: str = Form(...),
+    price: float = Form(...),
+    category_ids: str = Form(..., description="JSON list of category IDs"),
+    variants: str = Form(..., description='JSON list, images ke order mein: [{"color": "Black", "stock": 10}, ...]'),
+    genderPreference: str = Form("Unisex"),
+    tags: Optional[str] = Form("[]"),
+    is_available: bool = Form(True),
+    images: List[UploadFile] = File(..., description="Har variant ki ek image")
+):
+    """
+    (Admin ke liye) Ek model ke kai color variants ek hi request mein banata hai.
+    Images ek saath (concurrently) upload hoti hain aur saare documents ek 'insert_many' se likhe jaate hain.
+    Har variant ka success/failure alag se report hota hai.
+    """
+    try:
+        tags_list = json.loads(tags) if tags else []
+        category_ids_list = json.loads(category_ids)
+        variants_list = json.loads(variants)
+        if not isinstance(category_ids_list, list) or not isinstance(variants_list, list):
+            raise ValueError("category_ids aur variants list honi chahiye.")
+    except (json.JSONDecodeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid format for tags, category_ids or variants: {e}")
+
+    if len(variants_list) != len(images):
+        raise HTTPException(
+            status_code=400,
+            detail=f"{len(variants_list)} variants ke liye {len(images)} images mili. Dono barabar hone chahiye."
+        )
+
+    # 1. Saari images ek saath upload karein (worker pool concurrency limit ke andar)
+    uploads = await asyncio.gather(
+        *(upload_cover_image(image) for image in images),
+        return_exceptions=True
+    )
+
+    # 2. Har variant ka document banayein; fail hone wale variants ka error note karein
+    results: List[BulkVariantResult] = []
+    docs_to_insert = []
+    doc_result_index = []
+    for index, (variant, uploaded) in enumerate(zip(variants_list, uploads)):
+        variant = variant if isinstance(variant, dict) else {}
+        color = str(variant.get("color", ""))
+        result = BulkVariantResult(index=index, color=color, success=False)
+        results.append(result)
+
+        if isinstance(uploaded, BaseException):
+            result.error = getattr(uploaded, "detail", None) or str(uploaded)
+            continue
+        try:
+            doc = build_cover_document(
+                modelName=modelName,
+                coverType=coverType,
+                color=color,
+                price=variant.get("price", price),
+                stock=variant.get("stock", 0),
+                image=uploaded,
+                genderPreference=genderPreference,
+                tags=tags_list,
+                category_ids=category_ids_list,
+                is_available=is_available
+            )
+        except ValidationError as e:
+            result.error = f"Invalid variant data: {e.errors()[0].get('msg')}"
+            await release_image(uploaded.get("imageHash"))
+            continue
+        docs_to_insert.append(doc)
+        doc_result_index.append(index)
+
+    # 3. Saare valid documents ek hi round-trip mein insert karein
+    failed_docs = {}
+    if docs_to_insert:
+        try:
+            await collection.insert_many(docs_to_insert, ordered=False)
+        except BulkWriteError as e:
+            for write_error in e.details.get("writeErrors", []):
+                failed_docs[write_error["index"]] = write_error.get("errmsg", "Insert failed")
+        except Exception as e:
+            print(f"Error in bulk insert: {e}")
+            failed_docs = {i: str(e) for i in range(len(docs_to_insert))}
+
+    for doc_index, (doc, result_index) in enumerate(zip(docs_to_insert, doc_result_index)):
+        result = results[result_index]
+        if doc_index in failed_docs:
+            result.error = failed_docs[doc_index]
+            await release_image(doc.get("imageHash"))
+        else:
+            result.success = True
+            result.cover = cover_helper(doc)
+            suggest_index.apply_change(None, doc)
+            if stock_raised(None, doc):
+                await restock_worker.enqueue(doc["canonicalModel"])
+
+    created = sum(1 for r in results if r.success)
+    if created:
+        await bump_catalog_version()
+    return BulkCoverResponse(created=created, failed=len(results) - created, results=results)
+
+
+# --- Bulk Update (PATCH /api/covers/bulk) ---
+
+# '$inc' sirf in numeric fields par
+BULK_INC_FIELDS = {"price": float, "stock": int}
+# Restock check aur suggest index ke liye purane document ke fields
+BULK_BEFORE_PROJECTION = {"canonicalModel": 1, "modelName": 1, "stock": 1, "is_available": 1}
+
+
+def _validation_message(e: Exception) -> str:
+    if isinstance(e, ValidationError):
+        first = e.errors()[0]
+        location = ".".join(str(part) for part in first.get("loc", ()))
+        return f"{location}: {first.get('msg')}" if location else first.get("msg", str(e))
+    return str(e)
+
+
+def validate_cover_fields(fields: dict) -> dict:
+    """
+    Bulk '$set' / item fields ko CoverUpdate se validate karta hai aur database-ready
+    '$set' dict banata hai. Galat data par ValueError (ValidationError bhi ValueError hai).
+    """
+    unknown = set(fields) - set(CoverUpdate.model_fields)
+    if unknown:
+        raise ValueError(f"Yeh fields update nahi ho sakte: {', '.join(sorted(unknown))}")
+    update = CoverUpdate(**fields).model_dump(exclude_unset=True)
+    if not update:
+        raise ValueError("Update karne ke liye koi data nahi diya gaya.")
+    empty = [name for name, value in update.items() if value is None]
+    if empty:
+        raise ValueError(f"Yeh fields khaali nahi ho sakte: {', '.join(sorted(empty))}")
+    # CoverUpdate mein limits nahi hain - CoverBase wale checks yahin
+    if "price" in update and update["price"] <= 0:
+        raise ValueError("price: 0 se zyada hona chahiye.")
+    if "stock" in update and update["stock"] < 0:
+        raise ValueError("stock: negative nahi ho sakta.")
+    if update.get("modelName"):
+        update.update(search_fields(update["modelName"]))
+    return update
+
+
+def validate_inc_fields(inc: dict) -> dict:
+    unknown = set(inc) - set(BULK_INC_FIELDS)
+    if unknown or not inc:
+        raise ValueError(f"'$inc' sirf {', '.join(BULK_INC_FIELDS)} par ho sakta hai.")
+    update = {}
+    for name, value in inc.items():
+        if BULK_INC_FIELDS[name] is int and value != int(value):
+            raise ValueError(f"{name}: poora number hona chahiye.")
+        update[name] = BULK_INC_FIELDS[name](value)
+    return update
+
+
+def _raises_stock(update: dict) -> bool:
+    """Kya yeh operation kisi cover ko kharidne layak bana sakta hai?"""
+    set_fields, inc_fields = update.get("$set", {}), update.get("$inc", {})
+    return (set_fields.get("stock", 0) > 0 or set_fields.get("is_available") is True
+            or inc_fields.get("stock", 0) > 0)
+
+
+@router.patch("/bulk", response_model=CoverBulkPatchResult)
+async def bulk_update_covers(patch: CoverBulkPatch = Body(...)):
+    """
+    (Admin ke liye) Bahut saare covers ek saath update karta hai - seasonal price change,
+    stock count, availability. 'items' ({id, fields}) ya 'filter' + ek operation
+    ('$set', '$inc', 'price_percent'). Sab ek unordered bulk_write mein; catalog cache
+    poore batch ke liye ek hi baar invalidate hota hai.
+    """
+    operations = [op for op in (patch.set, patch.inc, patch.price_percent) if op is not None]
+    if bool(patch.items) == bool(patch.filter):
+        raise HTTPException(status_code=400, detail="'items' ya 'filter' mein se koi ek dijiye.")
+    if patch.filter and len(operations) != 1:
+        raise HTTPException(status_code=400, detail="Filter ke saath '$set', '$inc' ya 'price_percent' mein se ek dijiye.")
+    if patch.items and operations:
+        raise HTTPException(status_code=400, detail="'items' ke saath har item ke 'fields' dijiye, alag operation nahi.")
+
+    now = datetime.utcnow()
+    errors: List[CoverBulkItemError] = []
+    ops = []
+    op_items = [] # items mode: har op ka (index, id, $set)
+    before_docs: dict = {}
+    restock_models: set = set()
+    names_changed = False
+
+    if patch.items:
+        ids = [item.id for item in patch.items]
+        async for doc in collection.find({"_id": {"$in": ids}}, BULK_BEFORE_PROJECTION):
+            before_docs[doc["_id"]] = doc
+        seen = set()
+        for index, item in enumerate(patch.items):
+            if item.id in seen:
+                errors.append(CoverBulkItemError(index=index, id=item.id, error="Yeh ID is batch mein pehle aa chuka hai."))
+                continue
+            seen.add(item.id)
+            if item.id not in before_docs:
+                errors.append(CoverBulkItemError(index=index, id=item.id, error="Product not found."))
+                continue
+            try:
+                update = validate_cover_fields(item.fields)
+            except ValueError as e:
+                errors.append(CoverBulkItemError(index=index, id=item.id, error=_validation_message(e)))
+                continue
+            update["updatedAt"] = now
+            ops.append(UpdateOne({"_id": item.id}, {"$set": update}))
+            op_items.append((index, item.id, update))
+    else:
+        f = patch.filter
+        query = build_cover_query(f.model, f.coverType, f.color, f.minPrice, f.maxPrice,
+                                  f.gender, f.category_ids, admin_mode=True)
+        if f.is_available is not None:
+            query["is_available"] = f.is_available
+        if f.ids:
+            query["_id"] = {"$in": f.ids}
+        if not query and not f.all:
+            # Khaali filter poora catalog badal dega - galti se na ho
+            raise HTTPException(status_code=400, detail="Filter mein kam se kam ek condition dijiye (ya 'all': true).")
+        try:
+            if patch.set is not None:
+                update = {"$set": {**validate_cover_fields(patch.set), "updatedAt": now}}
+            elif patch.inc is not None:
+                inc = validate_inc_fields(patch.inc)
+                update = {"$inc": inc, "$set": {"updatedAt": now}}
+                # Ghatane se stock negative / price 0 na ho - aise covers skip
+                if inc.get("stock", 0) < 0:
+                    query = {"$and": [query, {"stock": {"$gte": -inc["stock"]}}]}
+                if inc.get("price", 0) < 0:
+                    query = {"$and": [query, {"price": {"$gt": -inc["price"]}}]}
+            else:
+                factor = 1 + patch.price_percent / 100
+                query = {"$and": [query, {"price": {"$type": "number"}}]}
+                update = [{"$set": {
+                    "price": {"$round": [{"$multiply": ["$price", factor]}, 2]},
+                    "updatedAt": now,
+                }}]
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=_validation_message(e))
+        ops.append(UpdateMany(query, update))
+        if isinstance(update, dict) and _raises_stock(update):
+            # Update ke baad query match na kare (jaise is_available badla) - models pehle nikaal lo
+            restock_models.update(await collection.distinct("canonicalModel", query))
+        names_changed = isinstance(update, dict) and bool(
+            {"modelName", "is_available"} & set(update.get("$set", {}))
+        )
+
+    matched = modified = 0
+    failed_ops: set = set()
+    if ops:
+        try:
+            try:
+                result = await collection.bulk_write(ops, ordered=False)
+                matched, modified = result.matched_count, result.modified_count
+            except BulkWriteError as e:
+                matched, modified = e.details.get("nMatched", 0), e.details.get("nModified", 0)
+                for write_error in e.details.get("writeErrors", []):
+                    op_index = write_error["index"]
+                    failed_ops.add(op_index)
+                    message = write_error.get("errmsg", "Update failed")
+                    if op_items:
+                        index, cover_id, _ = op_items[op_index]
+                        errors.append(CoverBulkItemError(index=index, id=cover_id, error=message))
+                    else:
+                        errors.append(CoverBulkItemError(error=message))
+        except Exception as e:
+            print(f"Error in bulk cover update: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"An error occurred: {e}"
+            )
+
+    # Items mode: restock / suggest index purane aur naye document se
+    for op_index, (_, cover_id, update) in enumerate(op_items):
+        if op_index in failed_ops:
+            continue
+        before = before_docs[cover_id]
+        after = {**before, **update}
+        if stock_raised(before, after):
+            restock_models.add(after.get("canonicalModel"))
+        if "modelName" in update or "is_available" in update:
+            names_changed = True
+
+    # Cache, suggest index aur restock - poore batch ke liye ek baar
+    if modified:
+        await bump_catalog_version()
+        if names_changed:
+            await suggest_index.rebuild(collection)
+        restock_models.discard(None)
+        if restock_models:
+            async for doc in collection.aggregate([
+                {"$match": {"canonicalModel": {"$in": list(restock_models)}, "is_available": True, "stock": {"$gt": 0}}},
+                {"$group": {"_id": "$canonicalModel"}},
+            ]):
+                await restock_worker.enqueue(doc["_id"])
+
+    return CoverBulkPatchResult(matched=matched, modified=modified, failed=len(errors), errors=errors)
+
+
+@router.post("/import", response_model=CatalogImportReport)
+async def import_covers(
+    file: UploadFile = File(..., description="CSV ya XLSX (ek row = ek cover)"),
+    images: Optional[UploadFile] = File(None, description="Image files wali zip (rows mein file ka naam)"),
+    chunk_size: int = Query(IMPORT_CHUNK_SIZE, ge=1, le=5000, description="Ek bulk_write mein kitni rows")
+):
+    """
+    (Admin ke liye) Supplier ki poori range ek file se import karta hai.
+    Rows (canonical model, coverType, color) par upsert hoti hain; har fail row ka
+    error report mein aata hai. Columns ke liye utils/catalog_import.py dekhein.
+    """
+    try:
+        return await import_catalog(
+            collection,
+            file.file,
+            file.filename,
+            images_file=images.file if images else None,
+            chunk_size=chunk_size
+        )
+    except CatalogImportError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        print(f"Error importing covers: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An error occurred: {e}"
@@ -180,18 +812,25 @@ async def update_cover(
             raise HTTPException(status_code=400, detail="Update karne ke liye koi data nahi diya gaya.")
 
     update_dict["updatedAt"] = datetime.utcnow()
+    if update_dict.get("modelName"):
+        update_dict.update(search_fields(update_dict["modelName"]))
     
-    update_result = await collection.update_one(
+    # Update ek hi round-trip mein; purana document milta hai (suggest index ke liye)
+    # aur naya document usi par '$set' lagakar banta hai
+    previous_doc = await collection.find_one_and_update(
         {"_id": id},
-        {"$set": update_dict}
+        {"$set": update_dict},
+        return_document=ReturnDocument.BEFORE
     )
     
-    if update_result.matched_count == 0:
+    if previous_doc is None:
         raise HTTPException(status_code=404, detail="Product not found.")
-
-    updated_doc = await collection.find_one({"_id": id})
-    if updated_doc is None:
-        raise HTTPException(status_code=404, detail="Updated cover not found after update.")
+    updated_doc = {**previous_doc, **update_dict}
+    await bump_catalog_version()
+    if "modelName" in update_dict or "is_available" in update_dict:
+        suggest_index.apply_change(previous_doc, updated_doc)
+    if stock_raised(previous_doc, updated_doc):
+        await restock_worker.enqueue(updated_doc.get("canonicalModel"))
         
     return cover_helper(updated_doc)
 
@@ -214,12 +853,23 @@ async def delete_cover(
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid Product ID format.")
         
-    delete_result = await collection.delete_one({"_id": id}) # obj_id ka istemal karein
+    # Delete karke purana document bhi milta hai (suggest index ke liye)
+    deleted_doc = await collection.find_one_and_delete(
+        {"_id": id}, # obj_id ka istemal karein
+        projection={"modelName": 1, "is_available": 1, "imageHash": 1, "imageKey": 1, "images.variants": 1}
+    )
     
-    if delete_result.deleted_count == 0:
+    if deleted_doc is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Cover ID '{id}' ke saath nahi mila."
         )
+    await bump_catalog_version()
+    suggest_index.apply_change(deleted_doc, None)
+    # Image ka reference chhodein; aakhri cover tha to GC storage se bhi hataega
+    try:
+        await release_cover_image(deleted_doc)
+    except Exception as e:
+        print(f"Image release error (cover {id}): {e}")
     return
 
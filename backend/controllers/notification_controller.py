@@ -3,10 +3,17 @@ from fastapi import (
     HTTPException, 
     status, 
     Body,
-    Path
+    Path,
+    Query,
+    Header,
+    Response,
+    Depends
 )
-from typing import List
+from typing import List, Optional, Tuple
 from datetime import datetime
+import asyncio
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 # --- YEH IMPORT HATA DIYA GAYA HAI ---
 # from bson import ObjectId # Hum ab iski zaroorat nahi hai
@@ -18,9 +25,31 @@ from config.db import notification_collection
 from models.notification_model import (
     NotificationRequest, 
     NotificationOut, 
+    NotificationPage,
+    NotificationStatus,
+    OPEN_STATUSES,
+    is_open_status,
     notification_helper,
     NotificationInDB,
-    NotificationStatusUpdate
+    NotificationStatusUpdate,
+    NotificationBulkUpdate,
+    NotificationBulkResult
+)
+from utils.model_normalizer import canonical_model_key
+from utils.search_helper import (
+    build_search_tokens,
+    build_phone_tokens,
+    build_model_match,
+    phone_query_digits,
+    BACKFILL_BATCH_SIZE
+)
+from utils.rate_limiter import enforce_rate_limit, rate_limit_by_ip
+from utils.pagination_helper import (
+    MAX_PAGE_SIZE,
+    clamp_limit,
+    encode_cursor,
+    decode_cursor,
+    keyset_after
 )
 
 # Naya router object
@@ -29,10 +58,145 @@ router = APIRouter(
     tags=["Notifications"]
 )
 
-@router.post("/", response_model=NotificationOut, status_code=status.HTTP_201_CREATED)
+# Admin list ka 'total' pehle page par hi ginta hai, aur isse aage nahi (badi search
+# par poora count collection scan ban jaata)
+NOTIFICATION_COUNT_LIMIT = 1000
+
+
+def notification_search_fields(model_name: str, phone: str) -> dict:
+    """Notification document ke search fields (admin 'q' search inhi indexed fields par)."""
+    return {
+        "searchTokens": build_search_tokens(model_name),
+        "phoneTokens": build_phone_tokens(phone),
+    }
+
+
+async def backfill_notification_search(collection) -> int:
+    """
+    Purane notifications (jin par 'searchTokens' / 'phoneTokens' nahi hai) ke search
+    fields bharta hai. Idempotent hai, isliye startup par chalana safe hai.
+    """
+    updated = 0
+    batch = []
+    missing = {"$or": [
+        {"searchTokens": {"$exists": False}},
+        {"phoneTokens": {"$exists": False}},
+    ]}
+    async for doc in collection.find(missing, {"modelName": 1, "phone": 1}):
+        batch.append(UpdateOne(
+            {"_id": doc["_id"]},
+            {"$set": notification_search_fields(doc.get("modelName", ""), doc.get("phone", ""))}
+        ))
+        if len(batch) >= BACKFILL_BATCH_SIZE:
+            await collection.bulk_write(batch, ordered=False)
+            updated += len(batch)
+            batch = []
+    if batch:
+        await collection.bulk_write(batch, ordered=False)
+        updated += len(batch)
+    if updated:
+        print(f"[Notify] {updated} notifications ke search fields backfill kiye gaye.")
+    return updated
+
+
+async def backfill_open_flags(collection) -> int:
+    """
+    Purane notifications par 'isOpen' bharta hai. Usse pehle ek hi phone + model ki
+    purani duplicate open requests mein se sirf ek (sabse purani) rakhi jaati hai,
+    baaki "Cancelled" ho jaati hain - warna partial unique index toot jaata.
+    """
+    missing = {"isOpen": {"$exists": False}}
+    if await collection.find_one(missing, {"_id": 1}) is None:
+        return 0
+    # Bahut purane documents mein 'status' hi nahi hai - unhe Pending maana jaata hai
+    await collection.update_many({"status": {"$exists": False}}, {"$set": {"status": "Pending"}})
+
+    cancelled = 0
+    async for group in collection.aggregate([
+        {"$match": {"status": {"$in": list(OPEN_STATUSES)}, "isOpen": {"$ne": False}}},
+        {"$sort": {"isOpen": -1, "createdAt": 1}},
+        {"$group": {"_id": {"p": "$phone", "m": "$canonicalModel"}, "ids": {"$push": "$_id"}}},
+        {"$match": {"ids.1": {"$exists": True}}},
+    ], allowDiskUse=True):
+        keep, *duplicates = group["ids"]
+        result = await collection.update_many(
+            {"_id": {"$in": duplicates}},
+            {"$set": {"status": "Cancelled", "isOpen": False, "duplicateOf": keep, "updatedAt": datetime.utcnow()}}
+        )
+        cancelled += result.modified_count
+
+    opened = await collection.update_many(
+        {**missing, "status": {"$in": list(OPEN_STATUSES)}}, {"$set": {"isOpen": True}}
+    )
+    closed = await collection.update_many(missing, {"$set": {"isOpen": False}})
+    print(f"[Notify] isOpen backfill: {opened.modified_count} open, {closed.modified_count} closed, "
+          f"{cancelled} duplicates cancelled.")
+    return opened.modified_count + closed.modified_count
+
+
+async def merge_open_conflicts(collection, conflicts) -> None:
+    """
+    Naye alias se ek hi phone ki do open requests same canonicalModel par aa gayin
+    (partial unique index ne write roka). Sabse purani request open rehti hai, baaki
+    "Cancelled" + 'duplicateOf' ho jaati hai - 'backfill_open_flags' jaisa hi.
+    """
+    for doc_id, key in conflicts:
+        doc = await collection.find_one({"_id": doc_id}, {"phone": 1, "createdAt": 1})
+        if doc is None:
+            continue
+        keeper = await collection.find_one(
+            {"phone": doc.get("phone"), "canonicalModel": key, "isOpen": True}, {"createdAt": 1}
+        )
+        merged = {"status": "Cancelled", "isOpen": False, "updatedAt": datetime.utcnow()}
+        if keeper is None:
+            # Takraane wali request beech mein band ho gayi
+            await collection.update_one({"_id": doc_id}, {"$set": {"canonicalModel": key}})
+        elif doc.get("createdAt") and keeper.get("createdAt") and doc["createdAt"] < keeper["createdAt"]:
+            # Yeh request purani hai - pehle nayi wali band, phir isko naya key
+            await collection.update_one({"_id": keeper["_id"]}, {"$set": {**merged, "duplicateOf": doc_id}})
+            await collection.update_one({"_id": doc_id}, {"$set": {"canonicalModel": key}})
+        else:
+            await collection.update_one(
+                {"_id": doc_id}, {"$set": {**merged, "canonicalModel": key, "duplicateOf": keeper["_id"]}}
+            )
+    print(f"[Notify] Canonical backfill: {len(conflicts)} open duplicates merge hue.")
+
+
+def _idempotent_replay(previous: dict, insert_data: dict, response: Response) -> NotificationOut:
+    """
+    Same 'Idempotency-Key' dobara aayi: payload (phone + model) wahi ho to purani
+    request 200 ke saath, warna 422 - kisi doosre customer ka record kabhi nahi.
+    """
+    if (previous.get("phone") != insert_data["phone"]
+            or previous.get("canonicalModel") != insert_data["canonicalModel"]):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Yeh Idempotency-Key kisi doosri request ke liye use ho chuki hai."
+        )
+    response.status_code = status.HTTP_200_OK
+    return notification_helper(previous)
+
+
+@router.post(
+    "/",
+    response_model=NotificationOut,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit_by_ip("notify_ip"))]
+)
 async def create_notification(
-    request: NotificationRequest = Body(...)
+    response: Response,
+    request: NotificationRequest = Body(...),
+    idempotency_key: Optional[str] = Header(None, max_length=128)
 ):
+    """
+    "Order Now" request save karta hai. Agar isi phone + model ki ek open request
+    pehle se hai (ya yahi 'Idempotency-Key' isi phone + model ke saath pehle aa chuki hai),
+    to nayi copy nahi banti - wahi purani request 200 ke saath wapas milti hai.
+    Key kisi doosre payload ke saath use ho chuki ho to 422.
+    """
+    # IP limit dependency mein lagti hai; yahaan phone number par limit
+    await enforce_rate_limit("notify_phone", request.phone)
+
     try:
         db_request = NotificationInDB(
             **request.model_dump(),
@@ -50,24 +214,55 @@ async def create_notification(
         if 'id' in insert_data:
              insert_data['_id'] = str(insert_data.pop('id'))
         # --- END OF FIX ---
+        # Restock/demand queries isi key par exact match karti hain
+        insert_data["canonicalModel"] = canonical_model_key(request.modelName)
+        insert_data.update(notification_search_fields(request.modelName, request.phone))
+        insert_data["isOpen"] = True
+        if idempotency_key:
+            insert_data["idempotencyKey"] = idempotency_key
 
-        result = await notification_collection.insert_one(insert_data)
-        
-        if not result.inserted_id:
+        # Key sirf usi payload ke liye replay hoti hai (phone + model check)
+        if idempotency_key:
+            previous = await notification_collection.find_one({"idempotencyKey": idempotency_key})
+            if previous is not None:
+                return _idempotent_replay(previous, insert_data, response)
+
+        dedupe_filter = {"phone": request.phone, "canonicalModel": insert_data["canonicalModel"], "isOpen": True}
+        for _ in range(2):
+            try:
+                # Upsert: match mila to kuch nahi likha jaata, warna naya document insert
+                existing = await notification_collection.find_one_and_update(
+                    dedupe_filter,
+                    {"$setOnInsert": insert_data},
+                    upsert=True,
+                    return_document=ReturnDocument.BEFORE
+                )
+                break
+            except DuplicateKeyError:
+                # Do requests ek saath aayin; doosri unique index se ruk gayi
+                if idempotency_key:
+                    previous = await notification_collection.find_one({"idempotencyKey": idempotency_key})
+                    if previous is not None:
+                        return _idempotent_replay(previous, insert_data, response)
+                existing = await notification_collection.find_one(dedupe_filter)
+                if existing is not None:
+                    break
+                # Takraane wali request beech mein close ho gayi - ek baar aur try
+        else:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to create notification request."
-            )
-        
-        created_doc = await notification_collection.find_one({"_id": result.inserted_id})
-        if created_doc is None:
-             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Newly created notification not found."
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Request abhi save nahi ho payi. Thodi der baad dobara try karein."
             )
 
-        return notification_helper(created_doc)
-        
+        if existing is not None:
+            response.status_code = status.HTTP_200_OK
+            return notification_helper(existing)
+
+        # Response usi document se banta hai jo abhi insert kiya (dobara read nahi)
+        return notification_helper(insert_data)
+
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error creating notification: {e}")
         raise HTTPException(
@@ -76,16 +271,90 @@ async def create_notification(
         )
 
 
-@router.get("/", response_model=List[NotificationOut])
-async def get_all_notifications():
+def build_notification_query(
+    status_filter: Optional[List[str]] = None,
+    q: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    model_name: Optional[str] = None
+) -> dict:
     """
-    (Admin ke liye) Sabhi notification requests fetch karta hai.
+    Admin filters se notifications ki MongoDB query banata hai.
+    'q' indexed prefix search hai: model name ke words / compact naam ka prefix ya
+    canonical model (covers search jaisa, 'searchTokens'), aur digits hon to phone number
+    ka prefix ('phoneTokens'; '+', space, '-' ignore). User input kabhi regex nahi banta.
+    'model_name' canonical model par exact match hai.
     """
+    query: dict = {}
+    if status_filter:
+        query["status"] = {"$in": status_filter}
+    if model_name and canonical_model_key(model_name):
+        query["canonicalModel"] = canonical_model_key(model_name)
+    text = (q or "").strip()
+    if text:
+        clauses = list(build_model_match(text).get("$or", []))
+        digits = phone_query_digits(text)
+        if digits:
+            # "9876543" aur "+91 98765" dono stored "+91 98765-43210" se milte hain
+            clauses.append({"phoneTokens": digits})
+        # Kuch bhi search karne layak nahi (jaise sirf "---") - koi result nahi
+        query["$or"] = clauses or [{"_id": {"$in": []}}]
+    if date_from or date_to:
+        query["createdAt"] = {}
+        if date_from:
+            query["createdAt"]["$gte"] = date_from
+        if date_to:
+            query["createdAt"]["$lte"] = date_to
+    return query
+
+
+@router.get("/", response_model=NotificationPage)
+async def get_all_notifications(
+    status_filter: Optional[List[NotificationStatus]] = Query(None, alias="status", description="Status(es), e.g. Pending"),
+    q: Optional[str] = Query(None, description="Phone number ya model name"),
+    date_from: Optional[datetime] = Query(None, description="Is time se (createdAt >=)"),
+    date_to: Optional[datetime] = Query(None, description="Is time tak (createdAt <=)"),
+    cursor: Optional[str] = Query(None, description="Pichle response ka 'next_cursor'"),
+    limit: int = Query(50, description=f"Page size (max {MAX_PAGE_SIZE})")
+):
+    """
+    (Admin ke liye) Notification requests ka ek page (naye pehle). Pehle page par filter
+    ka total count bhi (NOTIFICATION_COUNT_LIMIT tak; usse zyada ho to 'total_capped').
+    """
+    query = build_notification_query(status_filter, q, date_from, date_to)
+    page_size = clamp_limit(limit)
+    after = decode_cursor(cursor) if cursor else None
+
     try:
-        notifications = []
-        async for doc in notification_collection.find().sort("createdAt", -1):
-            notifications.append(notification_helper(doc))
-        return notifications
+        page_query = {"$and": [query, keyset_after(after.get("c"), after["i"])]} if after else query
+        page = (
+            notification_collection.find(page_query)
+                .sort([("createdAt", -1), ("_id", -1)])
+                .limit(page_size + 1)
+                .to_list(length=page_size + 1)
+        )
+        total = None
+        if after:
+            docs = await page
+        else:
+            # Count sirf pehle page par, aur limit ke saath - aage ke pages pichla total rakhte hain
+            docs, total = await asyncio.gather(
+                page,
+                notification_collection.count_documents(query, limit=NOTIFICATION_COUNT_LIMIT + 1)
+            )
+
+        next_cursor = None
+        if len(docs) > page_size:
+            docs = docs[:page_size]
+            last = docs[-1]
+            next_cursor = encode_cursor({"c": last.get("createdAt"), "i": last["_id"]})
+
+        return NotificationPage(
+            items=[notification_helper(doc) for doc in docs],
+            next_cursor=next_cursor,
+            total=min(total, NOTIFICATION_COUNT_LIMIT) if total is not None else None,
+            total_capped=total is not None and total > NOTIFICATION_COUNT_LIMIT
+        )
     except Exception as e:
         print(f"Error fetching notifications: {e}")
         raise HTTPException(
@@ -93,6 +362,127 @@ async def get_all_notifications():
             detail=f"An error occurred: {e}"
         )
 
+# --- Bulk Status Update ---
+# Yeh route "/{id}" se pehle declare hona chahiye, warna "bulk" ko ID samjha jaayega.
+async def _reopen_conflicts(query: dict) -> List[str]:
+    """
+    Open status par le jaane se pehle: kaunse band notifications dobara open nahi ho
+    sakte (usi phone + model ki open request pehle se hai, ya isi batch mein ek aur hai).
+    Har phone + model mein sabse purani request khulti hai, baaki ki IDs yahaan aati hain.
+    """
+    conflicts: List[str] = []
+    async for group in notification_collection.aggregate([
+        {"$match": {"$and": [query, {"isOpen": {"$ne": True}}]}},
+        {"$sort": {"createdAt": 1}},
+        {"$group": {"_id": {"p": "$phone", "m": "$canonicalModel"}, "ids": {"$push": "$_id"}}},
+    ], allowDiskUse=True):
+        already_open = await notification_collection.find_one(
+            {"phone": group["_id"]["p"], "canonicalModel": group["_id"]["m"], "isOpen": True}, {"_id": 1}
+        )
+        conflicts.extend(group["ids"] if already_open else group["ids"][1:])
+    return conflicts
+
+
+async def _update_remaining(query: dict, update: dict) -> Tuple[int, int, List[str]]:
+    """
+    update_many ke beech mein rukne ke baad: bache hue notifications ko ek-ek UpdateOne
+    (unordered bulk_write, batches mein) se update karta hai. Duplicate key (open request
+    pehle se hai) wale chhod diye jaate hain. Return: (matched, modified, failed IDs).
+    """
+    matched = modified = 0
+    failed: List[str] = []
+    ids = [doc["_id"] async for doc in notification_collection.find(query, {"_id": 1})]
+    for start in range(0, len(ids), BACKFILL_BATCH_SIZE):
+        batch = ids[start:start + BACKFILL_BATCH_SIZE]
+        ops = [UpdateOne({"$and": [query, {"_id": _id}]}, update) for _id in batch]
+        try:
+            result = await notification_collection.bulk_write(ops, ordered=False)
+            matched += result.matched_count
+            modified += result.modified_count
+        except BulkWriteError as e:
+            errors = e.details.get("writeErrors", [])
+            if any(err.get("code") != 11000 for err in errors):
+                raise
+            matched += e.details.get("nMatched", 0)
+            modified += e.details.get("nModified", 0)
+            failed.extend(str(batch[err["index"]]) for err in errors)
+    return matched, modified, failed
+
+
+@router.put("/bulk", response_model=NotificationBulkResult)
+async def bulk_update_notification_status(
+    bulk: NotificationBulkUpdate = Body(...)
+):
+    """
+    (Admin ke liye) Bahut saare notifications ka status ek saath badalta hai -
+    'ids' ki list ya filter (e.g. modelName + status=Pending). Ek aggregation
+    (pehle ke status counts) aur ek update_many, chahe 1 notification ho ya 10,000.
+    Open status par jo notifications dobara open nahi ho sakte woh chhod diye jaate hain
+    aur 'conflicts' mein aate hain; baaki update hote hain. Update ke dauraan takraane
+    wale (beech mein bani open request) 'failed' mein aate hain - response phir bhi 200.
+    """
+    if bool(bulk.ids) == bool(bulk.filter):
+        raise HTTPException(status_code=400, detail="'ids' ya 'filter' mein se koi ek dijiye.")
+
+    if bulk.ids:
+        query = {"_id": {"$in": bulk.ids}}
+    else:
+        f = bulk.filter
+        query = build_notification_query(f.status, f.q, f.date_from, f.date_to, f.modelName)
+        if not query:
+            # Khaali filter poori collection badal dega - galti se na ho
+            raise HTTPException(status_code=400, detail="Filter mein kam se kam ek condition dijiye.")
+
+    # Jo pehle se target status mein hain unhe chhod do
+    target = query
+    query = {"$and": [target, {"status": {"$ne": bulk.status}}]}
+
+    now = datetime.utcnow()
+    # Mongo dates milliseconds tak hoti hain - baad mein isi value se match karna hai
+    now = now.replace(microsecond=now.microsecond // 1000 * 1000)
+    try:
+        conflicts = await _reopen_conflicts(query) if is_open_status(bulk.status) else []
+        if conflicts:
+            query = {"$and": [query, {"_id": {"$nin": conflicts}}]}
+
+        previous = {}
+        async for row in notification_collection.aggregate([
+            {"$match": query},
+            {"$group": {"_id": {"$ifNull": ["$status", "Pending"]}, "count": {"$sum": 1}}},
+        ]):
+            previous[row["_id"]] = row["count"]
+
+        update = {"$set": {"status": bulk.status, "isOpen": is_open_status(bulk.status), "updatedAt": now}}
+        failed: List[str] = []
+        try:
+            result = await notification_collection.update_many(query, update)
+            matched, modified = result.matched_count, result.modified_count
+        except DuplicateKeyError:
+            # Check ke baad kisi ne beech mein open request bana di. update_many pehli
+            # takkar par rukta hai - jitna likha gaya gino, baaki ek-ek karke (unordered)
+            # likho; jo takraaye woh 'failed' mein jaate hain.
+            matched = modified = await notification_collection.count_documents(
+                {"$and": [target, {"status": bulk.status, "updatedAt": now}]}
+            )
+            remaining, rest_modified, failed = await _update_remaining(query, update)
+            matched += remaining
+            modified += rest_modified
+        return NotificationBulkResult(
+            status=bulk.status,
+            matched=matched,
+            modified=modified,
+            previous_status_counts=previous,
+            conflicts=conflicts,
+            failed=failed
+        )
+    except Exception as e:
+        print(f"Error in bulk notification update: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An error occurred: {e}"
+        )
+
+
 # --- NAYA "BEHTREEN" (AWESOME) ENDPOINT (FIXED) ---
 @router.put("/{id}", response_model=NotificationOut)
 async def update_notification_status(
@@ -111,21 +501,26 @@ async def update_notification_status(
     
     if not update_data:
         raise HTTPException(status_code=400, detail="Update karne ke liye koi data nahi diya gaya.")
+    # Demand summary (utils/demand_helper.py) isse badle hue notifications pehchanti hai
+    update_data["updatedAt"] = datetime.utcnow()
+    update_data["isOpen"] = is_open_status(update_data["status"])
 
-    update_result = await notification_collection.update_one(
-        {"_id": id}, # ID ko string ki tarah hi dhoondho
-        {"$set": update_data}
-    )
+    # Update aur updated document ek hi round-trip mein
+    try:
+        updated_doc = await notification_collection.find_one_and_update(
+            {"_id": id}, # ID ko string ki tarah hi dhoondho
+            {"$set": update_data},
+            return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Is phone aur model ki ek open request pehle se hai."
+        )
     # --- END OF FIX ---
     
-    if update_result.matched_count == 0:
-        # Debugging ke liye print statement
-        print(f"[DEBUG] 404: Notification ID (string) '{id}' database mein nahi mila.")
-        raise HTTPException(status_code=404, detail="Notification not found.")
-
-    updated_doc = await notification_collection.find_one({"_id": id}) # ID ko string ki tarah hi dhoondho
     if updated_doc is None:
-        raise HTTPException(status_code=404, detail="Updated notification not found after update.")
+        raise HTTPException(status_code=404, detail="Notification not found.")
         
     return notification_helper(updated_doc)
 # --- NAYA ENDPOINT (FIXED) ---
@@ -1,6 +1,7 @@
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.staticfiles import StaticFiles
 from dotenv import load_dotenv
 import os
 import sys
@@ -14,11 +15,29 @@ sys.path.append(BASE_DIR)
 
 # Hamare banaye gaye modules ko import karna
 from routes.cover_routes import cover_router
-from controllers.notification_controller import router as notification_router
+from controllers.notification_controller import (
+    router as notification_router,
+    backfill_open_flags,
+    backfill_notification_search,
+    merge_open_conflicts
+)
 from controllers.category_controller import router as category_router
 from controllers.auth_controller import router as auth_router
-from config.db import check_db_connection
+from controllers.admin_controller import router as admin_router
+from config.db import (
+    check_db_connection,
+    collection as cover_collection,
+    notification_collection,
+    model_alias_collection
+)
+from config.indexes import ensure_indexes, check_indexes
+from utils.search_helper import backfill_search_fields
+from utils.model_normalizer import load_aliases, backfill_canonical_models
+from utils.suggest_index import suggest_index
+from utils.restock_worker import restock_worker
+from utils.image_gc import image_gc
 from config.cloudinary_config import setup_cloudinary
+from utils.storage import STORAGE_BACKEND, LOCAL_MEDIA_DIR
 
 # FastAPI app instance banana
 app = FastAPI(
@@ -49,8 +68,10 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins, # Sirf in URLs ko allow karein
     allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    # Browser (frontend) 429 par 'Retry-After' padh sake
+    expose_headers=["Retry-After"],
 )
 
 # --- Event Handlers (Startup) ---
@@ -59,12 +80,36 @@ async def startup_event():
     print("Application startup...")
     setup_cloudinary()
     await check_db_connection()
+    await ensure_indexes()
+    # Aliases pehle load honge taaki backfill sahi canonical keys likhe
+    await load_aliases(model_alias_collection)
+    await backfill_search_fields(cover_collection)
+    await backfill_canonical_models(notification_collection, on_conflict=merge_open_conflicts)
+    await backfill_open_flags(notification_collection)
+    await backfill_notification_search(notification_collection)
+    await suggest_index.rebuild(cover_collection)
+    restock_worker.start(notification_collection)
+    image_gc.start()
+    # INDEX_CHECK=true par startup ke waqt query plans bhi check honge
+    if os.getenv("INDEX_CHECK", "false").lower() == "true":
+        await check_indexes()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await restock_worker.stop()
+    await image_gc.stop()
 
 # --- API Routes ko include karna ---
 app.include_router(cover_router)
 app.include_router(notification_router)
 app.include_router(category_router)
 app.include_router(auth_router)
+app.include_router(admin_router)
+
+# Local storage backend ki images ko '/media' par serve karna
+if STORAGE_BACKEND == "local":
+    os.makedirs(LOCAL_MEDIA_DIR, exist_ok=True)
+    app.mount("/media", StaticFiles(directory=LOCAL_MEDIA_DIR), name="media")
 
 
 # --- Root Endpoint (Health Check) ---
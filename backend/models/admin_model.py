@@ -0,0 +1,75 @@
+from pydantic import BaseModel, Field
+from typing import List, Dict, Optional
+from datetime import datetime
+
+from .notification_model import NotificationOut
+
+
+class LowStockItem(BaseModel):
+    """Dashboard chart ke liye ek kam-stock product."""
+    id: str
+    modelName: str
+    color: str = ""
+    stock: int
+
+
+class AdminStats(BaseModel):
+    """
+    GET /api/admin/stats ka response. Iska size catalog ke size par depend nahi karta.
+    """
+    covers: int = Field(..., example=120)
+    available_covers: int = Field(..., example=110)
+    categories: int = Field(..., example=8)
+    notifications: int = Field(..., example=45)
+    notifications_by_status: Dict[str, int] = Field(..., example={"Pending": 30, "Completed": 15})
+    low_stock: List[LowStockItem]
+    recent_notifications: List[NotificationOut]
+    generated_at: datetime
+
+
+class ModelAliasIn(BaseModel):
+    """Alias table entry: 'alias' ko 'canonical' model ki tarah padha jaayega."""
+    alias: str = Field(..., min_length=1, example="A15")
+    canonical: str = Field(..., min_length=1, example="Oppo A15")
+
+
+class ModelAliasOut(BaseModel):
+    alias: str = Field(..., example="a 15")
+    canonical: str = Field(..., example="oppo a 15")
+    createdAt: datetime
+
+
+class DemandRow(BaseModel):
+    """Ek canonical model ki demand aur current inventory."""
+    canonicalModel: str = Field(..., example="samsung galaxy a 15")
+    modelName: str = Field(..., example="Samsung A15")
+    total: int = Field(..., example=42)
+    by_status: Dict[str, int] = Field(..., example={"Pending": 40, "In Progress": 2})
+    stock: int = Field(..., example=0)
+    covers: int = Field(..., example=0)
+    low_stock: bool
+
+
+class DemandReport(BaseModel):
+    """GET /api/admin/demand ka response."""
+    days: Optional[int] = Field(None, example=30)
+    statuses: List[str]
+    source: str = Field(..., example="summary")
+    rows: List[DemandRow]
+    generated_at: datetime
+    # Summary source: pichli summary kab bani, aur kya abhi background mein refresh ho raha hai
+    summary_refreshed_at: Optional[datetime] = None
+    refreshing: bool = False
+
+
+class ImageGCReport(BaseModel):
+    """Image GC run (POST /api/admin/images/gc) ka result."""
+    dry_run: bool
+    checked: int = Field(..., example=12)
+    deleted: int = Field(..., example=10, description="Dry run mein: kitne delete hote")
+    still_referenced: int = Field(0, example=2)
+    failed: int = Field(0, example=0)
+    bytes_reclaimed: int = Field(..., example=2457600)
+    keys: List[str] = Field(default_factory=list, description="Deleted keys (pehli 200)")
+    scanned: Optional[int] = Field(None, description="Reconciliation: storage mein kitne assets")
+    orphaned: Optional[int] = Field(None, description="Reconciliation: kitne bina reference ke mile")
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, HttpUrl, ConfigDict
-from typing import Optional, List, Any
+from pydantic import BaseModel, Field, HttpUrl, ConfigDict, TypeAdapter
+from typing import Optional, List, Any, Dict
 from bson import ObjectId
 from pydantic_core import core_schema
 from pydantic.json_schema import JsonSchemaValue
@@ -70,10 +70,33 @@ class CoverInDB(CoverBase):
         arbitrary_types_allowed=True,
     )
 
+# --- Responsive Images (utils/image_pipeline.py) ---
+class CoverImageVariant(BaseModel):
+    name: str = Field(..., example="card") # thumb / card / full
+    url: str
+    width: int = Field(..., example=480)
+    height: int = Field(..., example=640)
+    format: str = Field(..., example="webp")
+
+
+class CoverImages(BaseModel):
+    """
+    Srcset-ready image data. 'srcset' seedha <img srcset> mein lag sakta hai;
+    'placeholder' ek chhota blurred data URI hai jo image load hone tak dikhta hai.
+    """
+    width: int # Original ki width/height (aspect ratio ke liye)
+    height: int
+    placeholder: Optional[str] = None
+    srcset: str = Field(..., example="https://.../thumb.webp 160w, https://.../card.webp 480w")
+    variants: List[CoverImageVariant]
+
+
 # --- Model for Sending Data to Client (Response) ---
 class CoverOut(CoverBase):
     id: str = Field(..., example="605c72ef8f0b9f001f7b0e0a")
     imageUrl: HttpUrl = Field(..., example="http://res.cloudinary.com/demo/image/upload/sample.jpg")
+    # Purane covers (derivatives se pehle ke) par None
+    images: Optional[CoverImages] = None
     createdAt: datetime
     updatedAt: datetime
 
@@ -81,31 +104,236 @@ class CoverOut(CoverBase):
         json_encoders={datetime: lambda v: v.isoformat()}
     )
 
+# --- Paginated List Response ---
+class CoverPage(BaseModel):
+    """
+    GET /api/covers ka response: ek page ke covers aur agle page ka cursor.
+    'next_cursor' None ho to aur pages nahi hain.
+    """
+    items: List[CoverOut]
+    next_cursor: Optional[str] = None
+
+# --- Facet Counts (Filter Sidebar) ---
+# Price histogram ki boundaries (har bucket [min, max) hai; aakhri bucket open-ended)
+PRICE_BUCKET_BOUNDARIES = [0, 200, 500, 1000, 2000, 5000]
+
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+
+class PriceBucket(BaseModel):
+    min: float
+    max: Optional[float] = None # None = isse upar sab
+    count: int
+
+
+class CoverFacets(BaseModel):
+    """GET /api/covers/facets ka response."""
+    total: int
+    coverType: List[FacetCount]
+    color: List[FacetCount]
+    gender: List[FacetCount]
+    category: List[FacetCount]
+    price: List[PriceBucket]
+
+
+# --- Typeahead Suggestions ---
+class ModelSuggestion(BaseModel):
+    modelName: str
+    count: int # Kitne available products is model ke hain
+
+
+class ModelSuggestResponse(BaseModel):
+    """GET /api/covers/suggest ka response."""
+    query: str
+    suggestions: List[ModelSuggestion]
+
+
+# --- Bulk Create Response ---
+class BulkVariantResult(BaseModel):
+    """Bulk upload mein ek variant ka nateeja."""
+    index: int
+    color: str
+    success: bool
+    cover: Optional[CoverOut] = None
+    error: Optional[str] = None
+
+
+class BulkCoverResponse(BaseModel):
+    """POST /api/covers/bulk ka response."""
+    created: int
+    failed: int
+    results: List[BulkVariantResult]
+
+
+class CoverBulkItem(BaseModel):
+    """Ek cover ke badalne wale fields (CoverUpdate se validate hote hain)."""
+    id: str = Field(..., example="605c72ef8f0b9f001f7b0e0a")
+    fields: Dict[str, Any] = Field(..., example={"price": 449, "stock": 20})
+
+
+class CoverBulkFilter(BaseModel):
+    """Bulk update ke liye filter (GET /api/covers wale filters jaisa, admin mode)."""
+    ids: Optional[List[str]] = Field(None, example=["605c72ef8f0b9f001f7b0e0a"])
+    model: Optional[str] = Field(None, example="iPhone 14")
+    coverType: Optional[List[str]] = None
+    color: Optional[List[str]] = None
+    minPrice: Optional[float] = None
+    maxPrice: Optional[float] = None
+    gender: Optional[str] = None
+    category_ids: Optional[List[str]] = None
+    is_available: Optional[bool] = None
+    # Khaali filter (poora catalog) sirf 'all: true' ke saath
+    all: bool = False
+
+
+class CoverBulkPatch(BaseModel):
+    """
+    PATCH /api/covers/bulk: ya to 'items' ({id, fields} ki list), ya 'filter' ke saath
+    ek operation - '$set' (fields), '$inc' (price/stock) ya 'price_percent' (e.g. -10).
+    """
+    items: Optional[List[CoverBulkItem]] = None
+    filter: Optional[CoverBulkFilter] = None
+    set: Optional[Dict[str, Any]] = Field(None, alias="$set", example={"is_available": False})
+    inc: Optional[Dict[str, float]] = Field(None, alias="$inc", example={"stock": 10})
+    price_percent: Optional[float] = Field(None, ge=-90, le=1000, example=-10)
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class CoverBulkItemError(BaseModel):
+    """Bulk update mein fail hua item ('index' items list mein position hai)."""
+    index: Optional[int] = None
+    id: Optional[str] = None
+    error: str
+
+
+class CoverBulkPatchResult(BaseModel):
+    """PATCH /api/covers/bulk ka response."""
+    matched: int
+    modified: int
+    failed: int
+    errors: List[CoverBulkItemError]
+
+
+class CatalogImportRowError(BaseModel):
+    """Import file ki ek fail hui row (row number spreadsheet jaisa, header = 1)."""
+    row: int = Field(..., example=14)
+    error: str = Field(..., example="price: Input should be greater than 0")
+
+
+class CatalogImportReport(BaseModel):
+    """POST /api/covers/import ka response."""
+    rows: int
+    created: int
+    updated: int
+    failed: int
+    errors: List[CatalogImportRowError]
+    errors_truncated: bool = False
+    # Rows likhi gayi par kuch confirm nahi hua (jaise write concern error) - dobara check karein
+    warnings: List[str] = Field(default_factory=list)
+
 
 # --- Helper Function (Updated) ---
+def images_to_dict(images: Optional[dict]) -> Optional[dict]:
+    """Stored 'images' field ko CoverImages shape mein (srcset ke saath) badalta hai."""
+    if not images or not images.get("variants"):
+        return None
+    variants = sorted(images["variants"], key=lambda v: v["width"])
+    return {
+        "width": images.get("width", variants[-1]["width"]),
+        "height": images.get("height", variants[-1]["height"]),
+        "placeholder": images.get("placeholder"),
+        "srcset": ", ".join(f"{v['url']} {v['width']}w" for v in variants),
+        "variants": variants,
+    }
+
+
+def cover_doc_to_dict(cover_data, now: Optional[datetime] = None) -> dict:
+    """
+    MongoDB document ko CoverOut ke shape wali dict mein badalta hai (bina validation ke).
+    Purane data ke liye missing fields ka fallback yahin hota hai.
+    """
+    now = now or datetime.utcnow()
+    return {
+        "id": str(cover_data["_id"]),
+        "modelName": cover_data["modelName"],
+        "coverType": cover_data["coverType"],
+        "color": cover_data["color"],
+        "price": cover_data["price"],
+        "stock": cover_data["stock"],
+        "imageUrl": cover_data["imageUrl"],
+        "images": images_to_dict(cover_data.get("images")),
+        "genderPreference": cover_data.get("genderPreference", "Unisex"),
+        "tags": cover_data.get("tags", []),
+        "category_ids": cover_data.get("category_ids", []), # Purane data ke liye fallback
+        "createdAt": cover_data.get("createdAt", now),
+        "updatedAt": cover_data.get("updatedAt", now),
+        "is_available": cover_data.get("is_available", True),
+    }
+
+
 def cover_helper(cover_data) -> CoverOut:
     """MongoDB document ko CoverOut Pydantic model mein convert karta hai."""
-    
-    # --- YEH "BEHTREEN" (AWESOME) FIX HAI ---
-    # Purane data ko handle karne ke liye .get() ka istemal
-    # Taaki agar koi field na mile to app crash na ho
-    now = datetime.utcnow() 
-    return CoverOut(
-        id=str(cover_data["_id"]),
-        modelName=cover_data["modelName"],
-        coverType=cover_data["coverType"],
-        color=cover_data["color"],
-        price=cover_data["price"],
-        stock=cover_data["stock"],
-        imageUrl=cover_data["imageUrl"],
-        genderPreference=cover_data.get("genderPreference", "Unisex"), 
-        tags=cover_data.get("tags", []),
-        
-        # In 3 lines ko .get() istemal karne ke liye update kiya gaya hai
-        category_ids=cover_data.get("category_ids", []), # Purane data ke liye fallback
-        createdAt=cover_data.get("createdAt", now), # .get() add kiya
-        updatedAt=cover_data.get("updatedAt", now),  # .get() add kiya
-        is_available=cover_data.get("is_available", True) # .get() add kiya
+    return CoverOut(**cover_doc_to_dict(cover_data))
+
+
+# --- Fast List Serialization ---
+# List endpoints ke liye: Mongo se sirf zaroori fields aate hain, poora page ek hi
+# baar validate hota hai aur pydantic-core seedha JSON bytes likhta hai. FastAPI ko
+# 'Response' milta hai, isliye response_model wala doosra validation/serialization nahi hota.
+
+# CoverOut ke liye zaroori fields (searchTokens jaise bade internal fields nahi)
+COVER_PROJECTION = {
+    field: 1 for field in (
+        "modelName", "coverType", "color", "price", "stock", "imageUrl", "images",
+        "genderPreference", "tags", "category_ids", "is_available",
+        "createdAt", "updatedAt",
     )
-    # --- END OF FIX ---
+}
+
+_cover_page_adapter = TypeAdapter(CoverPage)
 
+
+def cover_page_json(docs: List[dict], next_cursor: Optional[str] = None) -> bytes:
+    """Documents ke ek page ko ek baar validate karke JSON bytes banata hai."""
+    now = datetime.utcnow()
+    page = _cover_page_adapter.validate_python({
+        "items": [cover_doc_to_dict(doc, now) for doc in docs],
+        "next_cursor": next_cursor,
+    })
+    return _cover_page_adapter.dump_json(page)
+
+
+def facets_json(facet_doc: dict) -> bytes:
+    """'$facet' aggregation ke result ko CoverFacets JSON bytes mein badalta hai."""
+    def counts(rows):
+        return [
+            {"value": str(row["_id"]), "count": row["count"]}
+            for row in rows if row.get("_id") not in (None, "")
+        ]
+
+    price = []
+    for row in facet_doc.get("price", []):
+        if row["_id"] == "other":
+            price.append({"min": PRICE_BUCKET_BOUNDARIES[-1], "max": None, "count": row["count"]})
+        else:
+            index = PRICE_BUCKET_BOUNDARIES.index(row["_id"])
+            price.append({
+                "min": row["_id"],
+                "max": PRICE_BUCKET_BOUNDARIES[index + 1],
+                "count": row["count"],
+            })
+
+    total = facet_doc.get("total", [])
+    facets = CoverFacets(
+        total=total[0]["n"] if total else 0,
+        coverType=counts(facet_doc.get("coverType", [])),
+        color=counts(facet_doc.get("color", [])),
+        gender=counts(facet_doc.get("gender", [])),
+        category=counts(facet_doc.get("category", [])),
+        price=price,
+    )
+    return facets.model_dump_json().encode("utf-8")
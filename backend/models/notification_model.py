@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional, List
+from typing import Optional, List, Dict
 from bson import ObjectId
 from datetime import datetime
 from typing import Literal # Naya import
@@ -12,6 +12,13 @@ from .cover_model import PyObjectId
 NotificationStatus = Literal["Pending", "In Progress", "Completed", "Cancelled"]
 # --- End of Feature ---
 
+# Jab tak request in statuses mein hai, woh "open" hai ('isOpen' field). Ek phone +
+# model ki ek hi open request ho sakti hai (partial unique index).
+OPEN_STATUSES = ("Pending", "In Progress")
+
+def is_open_status(status: str) -> bool:
+    return status in OPEN_STATUSES
+
 class NotificationRequest(BaseModel):
     """
     Data jo user se API ke through aayega.
@@ -56,6 +63,46 @@ class NotificationOut(NotificationInDB):
         json_encoders={ObjectId: str, datetime: lambda v: v.isoformat()} # Dates ko ISO format mein convert karna
     )
 
+# --- Bulk Status Update ---
+class NotificationBulkFilter(BaseModel):
+    """Bulk update ke liye filter (GET /api/notify wale filters jaisa)."""
+    modelName: Optional[str] = Field(None, example="Samsung A15")
+    status: Optional[List[NotificationStatus]] = Field(None, example=["Pending"])
+    q: Optional[str] = Field(None, description="Phone ya model prefix")
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+
+class NotificationBulkUpdate(BaseModel):
+    """
+    Ya to 'ids' ki list, ya 'filter' - dono mein se ek. 'status' naya status hai.
+    """
+    ids: Optional[List[str]] = Field(None, example=["605c72ef8f0b9f001f7b0e0a"])
+    filter: Optional[NotificationBulkFilter] = None
+    status: NotificationStatus
+
+class NotificationBulkResult(BaseModel):
+    status: NotificationStatus
+    matched: int
+    modified: int
+    # Update se pehle affected notifications kis status mein the
+    previous_status_counts: Dict[str, int] = Field(..., example={"Pending": 120, "In Progress": 4})
+    # Jo dobara open nahi ho sakte the (usi phone + model ki open request pehle se hai) - update nahi hue
+    conflicts: List[str] = Field(default_factory=list)
+    # Update ke dauraan takraaye (beech mein usi phone + model ki open request ban gayi) - update nahi hue
+    failed: List[str] = Field(default_factory=list)
+
+class NotificationPage(BaseModel):
+    """
+    GET /api/notify ka paginated response. 'next_cursor' null ho to aage koi page nahi.
+    'total' poore filter ke matching notifications ki ginti hai (sirf is page ki nahi) -
+    sirf pehle page par aata hai (aage ke pages par null). 'total_capped' true ho to
+    asli ginti 'total' se zyada hai.
+    """
+    items: List[NotificationOut]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = Field(None, example=45)
+    total_capped: bool = False
+
 def notification_helper(data) -> NotificationOut:
     """MongoDB document ko NotificationOut model mein convert karta hai."""
     return NotificationOut(
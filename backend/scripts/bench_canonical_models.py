@@ -0,0 +1,110 @@
+import argparse
+import asyncio
+import random
+import re
+import statistics
+import time
+from typing import Any, Dict, List, Tuple
+
+from utils.model_normalizer import canonical_model_key
+
+# --- Canonical Model Key: Recall + Latency ---
+# Recall: customers jaise likhte hain (query) vs catalog mein stored naam. Purana path
+# query ko case-insensitive regex ki tarah stored 'modelName' par chalata tha; naya path
+# dono ka canonical key compare karta hai (exact equality).
+#
+# Latency ('--mongo'): scratch collection mein 'covers' synthetic covers, indexed
+# 'canonicalModel' equality vs unanchored '$regex' - p50 / p99 ms. Collection end mein drop.
+#
+# python -m scripts.bench_canonical_models                 -> sirf recall (database nahi chahiye)
+# python -m scripts.bench_canonical_models --mongo         -> recall + latency (MONGO_URI)
+
+# (customer ne kya likha, catalog mein kya hai)
+RECALL_CASES: List[Tuple[str, str]] = [
+    ("iphone14", "Apple iPhone 14"),
+    ("I Phone 14", "Apple iPhone 14"),
+    ("iphone 14 pro max", "Apple iPhone 14 Pro Max"),
+    ("Apple iPhone14Pro", "Apple iPhone 14 Pro"),
+    ("A15", "Samsung Galaxy A15"),
+    ("galaxy a15", "Samsung Galaxy A15"),
+    ("samsung a 15", "Samsung Galaxy A15"),
+    ("Samsung M34 5G", "Samsung Galaxy M34 5G"),
+    ("redmi note 12 pro+", "Redmi Note 12 Pro+"),
+    ("redmi note12 pro plus", "Redmi Note 12 Pro+"),
+    ("Mi Note 12", "Redmi Note 12"),
+    ("oneplus nord ce3", "OnePlus Nord CE 3"),
+    ("one plus 11", "OnePlus 11"),
+    ("pixel 8", "Google Pixel 8"),
+    ("vivo y20", "Vivo Y20"),
+    ("Y 20", "Vivo Y20"),
+]
+
+
+def _regex_match(query: str, stored: str) -> bool:
+    # Purana get_covers: {"modelName": {"$regex": query, "$options": "i"}}
+    try:
+        return re.search(query, stored, re.IGNORECASE) is not None
+    except re.error:
+        return False
+
+
+def recall_report() -> Dict[str, Any]:
+    regex_hits = [q for q, stored in RECALL_CASES if _regex_match(q, stored)]
+    canonical_hits = [q for q, stored in RECALL_CASES if canonical_model_key(q) == canonical_model_key(stored)]
+    total = len(RECALL_CASES)
+    return {
+        "cases": total,
+        "regex_recall": round(len(regex_hits) / total, 2),
+        "canonical_recall": round(len(canonical_hits) / total, 2),
+        "canonical_misses": [q for q, _ in RECALL_CASES if q not in canonical_hits],
+    }
+
+
+async def latency_report(covers: int, rounds: int) -> Dict[str, Any]:
+    from config.db import db
+    collection = db.get_collection("bench_canonical_covers")
+    await collection.drop()
+    rng = random.Random(3)
+    stored_names = sorted({stored for _, stored in RECALL_CASES})
+    docs = []
+    for i in range(covers):
+        name = rng.choice(stored_names) if i % 10 == 0 else f"Bench Phone {i % 5000} Pro"
+        docs.append({"_id": f"bench-{i}", "modelName": name, "is_available": True,
+                     "canonicalModel": canonical_model_key(name)})
+    for start in range(0, len(docs), 10000):
+        await collection.insert_many(docs[start:start + 10000], ordered=False)
+    await collection.create_index([("canonicalModel", 1), ("is_available", 1)])
+
+    async def timed(query: dict) -> List[float]:
+        latencies = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            await collection.find(query).limit(50).to_list(length=50)
+            latencies.append((time.perf_counter() - started) * 1000)
+        return sorted(latencies)
+
+    def summary(latencies: List[float]) -> Dict[str, float]:
+        return {"p50": round(statistics.median(latencies), 2),
+                "p99": round(latencies[max(0, int(len(latencies) * 0.99) - 1)], 2)}
+
+    regex_all, canonical_all = [], []
+    try:
+        for query, _ in RECALL_CASES:
+            regex_all += await timed({"is_available": True, "modelName": {"$regex": re.escape(query), "$options": "i"}})
+            canonical_all += await timed({"canonicalModel": canonical_model_key(query), "is_available": True})
+    finally:
+        await collection.drop()
+    return {"covers": covers, "regex_ms": summary(sorted(regex_all)),
+            "canonical_ms": summary(sorted(canonical_all))}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Canonical model key ka recall aur latency.")
+    parser.add_argument("--mongo", action="store_true", help="Latency bhi naapo (MONGO_URI chahiye)")
+    parser.add_argument("--covers", type=int, default=100000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    print(recall_report())
+    if args.mongo:
+        print(asyncio.run(latency_report(args.covers, args.rounds)))
@@ -0,0 +1,57 @@
+import argparse
+import json
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+# --- Catalog Cache Throughput ---
+# Chalte hue server (uvicorn) par GET /api/covers ko concurrent load deta hai:
+#  - cached:   har request same filters -> catalog_cache hit
+#  - uncached: har request alag 'maxPrice' -> har baar naya cache key, yaani database
+# Dono ka requests/second aur p50 latency, saath mein server ke cache hit/miss counters
+# (GET /api/admin/cache).
+#
+# python -m scripts.bench_catalog_cache --url http://127.0.0.1:8000 --requests 2000 --concurrency 20
+
+DEFAULT_FILTERS = "model=iphone&limit=20"
+
+
+def _get(url: str) -> float:
+    started = time.perf_counter()
+    with urllib.request.urlopen(url, timeout=30) as response:
+        response.read()
+    return (time.perf_counter() - started) * 1000
+
+
+def _load(urls, concurrency: int) -> Dict[str, Any]:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = sorted(pool.map(_get, urls))
+    seconds = time.perf_counter() - started
+    return {
+        "requests": len(latencies),
+        "per_second": round(len(latencies) / seconds, 1),
+        "p50_ms": round(latencies[len(latencies) // 2], 2),
+    }
+
+
+def run_bench(base_url: str, requests: int, concurrency: int) -> Dict[str, Any]:
+    covers_url = f"{base_url.rstrip('/')}/api/covers/?{DEFAULT_FILTERS}"
+    _get(covers_url) # Cache garam karo
+    cached = _load([covers_url] * requests, concurrency)
+    # Har maxPrice alag cache key hai, par result same - sirf database ka kharcha badalta hai
+    uncached = _load([f"{covers_url}&maxPrice={100000 + i}" for i in range(requests)], concurrency)
+    with urllib.request.urlopen(f"{base_url.rstrip('/')}/api/admin/cache", timeout=30) as response:
+        cache_stats = json.loads(response.read())
+    return {"cached": cached, "uncached": uncached,
+            "speedup": round(cached["per_second"] / uncached["per_second"], 1), "server_cache": cache_stats}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Catalog cache ka cached vs uncached throughput.")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    print(json.dumps(run_bench(args.url, args.requests, args.concurrency), indent=2))
@@ -0,0 +1,103 @@
+import argparse
+import asyncio
+import csv
+import io
+import sys
+import time
+from typing import Any, Dict
+
+from config.db import db
+from utils.catalog_import import IMPORT_CHUNK_SIZE, import_catalog, iter_csv_rows, parse_catalog_row
+from utils.search_helper import search_fields
+
+# --- Catalog Import Throughput (50k rows) ---
+# 'BENCH_ROWS' (default 50,000) rows ki synthetic supplier CSV (memory mein) ko scratch
+# collection mein import karta hai:
+#  - create: khaali collection, har row naya cover (upsert insert)
+#  - update: wahi file dobara - har row existing cover ka update
+#  - baseline ('--baseline'): purana tareeka, har row ka alag update_one upsert
+# Har run ka time aur rows/second report hota hai. Images http URLs hain (upload nahi hota),
+# stock 0 hai taaki restock worker kuch na kare. Collection end mein drop.
+#
+# MONGO_URI wala database chahiye (asli 'covers' ko nahi chhedta; catalog version ek baar badalta hai).
+# python -m scripts.bench_catalog_import                   -> create + update
+# python -m scripts.bench_catalog_import --baseline        -> + row-by-row baseline
+# (exit code 1 agar koi row fail hui)
+
+BENCH_COLLECTION = "bench_catalog_import"
+COLUMNS = ["modelName", "coverType", "color", "price", "stock", "genderPreference",
+           "tags", "category_ids", "is_available", "image"]
+COVER_TYPES = ["Silicone", "Hard Case", "Leather", "Transparent", "Rugged"]
+COLORS = ["Black", "Blue", "Red", "Green", "Pink", "White", "Clear", "Purple", "Grey", "Brown"]
+
+
+def build_csv(rows: int) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(COLUMNS)
+    combos = len(COVER_TYPES) * len(COLORS)
+    for i in range(rows):
+        writer.writerow([
+            f"Bench Phone {i // combos}", COVER_TYPES[i % len(COVER_TYPES)],
+            COLORS[(i // len(COVER_TYPES)) % len(COLORS)], 199 + i % 300, 0, "Unisex",
+            "bench|import", "", "true", f"https://res.cloudinary.com/demo/image/upload/bench/{i}.jpg",
+        ])
+    return buffer.getvalue().encode("utf-8")
+
+
+async def _timed_import(collection, data: bytes, chunk_size: int) -> Dict[str, Any]:
+    started = time.perf_counter()
+    report = await import_catalog(collection, io.BytesIO(data), "bench.csv", chunk_size=chunk_size)
+    seconds = time.perf_counter() - started
+    return {"seconds": round(seconds, 2), "rows_per_second": round(report["rows"] / seconds),
+            "created": report["created"], "updated": report["updated"], "failed": report["failed"],
+            "warnings": len(report["warnings"])}
+
+
+async def _timed_baseline(collection, data: bytes) -> Dict[str, Any]:
+    """Purana import: har row validate karke ek alag update_one upsert (har row ek round-trip)."""
+    started = time.perf_counter()
+    rows = 0
+    for raw in iter_csv_rows(io.BytesIO(data)):
+        cover, image_url = parse_catalog_row(raw)
+        fields = {**cover.model_dump(), **search_fields(cover.modelName), "imageUrl": image_url}
+        await collection.update_one(
+            {"canonicalModel": fields["canonicalModel"], "coverType": cover.coverType, "color": cover.color},
+            {"$set": fields}, upsert=True
+        )
+        rows += 1
+    seconds = time.perf_counter() - started
+    return {"seconds": round(seconds, 2), "rows_per_second": round(rows / seconds)}
+
+
+async def run_bench(rows: int, chunk_size: int, baseline: bool) -> Dict[str, Any]:
+    collection = db.get_collection(BENCH_COLLECTION)
+    await collection.drop()
+    # Upsert key ka index (config/indexes.py jaisa)
+    await collection.create_index([("canonicalModel", 1), ("coverType", 1), ("color", 1)])
+    data = build_csv(rows)
+
+    report: Dict[str, Any] = {"rows": rows, "chunk_size": chunk_size}
+    try:
+        report["create"] = await _timed_import(collection, data, chunk_size)
+        report["update"] = await _timed_import(collection, data, chunk_size)
+        if baseline:
+            await collection.delete_many({})
+            report["baseline_row_by_row"] = await _timed_baseline(collection, data)
+    finally:
+        await collection.drop()
+
+    report["ok"] = report["create"]["failed"] == 0 and report["update"]["failed"] == 0
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Catalog import ka throughput (rows/second).")
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+    parser.add_argument("--baseline", action="store_true", help="Row-by-row upsert se bhi compare karo")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_bench(args.rows, args.chunk_size, args.baseline))
+    print(report)
+    sys.exit(0 if report["ok"] else 1)
@@ -0,0 +1,87 @@
+import json
+import os
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+from pydantic import TypeAdapter
+
+from models.cover_model import CoverOut, cover_helper, cover_page_json
+
+# --- Cover List Serialization Microbenchmark ---
+# 1k / 10k / 100k synthetic cover documents ko do tarah JSON banata hai:
+#  - old:  har document par cover_helper() (CoverOut), phir FastAPI ki tarah
+#          response_model=List[CoverOut] se dobara validate + json.dumps
+#  - fast: cover_page_json() - ek baar validate, pydantic-core seedha JSON bytes
+# Har size ka time (ms), speedup aur tracemalloc peak memory (MB) report hota hai.
+#
+# Database ki zaroorat nahi.
+# python -m scripts.bench_cover_serialization            (BENCH_SIZES="1000,10000,100000")
+
+BENCH_SIZES = [int(n) for n in os.getenv("BENCH_SIZES", "1000,10000,100000").split(",")]
+
+_list_adapter = TypeAdapter(List[CoverOut])
+
+
+def _synthetic_doc(i: int) -> Dict[str, Any]:
+    now = datetime.utcnow()
+    return {
+        "_id": f"cover-{i}",
+        "modelName": f"Apple iPhone {10 + i % 6}",
+        "coverType": "Silicone",
+        "color": "Black",
+        "price": 299.0 + i % 100,
+        "stock": i % 50,
+        "imageUrl": f"https://res.cloudinary.com/demo/image/upload/mobile_covers/{i}.jpg",
+        "images": {"width": 1200, "height": 1200, "placeholder": None, "variants": [
+            {"name": name, "url": f"https://res.cloudinary.com/demo/{i}_{name}.webp", "key": f"{i}_{name}",
+             "width": width, "height": width, "format": "webp", "bytes": width * 10}
+            for name, width in (("thumb", 200), ("card", 480), ("full", 1200))
+        ]},
+        "genderPreference": "Unisex",
+        "tags": ["matte", "slim"],
+        "category_ids": ["605c72ef8f0b9f001f7b0e0a"],
+        "is_available": True,
+        "createdAt": now,
+        "updatedAt": now,
+    }
+
+
+def _old_path(docs: List[dict]) -> bytes:
+    covers = [cover_helper(doc) for doc in docs]
+    # FastAPI response_model: dobara validation, phir jsonable + json.dumps
+    validated = _list_adapter.validate_python([cover.model_dump() for cover in covers])
+    return json.dumps(_list_adapter.dump_python(validated, mode="json")).encode("utf-8")
+
+
+def _fast_path(docs: List[dict]) -> bytes:
+    return cover_page_json(docs)
+
+
+def _measure(func: Callable[[List[dict]], bytes], docs: List[dict]) -> Dict[str, float]:
+    # Time aur memory alag runs mein - tracemalloc khud kaafi slow karta hai
+    started = time.perf_counter()
+    func(docs)
+    seconds = time.perf_counter() - started
+    tracemalloc.start()
+    func(docs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"ms": round(seconds * 1000, 1), "peak_mb": round(peak / 1024 / 1024, 1)}
+
+
+def run_bench() -> List[Dict[str, Any]]:
+    rows = []
+    for size in BENCH_SIZES:
+        docs = [_synthetic_doc(i) for i in range(size)]
+        old = _measure(_old_path, docs)
+        fast = _measure(_fast_path, docs)
+        rows.append({"covers": size, "old": old, "fast": fast,
+                     "speedup": round(old["ms"] / fast["ms"], 1) if fast["ms"] else None})
+    return rows
+
+
+if __name__ == "__main__":
+    for row in run_bench():
+        print(row)
@@ -0,0 +1,85 @@
+import asyncio
+import sys
+from typing import Any, Dict, Optional
+
+from pymongo import monitoring
+
+# --- ETag / 304 Check ---
+# GET /api/covers ke conditional requests check karta hai:
+#  1. pehli request 200 + ETag
+#  2. usi ETag ke saath If-None-Match -> 304, aur 'covers' collection par koi query nahi
+#  3. "doosra worker" (naya process jaisa: local version aur data cache khaali) -> wahi ETag,
+#     wahi 304 - validator sab workers mein same hai
+#  4. bump_catalog_version() ke baad purana ETag -> 200 aur naya ETag
+# Commands pymongo ke CommandListener se gine jaate hain.
+#
+# MONGO_URI wala database chahiye (sirf padhta hai; 'catalog_meta' ka version ek baar badalta hai).
+# python -m scripts.bench_etag_304          -> report (exit code 1 agar koi step fail)
+
+
+class CoversCommandCounter(monitoring.CommandListener):
+    """'covers' collection par gaye commands (find / aggregate) ginta hai."""
+
+    def __init__(self):
+        self.count = 0
+
+    def started(self, event):
+        if event.command.get(event.command_name) == "covers":
+            self.count += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+# Listener client banne se pehle register hona chahiye (config.db import par client banta hai)
+counter = CoversCommandCounter()
+monitoring.register(counter)
+
+import utils.cache_helper as cache_helper  # noqa: E402
+from controllers.cover_controller import get_covers  # noqa: E402
+
+
+async def _get(if_none_match: Optional[str] = None) -> Dict[str, Any]:
+    counter.count = 0
+    response = await get_covers(
+        model=None, coverType=None, color=None, minPrice=None, maxPrice=None, gender=None,
+        category_ids=None, admin_mode=False, cursor=None, limit=20, if_none_match=if_none_match
+    )
+    return {"status": response.status_code, "etag": response.headers.get("etag"), "covers_queries": counter.count}
+
+
+def _new_worker() -> None:
+    """Is process ko naye worker jaisa banata hai: version dobara database se, cache khaali."""
+    cache_helper._catalog_version = "0"
+    cache_helper._version_checked_at = float("-inf")
+    cache_helper.catalog_cache.clear()
+
+
+async def run_check() -> Dict[str, Any]:
+    first = await _get()
+    repeat = await _get(first["etag"])
+    _new_worker()
+    other_worker = await _get(first["etag"])
+    await cache_helper.bump_catalog_version()
+    after_write = await _get(first["etag"])
+
+    return {
+        "first": first,
+        "if_none_match": repeat,
+        "other_worker": other_worker,
+        "after_write": after_write,
+        "ok": (first["status"] == 200
+               and repeat["status"] == 304 and repeat["covers_queries"] == 0
+               and other_worker["status"] == 304 and other_worker["covers_queries"] == 0
+               and other_worker["etag"] == first["etag"]
+               and after_write["status"] == 200 and after_write["etag"] != first["etag"]),
+    }
+
+
+if __name__ == "__main__":
+    report = asyncio.run(run_check())
+    print(report)
+    sys.exit(0 if report["ok"] else 1)
@@ -0,0 +1,96 @@
+import argparse
+import io
+import os
+import random
+import sys
+from typing import Any, Dict, List, Tuple
+
+from utils.image_pipeline import PILLOW_AVAILABLE, build_derivatives
+
+# --- Image Derivatives: Bytes Saved ---
+# Sample images par build_derivatives() chalata hai aur har view ke liye bytes compare
+# karta hai: pehle har jagah original download hota tha, ab grid 'card' aur list 'thumb'
+# derivative leti hai. Per image original / thumb / card / full / placeholder bytes, aur
+# total bytes saved (grid + thumb view) report hote hain.
+#
+# Samples: '--dir' ki images (jpg / png / webp), warna synthetic phone-photo jaisi images
+# (gradient + noise, 3000x4000 tak) jo Pillow se banti hain. Pillow chahiye; database nahi.
+# python -m scripts.bench_image_bytes                     -> synthetic samples
+# python -m scripts.bench_image_bytes --dir ./samples     -> apni images
+# (exit code 1 agar card view mein bytes nahi bache)
+
+SAMPLE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+# (width, height) synthetic samples - phone camera / screenshot / chhoti image
+SYNTHETIC_SIZES: List[Tuple[int, int]] = [(3000, 4000), (4032, 3024), (1080, 2400), (1200, 1200), (400, 400)]
+
+
+def _synthetic_samples() -> List[Tuple[str, bytes]]:
+    from PIL import Image
+
+    rng = random.Random(7)
+    samples = []
+    for width, height in SYNTHETIC_SIZES:
+        # Gradient + noise: camera photo jaisa (pure flat color JPEG mein unrealistic chhota hota)
+        gradient = Image.linear_gradient("L").resize((width, height))
+        noise = Image.effect_noise((width, height), 40)
+        img = Image.merge("RGB", (gradient, noise, gradient.rotate(90).resize((width, height))))
+        buffer = io.BytesIO()
+        img.save(buffer, format="JPEG", quality=rng.choice((88, 92, 95)))
+        samples.append((f"synthetic_{width}x{height}.jpg", buffer.getvalue()))
+    return samples
+
+
+def _dir_samples(directory: str) -> List[Tuple[str, bytes]]:
+    samples = []
+    for name in sorted(os.listdir(directory)):
+        if name.lower().endswith(SAMPLE_EXTENSIONS):
+            with open(os.path.join(directory, name), "rb") as f:
+                samples.append((name, f.read()))
+    return samples
+
+
+def measure(samples: List[Tuple[str, bytes]]) -> Dict[str, Any]:
+    rows = []
+    totals = {"original": 0, "thumb": 0, "card": 0, "full": 0}
+    for name, data in samples:
+        processed = build_derivatives(data)
+        if not processed:
+            rows.append({"image": name, "original": len(data), "error": "derivatives nahi bane"})
+            continue
+        sizes = {d["name"]: len(d["data"]) for d in processed["derivatives"]}
+        # Chhoti image: bade derivative skip hote hain, tab agla chhota wala serve hota hai
+        for view in ("thumb", "card", "full"):
+            sizes.setdefault(view, sizes.get("card") or sizes.get("thumb") or len(data))
+        row = {"image": name, "original": len(data), **sizes,
+               "placeholder": len(processed["placeholder"])}
+        rows.append(row)
+        for key in totals:
+            totals[key] += row[key]
+
+    original = totals["original"] or 1
+    return {
+        "images": len(samples),
+        "rows": rows,
+        "totals": totals,
+        "card_saved_bytes": totals["original"] - totals["card"],
+        "card_saved_pct": round(100 * (1 - totals["card"] / original), 1),
+        "thumb_saved_pct": round(100 * (1 - totals["thumb"] / original), 1),
+        "ok": totals["card"] < totals["original"],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Derivatives se kitne bytes bachte hain.")
+    parser.add_argument("--dir", help="Sample images ka folder (default: synthetic)")
+    args = parser.parse_args()
+
+    if not PILLOW_AVAILABLE:
+        print("Pillow install nahi hai - derivatives nahi bante (pip install Pillow).")
+        sys.exit(1)
+    samples = _dir_samples(args.dir) if args.dir else _synthetic_samples()
+    if not samples:
+        print(f"'{args.dir}' mein koi image nahi mili.")
+        sys.exit(1)
+    report = measure(samples)
+    print(report)
+    sys.exit(0 if report["ok"] else 1)
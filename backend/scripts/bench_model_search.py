@@ -0,0 +1,91 @@
+import asyncio
+import os
+import random
+import statistics
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+from config.db import db
+from utils.search_helper import search_fields, build_model_match, build_rank_expression
+
+# --- Model Search Benchmark (regex vs search tokens) ---
+# Scratch collection mein 'BENCH_COVERS' (default 100k) synthetic covers banakar
+# purana unanchored '$regex' path aur naya indexed 'searchTokens' / canonical path
+# dono chalata hai, har query ki p50 / p99 latency (ms) ke saath. Collection end mein drop.
+#
+# MONGO_URI wala database chahiye (asli 'covers' ko nahi chhedta).
+# python -m scripts.bench_model_search
+
+BENCH_COVERS = int(os.getenv("BENCH_COVERS", "100000"))
+BENCH_ROUNDS = int(os.getenv("BENCH_ROUNDS", "20"))
+BENCH_COLLECTION = "bench_model_search_covers"
+
+BRANDS = {
+    "Apple iPhone": [str(n) for n in range(6, 16)],
+    "Samsung Galaxy": [f"{s}{n}" for s in "AMS" for n in range(10, 60)],
+    "Redmi Note": [str(n) for n in range(5, 14)],
+    "OnePlus": [str(n) for n in range(5, 13)],
+    "Vivo": [f"Y{n}" for n in range(10, 40)],
+    "Realme": [str(n) for n in range(5, 12)],
+}
+SUFFIXES = ["", " Pro", " Pro Max", " Plus", " 5G", " Lite"]
+QUERIES = ["iphone 14", "iPhone14", "galaxy a15", "a15", "redmi note 12 pro", "oneplus", "vivo y2"]
+
+
+def _synthetic_cover(i: int, rng: random.Random) -> Dict[str, Any]:
+    brand = rng.choice(list(BRANDS))
+    model = f"{brand} {rng.choice(BRANDS[brand])}{rng.choice(SUFFIXES)}"
+    return {"_id": f"bench-{i}", "modelName": model, "is_available": True,
+            "createdAt": datetime.utcnow(), **search_fields(model)}
+
+
+async def _timed(make_cursor) -> List[float]:
+    latencies = []
+    for _ in range(BENCH_ROUNDS):
+        started = time.perf_counter()
+        await make_cursor().to_list(length=20)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def _summary(latencies: List[float]) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {"p50": round(statistics.median(ordered), 2),
+            "p99": round(ordered[max(0, int(len(ordered) * 0.99) - 1)], 2)}
+
+
+async def run_bench() -> Dict[str, Any]:
+    collection = db.get_collection(BENCH_COLLECTION)
+    await collection.drop()
+    rng = random.Random(42)
+    docs = [_synthetic_cover(i, rng) for i in range(BENCH_COVERS)]
+    for start in range(0, len(docs), 10000):
+        await collection.insert_many(docs[start:start + 10000], ordered=False)
+    # Wahi indexes jo config/indexes.py covers par banata hai
+    await collection.create_index([("searchTokens", 1)])
+    await collection.create_index([("canonicalModel", 1), ("is_available", 1)])
+    await collection.create_index([("is_available", 1), ("createdAt", -1), ("_id", -1)])
+
+    results = {}
+    try:
+        for query in QUERIES:
+            regex = await _timed(lambda: collection.find(
+                {"is_available": True, "modelName": {"$regex": query, "$options": "i"}}
+            ).sort([("createdAt", -1), ("_id", -1)]).limit(20))
+            indexed = await _timed(lambda: collection.aggregate([
+                {"$match": {"is_available": True, **build_model_match(query)}},
+                {"$addFields": {"_rank": build_rank_expression(query)}},
+                {"$sort": {"_rank": 1, "createdAt": -1, "_id": -1}},
+                {"$limit": 20},
+            ]))
+            results[query] = {"regex_ms": _summary(regex), "indexed_ms": _summary(indexed)}
+    finally:
+        await collection.drop()
+    return {"covers": BENCH_COVERS, "rounds": BENCH_ROUNDS, "queries": results}
+
+
+if __name__ == "__main__":
+    report = asyncio.run(run_bench())
+    for query, row in report["queries"].items():
+        print(f"{query!r:24} regex {row['regex_ms']}  indexed {row['indexed_ms']}")
@@ -0,0 +1,68 @@
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from typing import Any, Dict
+
+from utils.rate_limiter import MemoryBackend, MongoBackend, RateLimit, RateLimitBackend
+
+# --- Rate Limiter Concurrent Load Check ---
+# Ek hi key par 'requests' hits ek saath (asyncio.gather) bhejta hai aur check karta hai
+# ki exactly 'burst' hits allow hue - koi race extra request nahi nikaal paati. Saath mein
+# bahut saari alag keys par throughput (hits/second) naapta hai.
+#
+# python -m scripts.bench_rate_limiter                  -> memory backend
+# python -m scripts.bench_rate_limiter --backend mongo  -> MONGO_URI wala 'rate_limits'
+#                                                          collection (bench keys baad mein hatti hain)
+
+LIMIT = RateLimit(5, 300)
+
+
+async def run_bench(backend: RateLimitBackend, requests: int, keys: int) -> Dict[str, Any]:
+    prefix = f"bench:{uuid.uuid4().hex[:8]}"
+    now = time.time()
+
+    # 1. Ek key par concurrent hits: sirf 'burst' allow hone chahiye
+    results = await asyncio.gather(*(
+        backend.hit(f"{prefix}:same", LIMIT, now) for _ in range(requests)
+    ))
+    allowed = sum(1 for ok, _ in results if ok)
+
+    # 2. Alag-alag keys par throughput
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        backend.hit(f"{prefix}:key{i}", LIMIT, time.time()) for i in range(keys)
+    ))
+    seconds = time.perf_counter() - started
+
+    if isinstance(backend, MongoBackend):
+        await backend.collection.delete_many({"_id": {"$regex": f"^{prefix}:"}})
+
+    return {
+        "backend": backend.name,
+        "concurrent_hits": requests,
+        "allowed": allowed,
+        "expected_allowed": LIMIT.requests,
+        "keys": keys,
+        "hits_per_second": round(keys / seconds) if seconds else None,
+        "ok": allowed == LIMIT.requests,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rate limiter ka concurrent load check.")
+    parser.add_argument("--backend", choices=["memory", "mongo"], default="memory")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--keys", type=int, default=5000)
+    args = parser.parse_args()
+
+    if args.backend == "mongo":
+        from config.db import db
+        selected: RateLimitBackend = MongoBackend(db.get_collection("rate_limits"))
+    else:
+        selected = MemoryBackend()
+
+    report = asyncio.run(run_bench(selected, args.requests, args.keys))
+    print(report)
+    sys.exit(0 if report["ok"] else 1)
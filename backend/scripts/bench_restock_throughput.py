@@ -0,0 +1,75 @@
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from config.db import db
+from utils.restock_worker import Dispatcher, RestockWorker, RESTOCK_BATCH_SIZE
+
+# --- Restock Fan-out Throughput ---
+# Ek scratch collection mein ek hi model ke 'BENCH_NOTIFICATIONS' (default 100k) Pending
+# notifications daal kar worker ka 'process_model' chalata hai aur messages/second
+# naapta hai. Dispatcher sirf ginti karta hai (network nahi) aur rate limit band hai,
+# isliye yeh sirf Mongo read + update ka kharcha hai. Collection end mein drop hoti hai.
+#
+# MONGO_URI wala database chahiye (asli 'notifications' ko nahi chhedta).
+# python -m scripts.bench_restock_throughput
+
+BENCH_NOTIFICATIONS = int(os.getenv("BENCH_NOTIFICATIONS", "100000"))
+BENCH_COLLECTION = "bench_restock_notifications"
+BENCH_MODEL = "bench phone 1"
+
+
+class CountingDispatcher(Dispatcher):
+    name = "count"
+
+    def __init__(self):
+        self.sent = 0
+
+    async def send(self, model_key: str, notifications: List[Dict[str, Any]]) -> None:
+        self.sent += len(notifications)
+
+
+async def run_bench() -> Dict[str, Any]:
+    collection = db.get_collection(BENCH_COLLECTION)
+    await collection.drop()
+    # Worker ki query ka index (config/indexes.py jaisa)
+    await collection.create_index([("canonicalModel", 1), ("status", 1), ("createdAt", -1)])
+
+    now = datetime.utcnow()
+    docs = [
+        {"_id": f"bench-{i}", "phone": f"9{i:09d}", "modelName": "Bench Phone 1",
+         "canonicalModel": BENCH_MODEL, "status": "Pending", "createdAt": now - timedelta(seconds=i)}
+        for i in range(BENCH_NOTIFICATIONS)
+    ]
+    for start in range(0, len(docs), 10000):
+        await collection.insert_many(docs[start:start + 10000], ordered=False)
+
+    dispatcher = CountingDispatcher()
+    worker = RestockWorker(dispatcher, rate_per_second=0)
+    worker.collection = collection
+    try:
+        started = time.perf_counter()
+        total = await worker.process_model(BENCH_MODEL)
+        seconds = time.perf_counter() - started
+        left = await collection.count_documents({"status": "Pending"})
+    finally:
+        await collection.drop()
+
+    return {
+        "notifications": BENCH_NOTIFICATIONS,
+        "batch_size": RESTOCK_BATCH_SIZE,
+        "dispatched": total,
+        "still_pending": left,
+        "seconds": round(seconds, 2),
+        "per_second": round(total / seconds) if seconds else None,
+        "ok": total == BENCH_NOTIFICATIONS and dispatcher.sent == total and left == 0,
+    }
+
+
+if __name__ == "__main__":
+    report = asyncio.run(run_bench())
+    print(report)
+    sys.exit(0 if report["ok"] else 1)
@@ -0,0 +1,70 @@
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+
+from utils.suggest_index import ModelSuggestIndex
+
+# --- Typeahead Suggest Benchmark ---
+# 'BENCH_MODELS' (default 50k) distinct synthetic model names se ModelSuggestIndex
+# banata hai aur har keystroke jaise prefixes ("i", "ip", "iph", ...) par 'suggest()'
+# ki server-side latency (microseconds) naapta hai. Target: p99 < 1 ms.
+#
+# Database ki zaroorat nahi.
+# python -m scripts.bench_suggest          -> report (exit code 1 agar p99 >= 1 ms)
+
+BENCH_MODELS = int(os.getenv("BENCH_MODELS", "50000"))
+BENCH_LOOKUPS = int(os.getenv("BENCH_LOOKUPS", "20000"))
+
+BRANDS = ["Apple iPhone", "Samsung Galaxy", "Redmi Note", "OnePlus", "Vivo", "Oppo",
+          "Realme", "Motorola Moto", "Nokia", "Infinix Hot", "Tecno Spark", "Google Pixel"]
+SUFFIXES = ["", "Pro", "Pro Max", "Plus", "5G", "Lite", "Ultra", "Neo", "Prime", "Mini"]
+
+
+def _model_names(count: int, rng: random.Random) -> List[str]:
+    names = set()
+    while len(names) < count:
+        series = f"{rng.choice('ACFJMSXYZ')}{rng.randint(1, 999)}"
+        names.add(f"{rng.choice(BRANDS)} {series} {rng.choice(SUFFIXES)}".strip())
+    return sorted(names)
+
+
+def run_bench() -> Dict[str, Any]:
+    rng = random.Random(7)
+    names = _model_names(BENCH_MODELS, rng)
+    index = ModelSuggestIndex()
+    started = time.perf_counter()
+    for name in names:
+        index.add(name, rng.randint(1, 20))
+    build_ms = (time.perf_counter() - started) * 1000
+
+    # Typing jaise prefixes: kisi naam ke pehle 1..8 characters
+    prefixes = []
+    for _ in range(BENCH_LOOKUPS):
+        name = rng.choice(names)
+        prefixes.append(name[:rng.randint(1, 8)])
+
+    latencies = []
+    for prefix in prefixes:
+        t0 = time.perf_counter()
+        index.suggest(prefix, limit=8)
+        latencies.append((time.perf_counter() - t0) * 1_000_000)
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    return {
+        "models": len(index),
+        "build_ms": round(build_ms, 1),
+        "lookups": len(latencies),
+        "p50_us": round(statistics.median(latencies), 1),
+        "p99_us": round(p99, 1),
+        "max_us": round(latencies[-1], 1),
+        "ok": p99 < 1000,
+    }
+
+
+if __name__ == "__main__":
+    report = run_bench()
+    print(report)
+    sys.exit(0 if report["ok"] else 1)
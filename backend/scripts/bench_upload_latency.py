@@ -0,0 +1,90 @@
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import utils.upload_helper as upload_helper
+from utils.storage import StorageBackend
+
+# --- Upload Latency Check ---
+# Check karta hai ki uploads chalne ke dauraan baaki requests (jaise GET /api/covers)
+# slow nahi hoti. Ek slow storage backend (har upload 'BENCH_UPLOAD_SECONDS' tak
+# thread ko block karta hai, jaise Cloudinary SDK) ke saath 'BENCH_UPLOADS' uploads ek
+# saath chalte hain, aur is beech event loop ki latency (ek GET handler ko CPU milne
+# mein kitni der lagi) naapi jaati hai. Baseline (bina uploads) se compare hota hai.
+#
+# Database / Cloudinary ki zaroorat nahi.
+# python -m scripts.bench_upload_latency          -> report (exit code 1 agar latency badhi)
+
+BENCH_UPLOADS = int(os.getenv("BENCH_UPLOADS", "20"))
+BENCH_UPLOAD_SECONDS = float(os.getenv("BENCH_UPLOAD_SECONDS", "0.5"))
+# Kitne "GET" samples (har sample ek chhota await hai)
+BENCH_SAMPLES = int(os.getenv("BENCH_SAMPLES", "200"))
+# Load mein p95 latency baseline se itne ms se zyada badhe to fail
+BENCH_MAX_EXTRA_MS = float(os.getenv("BENCH_MAX_EXTRA_MS", "20"))
+
+
+class SlowStorage(StorageBackend):
+    """Network upload jaisa: thread ko block karta hai, kuch store nahi karta."""
+
+    name = "bench"
+
+    def upload(self, data: bytes, filename: str, content_type: Optional[str] = None,
+               timeout: Optional[float] = None) -> Dict[str, Any]:
+        time.sleep(BENCH_UPLOAD_SECONDS)
+        return {"url": f"bench://{filename}", "key": f"bench/{filename}", "bytes": len(data)}
+
+    def delete(self, key: str) -> None:
+        pass
+
+
+async def _sample_latency(samples: int) -> List[float]:
+    """Har sample: 1ms ka sleep kitni der mein wapas aaya (ms). Loop block ho to yeh badhta hai."""
+    latencies = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        await asyncio.sleep(0.001)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def _summary(latencies: List[float]) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "p50": round(statistics.median(ordered), 2),
+        "p95": round(ordered[int(len(ordered) * 0.95) - 1], 2),
+        "max": round(ordered[-1], 2),
+    }
+
+
+async def run_bench() -> Dict[str, Any]:
+    storage = SlowStorage()
+    upload_helper.get_storage = lambda: storage
+
+    baseline = _summary(await _sample_latency(BENCH_SAMPLES))
+
+    payload = os.urandom(64 * 1024)
+    started = time.perf_counter()
+    uploads = asyncio.gather(*(
+        upload_helper.store_bytes(payload, f"bench_{i}.jpg", "image/jpeg") for i in range(BENCH_UPLOADS)
+    ))
+    loaded = _summary(await _sample_latency(BENCH_SAMPLES))
+    await uploads
+    upload_seconds = round(time.perf_counter() - started, 2)
+
+    return {
+        "uploads": BENCH_UPLOADS,
+        "upload_concurrency": upload_helper.UPLOAD_CONCURRENCY,
+        "uploads_total_seconds": upload_seconds,
+        "baseline_ms": baseline,
+        "with_uploads_ms": loaded,
+        "ok": loaded["p95"] <= baseline["p95"] + BENCH_MAX_EXTRA_MS,
+    }
+
+
+if __name__ == "__main__":
+    report = asyncio.run(run_bench())
+    print(report)
+    sys.exit(0 if report["ok"] else 1)
@@ -0,0 +1,152 @@
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+
+from pymongo import monitoring
+
+# --- Write Round-trips + Latency (add_cover / update_cover) ---
+# Har create/update ke liye database ke kitne commands gaye aur kitna time laga:
+#  - before: purana flow - insert_one + find_one, update_one + find_one (read-after-write)
+#  - after:  asli handlers - add_cover (insert, response usi document se) aur
+#            update_cover (find_one_and_update, ek hi round-trip)
+# Commands pymongo ke CommandListener se gine jaate hain (sirf scratch collection ke).
+# Image upload is script mein nahi hota (fixed image result), stock 0 hai taaki restock
+# worker kuch na kare. Collection end mein drop.
+#
+# MONGO_URI wala database chahiye (asli 'covers' ko nahi chhedta).
+# python -m scripts.bench_write_roundtrips          -> report (exit code 1 agar after > 1 round-trip)
+
+BENCH_WRITES = int(os.getenv("BENCH_WRITES", "500"))
+BENCH_COLLECTION = "bench_write_covers"
+
+
+class CommandCounter(monitoring.CommandListener):
+    """Scratch collection par gaye commands ginta hai (insert, find, update, findAndModify...)."""
+
+    def __init__(self):
+        self.count = 0
+
+    def started(self, event):
+        if event.command.get(event.command_name) == BENCH_COLLECTION:
+            self.count += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+# Listener client banne se pehle register hona chahiye (config.db import par client banta hai)
+counter = CommandCounter()
+monitoring.register(counter)
+
+from config.db import db  # noqa: E402
+import controllers.cover_controller as cover_controller  # noqa: E402
+from models.cover_model import cover_helper  # noqa: E402
+
+BENCH_IMAGE = {
+    "imageUrl": "https://res.cloudinary.com/demo/image/upload/mobile_covers/bench.jpg",
+    "imageKey": "mobile_covers/bench",
+    "images": None,
+    "imageHash": None,
+}
+
+
+async def _fixed_upload(image) -> Dict[str, Any]:
+    return dict(BENCH_IMAGE)
+
+
+def _cover_fields(i: int) -> Dict[str, Any]:
+    return {"modelName": f"Bench Phone {i % 50}", "coverType": "Silicone", "color": "Black",
+            "price": 299.0 + i, "stock": 0, "category_ids": "[]", "genderPreference": "Unisex",
+            "tags": "[]", "is_available": True}
+
+
+async def _old_create(collection, i: int) -> None:
+    fields = _cover_fields(i)
+    insert_data = cover_controller.build_cover_document(
+        modelName=fields["modelName"], coverType=fields["coverType"], color=fields["color"],
+        price=fields["price"], stock=fields["stock"], image=BENCH_IMAGE,
+        genderPreference=fields["genderPreference"], tags=[], category_ids=[],
+        is_available=True
+    )
+    result = await collection.insert_one(insert_data)
+    created = await collection.find_one({"_id": result.inserted_id})
+    cover_helper(created)
+
+
+async def _old_update(collection, cover_id: str, i: int) -> None:
+    await collection.update_one({"_id": cover_id}, {"$set": {"price": 399.0 + i}})
+    updated = await collection.find_one({"_id": cover_id})
+    cover_helper(updated)
+
+
+async def _new_create(collection, i: int) -> None:
+    await cover_controller.add_cover(image=None, **_cover_fields(i))
+
+
+async def _new_update(collection, cover_id: str, i: int) -> None:
+    await cover_controller.update_cover(id=cover_id, update_data=cover_controller.CoverUpdate(price=399.0 + i))
+
+
+async def _seed_update_targets(collection) -> List[str]:
+    # Update ke liye string '_id' wale covers (handlers '_id' ko string ki tarah dhoondhte hain)
+    docs = []
+    for i in range(BENCH_WRITES):
+        doc = cover_controller.build_cover_document(
+            modelName=f"Bench Phone {i % 50}", coverType="Silicone", color="Black", price=299.0,
+            stock=0, image=BENCH_IMAGE, genderPreference="Unisex", tags=[], category_ids=[],
+            is_available=True
+        )
+        doc["_id"] = f"bench-{i}"
+        docs.append(doc)
+    await collection.insert_many(docs)
+    return [doc["_id"] for doc in docs]
+
+
+async def _timed(func, args_list: List[tuple]) -> Dict[str, Any]:
+    counter.count = 0
+    latencies = []
+    for args in args_list:
+        started = time.perf_counter()
+        await func(*args)
+        latencies.append((time.perf_counter() - started) * 1000)
+    ordered = sorted(latencies)
+    return {
+        "round_trips": round(counter.count / len(args_list), 2),
+        "p50_ms": round(statistics.median(ordered), 2),
+        "p99_ms": round(ordered[max(0, int(len(ordered) * 0.99) - 1)], 2),
+    }
+
+
+async def run_bench() -> Dict[str, Any]:
+    collection = db.get_collection(BENCH_COLLECTION)
+    await collection.drop()
+    cover_controller.collection = collection
+    cover_controller.upload_cover_image = _fixed_upload
+
+    report = {}
+    try:
+        for label, create, update in (("before", _old_create, _old_update), ("after", _new_create, _new_update)):
+            created = await _timed(create, [(collection, i) for i in range(BENCH_WRITES)])
+            targets = await _seed_update_targets(collection)
+            updated = await _timed(update, [(collection, cover_id, i) for i, cover_id in enumerate(targets)])
+            report[label] = {"create": created, "update": updated}
+            await collection.delete_many({})
+    finally:
+        await collection.drop()
+
+    after = report["after"]
+    report["writes"] = BENCH_WRITES
+    report["ok"] = after["create"]["round_trips"] <= 1 and after["update"]["round_trips"] <= 1
+    return report
+
+
+if __name__ == "__main__":
+    report = asyncio.run(run_bench())
+    print(report)
+    sys.exit(0 if report["ok"] else 1)
@@ -49,6 +49,14 @@ def format_price(price):
     """Format price to ₹XX.XX"""
     return f"₹{price:,.2f}"
 
+def cover_image_url(cover, name="card"):
+    """Grid ke liye chhota derivative (agar hai), warna original image URL."""
+    variants = (cover.get("images") or {}).get("variants") or []
+    for variant in variants:
+        if variant["name"] == name:
+            return variant["url"]
+    return variants[-1]["url"] if variants else cover["imageUrl"]
+
 def validate_phone(phone):
     """Simple 10-digit phone number validation."""
     return re.match(r"^\d{10}$", phone)
@@ -79,6 +87,15 @@ def show_order_form(model_name: str):
                         notify_response = requests.post(NOTIFY_API_URL + "/", json=payload, timeout=10)
                         if notify_response.status_code == 201:
                             st.success("Aapki request save ho gayi hai! Hum jald hi call karenge.", icon="✅")
+                        elif notify_response.status_code == 200:
+                            # Isi phone + model ki request pehle se khuli hai - nayi copy nahi bani
+                            st.success("Aapki request pehle se save hai! Hum jald hi call karenge.", icon="✅")
+                        elif notify_response.status_code == 429:
+                            wait = notify_response.headers.get("Retry-After")
+                            st.warning(
+                                f"Bahut saari requests aa gayi hain. {wait + ' second' if wait else 'Thodi der'} baad dobara try karein.",
+                                icon="⏳"
+                            )
                         else:
                             st.error(f"Request fail ho gayi: {notify_response.text}", icon="❌")
                     except Exception as e:
@@ -151,7 +168,7 @@ else:
                     response = requests.get(COVERS_API_URL + "/", params=params, timeout=10) # Timeout add kiya
                 
                 if response.status_code == 200:
-                    covers = response.json()
+                    covers = response.json().get("items", []) # API ab { items, next_cursor } bhejta hai
                     
                     if covers:
                         st.success(f"Aapke model ke liye humein {len(covers)} cover(s) mile!")
@@ -160,7 +177,7 @@ else:
                         for i, cover in enumerate(covers):
                             with cols[i % 4]:
                                 with st.container(border=True):
-                                    st.image(cover['imageUrl'], use_column_width=True)
+                                    st.image(cover_image_url(cover), use_column_width=True)
                                     st.subheader(cover['modelName'])
                                     st.text(f"{cover['coverType']} | {cover['color']}")
                                     st.markdown(f"**{format_price(cover['price'])}**")
@@ -12,6 +12,9 @@ API_BASE_URL = "http://127.0.0.1:8000/api"
 COVERS_API_URL = f"{API_BASE_URL}/covers"
 NOTIFY_API_URL = f"{API_BASE_URL}/notify"
 CATEGORY_API_URL = f"{API_BASE_URL}/categories"
+EXPORT_API_URL = f"{API_BASE_URL}/admin/export"
+# Preview mein kitni rows (poora data CSV download se)
+PREVIEW_ROWS = 100
 
 # --- API Check (Updated with timeout) ---
 @st.cache_data(ttl=5) # 5 second ke liye cache karega
@@ -42,6 +45,15 @@ def fetch_categories():
         st.error(f"Categories fetch karte waqt error: {e}")
         return []
 
+# --- Helper Function: Responsive Image ---
+def cover_image_url(cover, name="card"):
+    """Grid ke liye chhota derivative (agar hai), warna original image URL."""
+    variants = (cover.get("images") or {}).get("variants") or []
+    for variant in variants:
+        if variant["name"] == name:
+            return variant["url"]
+    return variants[-1]["url"] if variants else cover["imageUrl"]
+
 # --- Helper Function: 5-Minute Rule ---
 def is_editable(created_at_str: str) -> bool:
     """Check karta hai ki item 5 minute se kam purana hai ya nahi."""
@@ -116,7 +128,7 @@ with tab1:
                 response = requests.get(COVERS_API_URL + "/", params=params, timeout=10)
             
             if response.status_code == 200:
-                covers = response.json()
+                covers = response.json().get("items", []) # API ab { items, next_cursor } bhejta hai
                 st.success(f"Successfully fetched {len(covers)} cover(s)!")
                 
                 if not covers:
@@ -128,7 +140,7 @@ with tab1:
                         col1, col2, col3 = st.columns([1, 2, 1])
                         
                         with col1:
-                            st.image(cover['imageUrl'], use_column_width=True)
+                            st.image(cover_image_url(cover, "thumb"), use_column_width=True)
                         
                         with col2:
                             st.subheader(cover['modelName'])
@@ -351,25 +363,64 @@ with tab4:
     st.info("Yeh woh log hain jinhein unka model nahi mila aur unhonne 'Notify Me' request ki hai.")
     
     with st.container(border=True):
-        refresh_button = st.button("Refresh Pending List")
+        col_status, col_from, col_to = st.columns(3)
+        with col_status:
+            status_choice = st.multiselect(
+                "Status", ["Pending", "In Progress", "Completed", "Cancelled"], default=["Pending"]
+            )
+        with col_from:
+            from_date = st.date_input("From", value=None)
+        with col_to:
+            to_date = st.date_input("To", value=None)
+
+        # Filters server par lagte hain (GET /api/admin/export/notifications)
+        export_params = {"status": status_choice}
+        if from_date:
+            export_params["date_from"] = datetime.combine(from_date, datetime.min.time()).isoformat()
+        if to_date:
+            export_params["date_to"] = datetime.combine(to_date, datetime.max.time()).isoformat()
+        csv_url = requests.Request(
+            "GET", f"{EXPORT_API_URL}/notifications", params={**export_params, "format": "csv"}
+        ).prepare().url
+        st.link_button("⬇️ Download CSV (saare matching requests)", csv_url)
+
+        refresh_button = st.button("Refresh List")
         
         if refresh_button:
             try:
-                with st.spinner("Pending requests fetch kar raha hai..."):
-                    response = requests.get(NOTIFY_API_URL + "/", timeout=10)
+                with st.spinner("Requests fetch kar raha hai..."):
+                    # NDJSON stream: sirf pehli PREVIEW_ROWS lines padhte hain, baaki download se
+                    requests_data = []
+                    error_text = None
+                    with requests.get(
+                        f"{EXPORT_API_URL}/notifications",
+                        params={**export_params, "format": "ndjson"},
+                        stream=True,
+                        timeout=10
+                    ) as response:
+                        if response.status_code == 200:
+                            for line in response.iter_lines():
+                                if line:
+                                    requests_data.append(json.loads(line))
+                                if len(requests_data) >= PREVIEW_ROWS:
+                                    break
+                        else:
+                            error_text = response.text
                 if response.status_code == 200:
-                    requests_data = response.json()
-                    st.success(f"Total {len(requests_data)} pending request(s) mili.", icon="📈")
+                    if len(requests_data) >= PREVIEW_ROWS:
+                        st.caption(f"Sabse naye {PREVIEW_ROWS} dikhaye ja rahe hain. Poori list CSV download mein hai.")
+                    else:
+                        st.success(f"Total {len(requests_data)} request(s) mili.", icon="📈")
                     
                     if requests_data:
                         df = pd.DataFrame(requests_data)
-                        df_display = df[["phone", "modelName", "createdAt"]]
+                        df_display = df[["phone", "modelName", "status", "createdAt"]]
                         df_display["createdAt"] = pd.to_datetime(df_display["createdAt"]).dt.strftime('%Y-%m-%d %H:%M')
                         st.dataframe(df_display, use_container_width=True)
                     else:
-                        st.info("Koi pending notification request nahi hai.")
+                        st.info("In filters ke saath koi request nahi hai.")
                 else:
                     st.error(f"Error from API: {response.status_code}", icon="❌")
-                    st.json(response.text)
+                    st.json(error_text)
             except Exception as e:
                 st.error(f"Request fail ho gayi: {e}")
\ No newline at end of file
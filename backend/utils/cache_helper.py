@@ -0,0 +1,184 @@
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from bson import ObjectId
+
+from config.db import catalog_meta_collection
+
+# --- In-Process Cache ---
+# Baar-baar mangne wale responses (catalog search, categories, admin stats) ko
+# memory mein rakhta hai taaki har request par database na chale.
+# Entries TTL ke baad expire hoti hain, aur 'maxsize' se zyada hone par sabse
+# purani (least recently used) entry nikaal di jaati hai.
+
+
+class TTLCache:
+    """TTL + size (LRU) eviction wala cache, hit/miss metrics ke saath."""
+
+    def __init__(self, ttl: float, maxsize: Optional[int] = None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._store: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._store.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._store.pop(key, None)
+            self.misses += 1
+            return None
+        self._store.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._store[key] = (time.monotonic() + self.ttl, value)
+        self._store.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self._store) > self.maxsize:
+                self._store.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        self._store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache metrics (admin monitoring ke liye)."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._store),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# --- Catalog Cache (write-through invalidation) ---
+# Catalog (covers + categories) tabhi badalta hai jab admin koi write endpoint
+# chalata hai. Har write 'bump_catalog_version()' call karta hai; cache keys mein
+# version shaamil hai, isliye purani entries apne aap unreachable ho jaati hain.
+# Version database mein hai ('catalog_meta'), isliye saare workers ka ek hi version hai:
+# likhne wala worker turant naya version dekhta hai, baaki 'sync_catalog_version()' se
+# zyada se zyada CATALOG_VERSION_POLL_SECONDS mein.
+
+CATALOG_CACHE_TTL = float(os.getenv("CATALOG_CACHE_TTL", "60"))
+CATALOG_CACHE_SIZE = int(os.getenv("CATALOG_CACHE_SIZE", "1024"))
+CATALOG_VERSION_POLL_SECONDS = float(os.getenv("CATALOG_VERSION_POLL_SECONDS", "2"))
+
+CATALOG_META_ID = "catalog"
+
+catalog_cache = TTLCache(ttl=CATALOG_CACHE_TTL, maxsize=CATALOG_CACHE_SIZE)
+_catalog_version = "0"
+_version_checked_at = float("-inf")
+
+
+def get_catalog_version() -> str:
+    return _catalog_version
+
+
+async def sync_catalog_version() -> str:
+    """
+    Catalog GET handlers ki shuruaat mein call karein. Shared version database se padhta
+    hai, par har CATALOG_VERSION_POLL_SECONDS mein zyada se zyada ek baar (ek '_id' lookup);
+    beech ki requests (aur 304) database tak nahi jaatin.
+    """
+    global _catalog_version, _version_checked_at
+    now = time.monotonic()
+    if now - _version_checked_at < CATALOG_VERSION_POLL_SECONDS:
+        return _catalog_version
+    _version_checked_at = now
+    try:
+        doc = await catalog_meta_collection.find_one({"_id": CATALOG_META_ID}, {"version": 1})
+        if doc is None:
+            # Pehli baar: version ek hi baar banta hai, baaki workers wahi padhte hain
+            await catalog_meta_collection.update_one(
+                {"_id": CATALOG_META_ID},
+                {"$setOnInsert": {"version": str(ObjectId()), "updatedAt": datetime.utcnow()}},
+                upsert=True
+            )
+            doc = await catalog_meta_collection.find_one({"_id": CATALOG_META_ID}, {"version": 1})
+        _catalog_version = doc["version"]
+    except Exception as e:
+        # Database na mile to pichla version hi chalta rahe
+        print(f"[Cache] Catalog version read error: {e}")
+    return _catalog_version
+
+
+async def bump_catalog_version() -> str:
+    """Catalog badalne par call karein. Saari cached catalog entries (sab workers mein) invalid ho jaati hain."""
+    global _catalog_version, _version_checked_at
+    # Har bump ek naya unique token - database reset ke baad bhi purane ETags match nahi honge
+    version = str(ObjectId())
+    _catalog_version = version
+    _version_checked_at = time.monotonic()
+    try:
+        await catalog_meta_collection.update_one(
+            {"_id": CATALOG_META_ID},
+            {"$set": {"version": version, "updatedAt": datetime.utcnow()}},
+            upsert=True
+        )
+    except Exception as e:
+        # Yeh worker naya version dekh chuka hai; baaki workers ke liye TTL ki hadd
+        print(f"[Cache] Catalog version write error: {e}")
+    return version
+
+
+def _normalize(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple, set)):
+        return tuple(sorted({str(v).strip() for v in value if str(v).strip()}))
+    if isinstance(value, str):
+        return value.strip()
+    return value
+
+
+def catalog_cache_key(namespace: str, **params: Any) -> Tuple:
+    """
+    Normalized filter set se cache key banata hai. Lists ka order, khaali values
+    aur extra spaces key ko nahi badalte.
+    """
+    items = tuple(sorted(
+        (name, _normalize(value))
+        for name, value in params.items()
+        if value not in (None, "", [], ())
+    ))
+    return (namespace, get_catalog_version(), items)
+
+
+# --- HTTP Conditional Requests (ETag / If-None-Match) ---
+# ETag shared catalog version + normalized query (yaani cache key) se banta hai. Same
+# catalog aur same filters par har worker (aur restart ke baad bhi) wahi ETag deta hai,
+# isliye browser / CDN ka If-None-Match kisi bhi worker par 304 paata hai. ETag tabhi
+# badalta hai jab catalog badalta hai.
+
+# CDN / browser ke liye Cache-Control values
+PUBLIC_CATALOG_CACHE_CONTROL = os.getenv(
+    "CATALOG_CACHE_CONTROL", "public, max-age=30, stale-while-revalidate=60"
+)
+ADMIN_CATALOG_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(cache_key: Tuple) -> str:
+    """Cache key (jismein catalog version hai) se ek strong ETag banata hai."""
+    digest = hashlib.sha1(repr(cache_key).encode("utf-8")).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """'If-None-Match' header mein diya gaya ETag (ya '*') match karta hai ya nahi."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
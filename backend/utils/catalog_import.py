@@ -0,0 +1,403 @@
+import argparse
+import asyncio
+import codecs
+import csv
+import json
+import mimetypes
+import os
+import sys
+import zipfile
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from bson import ObjectId
+from pydantic import HttpUrl, TypeAdapter, ValidationError
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from models.cover_model import CoverBase
+from utils.search_helper import search_fields
+from utils.upload_helper import store_cover_image_bytes
+from utils.image_store import release_image, release_cover_image
+from utils.restock_worker import restock_worker, stock_raised
+from utils.cache_helper import bump_catalog_version
+from utils.suggest_index import suggest_index
+
+try:
+    import openpyxl
+    OPENPYXL_AVAILABLE = True
+except ImportError: # pragma: no cover - sirf XLSX import ke liye chahiye
+    openpyxl = None
+    OPENPYXL_AVAILABLE = False
+
+# --- Bulk Catalog Import (CSV / XLSX) ---
+# Supplier ki poori range ek file se: har row ek cover (model + type + colour).
+# File row-by-row stream hoti hai (poori memory mein nahi), rows 'CoverBase' se
+# validate hoti hain aur chunks mein ordered 'bulk_write' upserts se likhi jaati hain.
+# Upsert ki key (canonicalModel, coverType, color) hai - wahi file dobara chalane par
+# naye covers nahi bante, purane update hote hain.
+#
+# Image column mein ya to http(s) URL hota hai (seedha imageUrl ban jaata hai) ya saath
+# aayi zip file ke andar ki file ka naam (content-hash registry se upload hoti hai).
+# Existing cover ki row mein image khaali ho to purani image rehti hai.
+#
+# Columns: modelName, coverType, color, price, stock, genderPreference, tags,
+# category_ids, is_available, image. 'tags' / 'category_ids' JSON list ya "a|b" hain.
+
+# Ek bulk_write mein kitni rows
+IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", "1000"))
+# Report mein zyada se zyada kitne row errors
+MAX_REPORTED_ERRORS = 1000
+
+_http_url = TypeAdapter(HttpUrl)
+
+# Existing covers ke yeh fields chahiye: restock check aur purani image release ke liye
+_EXISTING_PROJECTION = {
+    "canonicalModel": 1, "coverType": 1, "color": 1, "stock": 1, "is_available": 1,
+    "imageUrl": 1, "imageHash": 1, "imageKey": 1, "images.variants": 1,
+}
+
+
+class CatalogImportError(ValueError):
+    """File format hi galat hai (row-level errors report mein jaate hain)."""
+
+
+# --- Row Readers (synchronous; worker thread mein chalte hain) ---
+
+def iter_csv_rows(binary_file) -> Iterator[Dict[str, Any]]:
+    """CSV ko line-by-line padhta hai (Excel ka UTF-8 BOM bhi chalega)."""
+    yield from csv.DictReader(codecs.iterdecode(binary_file, "utf-8-sig"))
+
+
+def iter_xlsx_rows(binary_file) -> Iterator[Dict[str, Any]]:
+    """XLSX ki pehli sheet read-only (streaming) mode mein padhta hai."""
+    if not OPENPYXL_AVAILABLE:
+        raise CatalogImportError("XLSX import ke liye 'openpyxl' install karein (ya CSV bhejein).")
+    workbook = openpyxl.load_workbook(binary_file, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = [str(cell).strip() if cell is not None else "" for cell in next(rows, ())]
+        for values in rows:
+            if all(value is None for value in values):
+                continue
+            yield {name: value for name, value in zip(header, values) if name}
+    finally:
+        workbook.close()
+
+
+def iter_catalog_rows(binary_file, filename: str) -> Iterator[Dict[str, Any]]:
+    ext = os.path.splitext(filename or "")[1].lower()
+    if ext == ".csv":
+        return iter_csv_rows(binary_file)
+    if ext in (".xlsx", ".xlsm"):
+        return iter_xlsx_rows(binary_file)
+    raise CatalogImportError(f"'{ext or filename}' file support nahi hai. CSV ya XLSX bhejein.")
+
+
+def _next_rows(rows: Iterator[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= count:
+            break
+    return batch
+
+
+class ZipImages:
+    """Import ke saath aayi zip: image ko path ya sirf file naam se dhoondhta hai."""
+
+    def __init__(self, binary_file):
+        try:
+            self.archive = zipfile.ZipFile(binary_file)
+        except zipfile.BadZipFile as e:
+            raise CatalogImportError(f"Images zip padh nahi paaye: {e}")
+        self.entries: Dict[str, zipfile.ZipInfo] = {}
+        for info in self.archive.infolist():
+            if info.is_dir():
+                continue
+            self.entries.setdefault(info.filename.lower(), info)
+            self.entries.setdefault(os.path.basename(info.filename).lower(), info)
+
+    def read(self, name: str) -> bytes:
+        info = self.entries.get(name.strip().lower())
+        if info is None:
+            raise ValueError(f"Image '{name}' zip mein nahi mili.")
+        return self.archive.read(info)
+
+
+# --- Row Parsing ---
+
+def _text(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def _list_cell(value: Any) -> List[str]:
+    text = _text(value)
+    if not text:
+        return []
+    if text.startswith("["):
+        items = json.loads(text)
+        if not isinstance(items, list):
+            raise ValueError("List column JSON list hona chahiye.")
+        return [str(item).strip() for item in items if str(item).strip()]
+    return [item.strip() for item in text.split("|") if item.strip()]
+
+
+def _bool_cell(value: Any) -> Optional[bool]:
+    if isinstance(value, bool):
+        return value
+    text = _text(value)
+    if text is None:
+        return None
+    if text.lower() in ("true", "yes", "y", "1"):
+        return True
+    if text.lower() in ("false", "no", "n", "0"):
+        return False
+    raise ValueError(f"is_available '{text}' samajh nahi aaya (true/false).")
+
+
+def parse_catalog_row(row: Dict[str, Any]) -> Tuple[CoverBase, Optional[str]]:
+    """Ek raw row ko validated CoverBase + image reference (URL / zip naam) mein badalta hai."""
+    data = {str(key).strip(): value for key, value in row.items() if key}
+    fields: Dict[str, Any] = {}
+    for name in ("modelName", "coverType", "color", "price", "stock", "genderPreference"):
+        value = data.get(name)
+        # XLSX se numbers already int/float aate hain; CSV mein sab text
+        value = _text(value) if isinstance(value, str) else value
+        if value is not None:
+            fields[name] = value
+    fields["tags"] = _list_cell(data.get("tags"))
+    fields["category_ids"] = _list_cell(data.get("category_ids"))
+    is_available = _bool_cell(data.get("is_available"))
+    if is_available is not None:
+        fields["is_available"] = is_available
+    return CoverBase(**fields), _text(data.get("image") or data.get("imageUrl"))
+
+
+def _row_error(e: Exception) -> str:
+    if isinstance(e, ValidationError):
+        first = e.errors()[0]
+        location = ".".join(str(part) for part in first.get("loc", ()))
+        return f"{location}: {first.get('msg')}" if location else first.get("msg", str(e))
+    return getattr(e, "detail", None) or str(e)
+
+
+# --- Import ---
+
+class CatalogImport:
+    """Ek import run: chunks likhta hai aur report banata hai."""
+
+    def __init__(self, collection, images: Optional[ZipImages] = None, chunk_size: int = IMPORT_CHUNK_SIZE):
+        self.collection = collection
+        self.images = images
+        self.chunk_size = chunk_size
+        self.report: Dict[str, Any] = {
+            "rows": 0, "created": 0, "updated": 0, "failed": 0,
+            "errors": [], "errors_truncated": False, "warnings": [],
+        }
+        self._restock: set = set()
+
+    def _fail(self, row_number: int, error: str) -> None:
+        self.report["failed"] += 1
+        if len(self.report["errors"]) < MAX_REPORTED_ERRORS:
+            self.report["errors"].append({"row": row_number, "error": error})
+        else:
+            self.report["errors_truncated"] = True
+
+    def _warn(self, message: str) -> None:
+        print(f"[Import] {message}")
+        if len(self.report["warnings"]) < MAX_REPORTED_ERRORS:
+            self.report["warnings"].append(message)
+
+    async def _resolve_image(self, reference: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Image column ko cover ke image fields mein badalta hai (None = image nahi di)."""
+        if not reference:
+            return None
+        if reference.lower().startswith(("http://", "https://")):
+            url = str(_http_url.validate_python(reference))
+            return {"imageUrl": url, "imageKey": None, "images": None, "imageHash": None}
+        if self.images is None:
+            raise ValueError(f"Image '{reference}' URL nahi hai aur koi images zip nahi di gayi.")
+        data = await asyncio.to_thread(self.images.read, reference)
+        content_type = mimetypes.guess_type(reference)[0]
+        return await store_cover_image_bytes(data, os.path.basename(reference), content_type)
+
+    async def write_chunk(self, chunk: List[Tuple[int, CoverBase, Optional[str], Tuple[str, str, str]]]) -> None:
+        keys = [key for _, _, _, key in chunk]
+        existing: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        query = {"$or": [{"canonicalModel": m, "coverType": t, "color": c} for m, t, c in keys]}
+        async for doc in self.collection.find(query, _EXISTING_PROJECTION):
+            existing.setdefault((doc.get("canonicalModel"), doc.get("coverType"), doc.get("color")), doc)
+
+        # Images ek saath (upload pool ki concurrency limit ke andar)
+        resolved = await asyncio.gather(
+            *(self._resolve_image(reference) for _, _, reference, _ in chunk),
+            return_exceptions=True
+        )
+
+        now = datetime.utcnow()
+        ops: List[UpdateOne] = []
+        pending: List[Dict[str, Any]] = []
+        for (row_number, cover, _, key), image in zip(chunk, resolved):
+            if isinstance(image, BaseException):
+                self._fail(row_number, f"image: {_row_error(image)}")
+                continue
+            before = existing.get(key)
+            if image is None and before is None:
+                self._fail(row_number, "image: Naye cover ke liye image (URL ya zip file) zaroori hai.")
+                continue
+
+            if image and before and before.get("imageUrl") == image.get("imageUrl"):
+                # Wahi image dobara aayi (jaise export -> import): cover ke image fields
+                # (derivatives, imageHash) jaise hain waise rehte hain. Zip se aayi image
+                # ka registry mein abhi liya hua extra reference wapas.
+                if image.get("imageHash"):
+                    await release_image(image["imageHash"])
+                image = None
+
+            fields = cover.model_dump()
+            fields.update(search_fields(cover.modelName))
+            fields["updatedAt"] = now
+            if image:
+                fields.update(image)
+            ops.append(UpdateOne(
+                {"canonicalModel": key[0], "coverType": key[1], "color": key[2]},
+                {"$set": fields, "$setOnInsert": {"_id": str(ObjectId()), "createdAt": now}},
+                upsert=True
+            ))
+            pending.append({"row": row_number, "before": before, "fields": fields, "image": image})
+
+        # Ordered bulk_write: ek row fail ho to MongoDB wahin ruk jaata hai - us row ko
+        # report karke baaki rows dobara bhejte hain
+        start = 0
+        while start < len(ops):
+            try:
+                result = await self.collection.bulk_write(ops[start:], ordered=True)
+                upserted = {start + index for index in result.upserted_ids}
+                failed_index = None
+                done = len(ops)
+            except BulkWriteError as e:
+                upserted = {start + item["index"] for item in e.details.get("upserted", [])}
+                write_errors = e.details.get("writeErrors") or []
+                concern_errors = e.details.get("writeConcernErrors") or []
+                if concern_errors:
+                    # Writes ho chuke hain, bas replicas par confirm nahi hue - report mein batao
+                    first_row, last_row = pending[start]["row"], pending[len(ops) - 1]["row"]
+                    messages = "; ".join(err.get("errmsg", "") for err in concern_errors)
+                    self._warn(f"Rows {first_row}-{last_row}: write concern error ({messages}) - "
+                               f"likhi gayi par confirm nahi hui.")
+                if write_errors:
+                    error = write_errors[0]
+                    failed_index = start + error["index"]
+                    done = failed_index
+                else:
+                    failed_index = None
+                    done = len(ops)
+            for index in range(start, done):
+                await self._applied(pending[index], created=index in upserted)
+            if failed_index is None:
+                break
+            item = pending[failed_index]
+            self._fail(item["row"], error.get("errmsg", "Write failed"))
+            if item["image"]:
+                await release_image(item["image"].get("imageHash"))
+            start = failed_index + 1
+
+    async def _applied(self, item: Dict[str, Any], created: bool) -> None:
+        before, fields = item["before"], item["fields"]
+        self.report["created" if created else "updated"] += 1
+        after = {**(before or {}), **fields}
+        if stock_raised(None if created else before, after):
+            self._restock.add(after["canonicalModel"])
+        # 'image' sirf tab hai jab image sach mein badli (write_chunk dekhein) - purani
+        # image ka reference chhodein, GC storage se hataega
+        if before and item["image"]:
+            await release_cover_image(before, reason="cover_image_replaced")
+
+    async def run(self, rows: Iterator[Dict[str, Any]]) -> Dict[str, Any]:
+        chunk: List[Tuple[int, CoverBase, Optional[str], Tuple[str, str, str]]] = []
+        chunk_keys: set = set()
+        row_number = 1 # Header row 1 hai
+        while True:
+            raw_rows = await asyncio.to_thread(_next_rows, rows, self.chunk_size)
+            if not raw_rows:
+                break
+            for raw in raw_rows:
+                row_number += 1
+                self.report["rows"] += 1
+                try:
+                    cover, reference = parse_catalog_row(raw)
+                except (ValidationError, ValueError) as e:
+                    self._fail(row_number, _row_error(e))
+                    continue
+                key = (search_fields(cover.modelName)["canonicalModel"], cover.coverType, cover.color)
+                # Ek chunk mein ek key ek hi baar - warna doosri row pehli ko overwrite karegi
+                # aur 'before' / image release galat ho jaayega
+                if key in chunk_keys or len(chunk) >= self.chunk_size:
+                    await self.write_chunk(chunk)
+                    chunk, chunk_keys = [], set()
+                chunk.append((row_number, cover, reference, key))
+                chunk_keys.add(key)
+        if chunk:
+            await self.write_chunk(chunk)
+
+        if self.report["created"] or self.report["updated"]:
+            await bump_catalog_version()
+            await suggest_index.rebuild(self.collection)
+            for model_key in self._restock:
+                await restock_worker.enqueue(model_key)
+        print(f"[Import] {self.report['rows']} rows: {self.report['created']} naye, "
+              f"{self.report['updated']} update, {self.report['failed']} fail.")
+        return self.report
+
+
+async def import_catalog(collection, binary_file, filename: str, images_file=None,
+                         chunk_size: int = IMPORT_CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    CSV/XLSX file object (binary) se covers import karta hai.
+    'images_file' optional zip hai. Return: per-row error report ke saath counts.
+    """
+    rows = iter_catalog_rows(binary_file, filename)
+    images = ZipImages(images_file) if images_file is not None else None
+    return await CatalogImport(collection, images, chunk_size).run(rows)
+
+
+# --- CLI ---
+# python -m utils.catalog_import covers.csv
+# python -m utils.catalog_import covers.xlsx --images photos.zip --chunk-size 2000
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CSV/XLSX se covers import karein.")
+    parser.add_argument("file")
+    parser.add_argument("--images", help="Image files wali zip")
+    parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    from config.cloudinary_config import setup_cloudinary
+    from config.db import collection as cover_collection
+    setup_cloudinary()
+
+    async def _main() -> Dict[str, Any]:
+        images_file = open(args.images, "rb") if args.images else None
+        try:
+            with open(args.file, "rb") as f:
+                result = await import_catalog(cover_collection, f, args.file, images_file, args.chunk_size)
+            # Server ka worker yahaan nahi chalta - restock messages abhi bhejo
+            await restock_worker.flush()
+            return result
+        finally:
+            if images_file:
+                images_file.close()
+
+    try:
+        report = asyncio.run(_main())
+    except CatalogImportError as e:
+        print(f"Import fail: {e}")
+        sys.exit(1)
+    for error in report["errors"]:
+        print(f"  Row {error['row']}: {error['error']}")
+    for warning in report["warnings"]:
+        print(f"  Warning: {warning}")
+    sys.exit(1 if report["failed"] else 0)
@@ -0,0 +1,242 @@
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from config.db import demand_meta_collection
+
+# --- Demand Analytics ---
+# Notifications ("Order Now" requests) shop ka sabse achha demand signal hain.
+# Report canonical model ke hisaab se group hoti hai, har status ka count deti hai
+# aur covers collection se current stock jodti hai - sab ek aggregation mein.
+#
+# Bade data ke liye ek materialized summary ('demand_daily') hai: har
+# (canonical model, din) ka ek document, har status ke counts ke saath. Refresh
+# incremental hai - sirf woh (model, din) dobara compute hote hain jinke notifications
+# pichle refresh ke baad bane ya badle ('createdAt' / 'updatedAt'). Pichle refresh ka
+# waqt (watermark) 'demand_meta' mein hai, isliye worker restart par full rebuild nahi hota.
+# Refresh kabhi report request ke raaste mein nahi chalta: report pichli summary se turant
+# banti hai aur purani summary ka refresh background task mein hota hai.
+#
+# MongoDB 4.2+ chahiye ('$merge'). Din nikaalne ke liye '$dateTrunc' (5.0+) nahi,
+# '$dateToString' use hota hai.
+
+STATUSES = ["Pending", "In Progress", "Completed", "Cancelled"]
+
+# Summary kitni purani hone par (report aane par) background refresh shuru ho
+DEMAND_REFRESH_SECONDS = float(os.getenv("DEMAND_REFRESH_SECONDS", "60"))
+# Isse zyada (model, din) badle hon to incremental ki jagah full rebuild
+MAX_INCREMENTAL_GROUPS = 500
+
+SUMMARY_COLLECTION = "demand_daily"
+# 'demand_meta' mein watermark document
+META_ID = SUMMARY_COLLECTION
+
+
+def _day(field: str = "$createdAt") -> Dict[str, Any]:
+    """Date ko UTC din ki shuruaat par le aata hai (MongoDB 4.0+ par bhi chalta hai)."""
+    return {"$dateFromString": {
+        "dateString": {"$dateToString": {"format": "%Y-%m-%d", "date": field}},
+        "format": "%Y-%m-%d",
+    }}
+
+
+def _status_counts(status_field: str = "$status") -> Dict[str, Any]:
+    """Har status ke liye ek '$sum' accumulator (group stage mein)."""
+    return {
+        status: {"$sum": {"$cond": [{"$eq": [{"$ifNull": [status_field, "Pending"]}, status]}, 1, 0]}}
+        for status in STATUSES
+    }
+
+
+def _stock_lookup(low_stock_threshold: int) -> List[Dict[str, Any]]:
+    """Har model ke available covers ka total stock jodta hai."""
+    return [
+        {"$lookup": {
+            "from": "covers",
+            "let": {"model": "$_id"},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$canonicalModel", "$$model"]}, "is_available": True}},
+                {"$group": {"_id": None, "stock": {"$sum": "$stock"}, "covers": {"$sum": 1}}},
+            ],
+            "as": "inventory",
+        }},
+        {"$addFields": {
+            "stock": {"$ifNull": [{"$first": "$inventory.stock"}, 0]},
+            "covers": {"$ifNull": [{"$first": "$inventory.covers"}, 0]},
+        }},
+        {"$addFields": {"low_stock": {"$lt": ["$stock", low_stock_threshold]}}},
+        {"$project": {"inventory": 0}},
+    ]
+
+
+def _report_tail(statuses: List[str], low_stock_threshold: int, only_low_stock: bool, limit: int) -> list:
+    """Model-wise group ke baad: selected statuses ka total, sort, stock join."""
+    stages: list = [
+        {"$addFields": {"total": {"$add": [f"${s}" for s in statuses]}}},
+        {"$match": {"total": {"$gt": 0}}},
+        {"$sort": {"total": -1, "_id": 1}},
+    ]
+    if only_low_stock:
+        # Stock filter ke liye join pehle, limit baad mein
+        return stages + _stock_lookup(low_stock_threshold) + [{"$match": {"low_stock": True}}, {"$limit": limit}]
+    return stages + [{"$limit": limit}] + _stock_lookup(low_stock_threshold)
+
+
+def build_live_demand_pipeline(since: Optional[datetime], statuses: List[str],
+                               low_stock_threshold: int, only_low_stock: bool, limit: int) -> list:
+    """Seedha 'notifications' par chalne wali report."""
+    match: Dict[str, Any] = {"canonicalModel": {"$nin": [None, ""]}}
+    if since:
+        match["createdAt"] = {"$gte": since}
+    return [
+        {"$match": match},
+        {"$group": {"_id": "$canonicalModel", "modelName": {"$last": "$modelName"}, **_status_counts()}},
+    ] + _report_tail(statuses, low_stock_threshold, only_low_stock, limit)
+
+
+def build_summary_demand_pipeline(since: Optional[datetime], statuses: List[str],
+                                  low_stock_threshold: int, only_low_stock: bool, limit: int) -> list:
+    """Materialized 'demand_daily' par chalne wali report (same output shape)."""
+    match: Dict[str, Any] = {}
+    if since:
+        match["_id.d"] = {"$gte": since.replace(hour=0, minute=0, second=0, microsecond=0)}
+    return [
+        {"$match": match},
+        {"$group": {
+            "_id": "$_id.m",
+            "modelName": {"$last": "$modelName"},
+            **{status: {"$sum": f"$counts.{status}"} for status in STATUSES},
+        }},
+    ] + _report_tail(statuses, low_stock_threshold, only_low_stock, limit)
+
+
+def _summary_stages() -> list:
+    """Notifications ko (model, din) documents mein badalne wale stages."""
+    counts = _status_counts()
+    return [
+        {"$group": {
+            "_id": {"m": "$canonicalModel", "d": _day()},
+            "modelName": {"$last": "$modelName"},
+            **counts,
+        }},
+        {"$project": {
+            "modelName": 1,
+            "counts": {status: f"${status}" for status in STATUSES},
+        }},
+    ]
+
+
+class DemandSummary:
+    """
+    'demand_daily' collection ka incremental refresh. Watermark 'demand_meta' mein hai,
+    isliye saare workers (aur restarts) ek hi watermark dekhte hain.
+    """
+
+    def __init__(self):
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+        # Background refresh ka task (reference zaroori - warna garbage-collect ho sakta hai)
+        self._task: Optional[asyncio.Task] = None
+
+    async def _meta(self) -> Dict[str, Any]:
+        return await demand_meta_collection.find_one({"_id": META_ID}) or {}
+
+    async def refresh(self, notifications, full: bool = False) -> Dict[str, Any]:
+        async with self._lock:
+            started = datetime.utcnow()
+            mode, groups = "full", None
+            meta = {} if full else await self._meta()
+            # 'invalidate()' ke baad ('needsFullAt') pehla refresh full hota hai
+            since = None if meta.get("needsFullAt") else meta.get("refreshedAt")
+            if since is not None:
+                mode, groups = await self._refresh_changed(notifications, since)
+            if mode == "full":
+                await self._rebuild(notifications)
+            # Thoda overlap rakhte hain taaki refresh ke dauraan hue writes na chhootein
+            await demand_meta_collection.update_one(
+                {"_id": META_ID},
+                {"$set": {"refreshedAt": started - timedelta(seconds=5), "mode": mode}},
+                upsert=True
+            )
+            if mode == "full":
+                # Refresh ke dauraan aaya invalidate (naya 'needsFullAt') bana rehta hai
+                await demand_meta_collection.update_one(
+                    {"_id": META_ID, "needsFullAt": {"$lte": started}}, {"$unset": {"needsFullAt": ""}}
+                )
+            self._checked_at = time.monotonic()
+            print(f"[Demand] Summary refresh ({mode}){'' if groups is None else f': {groups} groups'}.")
+            return {"mode": mode, "groups": groups, "refreshed_at": started}
+
+    async def _rebuild(self, notifications) -> None:
+        """Poori summary '$out' se dobara (atomically replace hoti hai)."""
+        await notifications.aggregate([
+            {"$match": {"canonicalModel": {"$nin": [None, ""]}, "createdAt": {"$ne": None}}},
+            *_summary_stages(),
+            {"$out": SUMMARY_COLLECTION},
+        ]).to_list(length=None)
+
+    async def _refresh_changed(self, notifications, since: datetime):
+        # 1. Kaunse (model, din) badle?
+        changed = await notifications.aggregate([
+            {"$match": {"$or": [{"createdAt": {"$gte": since}}, {"updatedAt": {"$gte": since}}],
+                        "canonicalModel": {"$nin": [None, ""]}}},
+            {"$group": {"_id": {"m": "$canonicalModel", "d": _day()}}},
+            {"$limit": MAX_INCREMENTAL_GROUPS + 1},
+        ]).to_list(length=None)
+        if not changed:
+            return "incremental", 0
+        if len(changed) > MAX_INCREMENTAL_GROUPS:
+            return "full", None
+
+        # 2. Sirf un groups ko poora dobara compute karke summary mein replace karo
+        ranges = [
+            {"canonicalModel": row["_id"]["m"],
+             "createdAt": {"$gte": row["_id"]["d"], "$lt": row["_id"]["d"] + timedelta(days=1)}}
+            for row in changed
+        ]
+        await notifications.aggregate([
+            {"$match": {"$or": ranges}},
+            *_summary_stages(),
+            {"$merge": {"into": SUMMARY_COLLECTION, "on": "_id", "whenMatched": "replace", "whenNotMatched": "insert"}},
+        ]).to_list(length=None)
+        return "incremental", len(changed)
+
+    async def invalidate(self) -> None:
+        """
+        Agla refresh (kisi bhi worker mein) full rebuild hoga - jaise canonical keys badalne par.
+        Tab tak reports pichli summary se hi bante hain.
+        """
+        await demand_meta_collection.update_one(
+            {"_id": META_ID}, {"$set": {"needsFullAt": datetime.utcnow()}}, upsert=True
+        )
+        self._checked_at = 0.0
+
+    async def state(self) -> Dict[str, Any]:
+        """Summary kab refresh hui aur kya full rebuild baaki hai (report ke saath dikhane ke liye)."""
+        meta = await self._meta()
+        return {"refreshed_at": meta.get("refreshedAt"), "needs_full": bool(meta.get("needsFullAt"))}
+
+    def refresh_in_background(self, notifications) -> bool:
+        """
+        Summary purani ho (DEMAND_REFRESH_SECONDS) to background mein refresh shuru karta hai;
+        caller intezaar nahi karta. Refresh chal raha ho to True.
+        """
+        if self._task is not None and not self._task.done():
+            return True
+        if time.monotonic() - self._checked_at < DEMAND_REFRESH_SECONDS:
+            return False
+        # Fail hone par bhi har request naya refresh na chalaye
+        self._checked_at = time.monotonic()
+        self._task = asyncio.create_task(self._background_refresh(notifications))
+        return True
+
+    async def _background_refresh(self, notifications) -> None:
+        try:
+            await self.refresh(notifications)
+        except Exception as e:
+            print(f"[Demand] Background refresh fail hua: {e}")
+
+
+demand_summary = DemandSummary()
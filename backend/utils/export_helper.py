@@ -0,0 +1,101 @@
+import csv
+import io
+import json
+import os
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List
+
+# --- Streaming Export (CSV / NDJSON) ---
+# Admin export poori collection ko memory mein nahi laata: Motor cursor se documents
+# 'EXPORT_BATCH_SIZE' ke batches mein aate hain aur har batch turant response mein
+# likh diya jaata hai (StreamingResponse). Header/pehla byte query chalte hi nikal
+# jaata hai, aur server memory collection ke size par depend nahi karti.
+#
+# Covers ka CSV wahi columns use karta hai jo catalog import (utils/catalog_import.py)
+# padhta hai - lists "a|b" format mein - isliye export wapas import ho sakta hai.
+
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "500"))
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+# Har collection ke export columns (order = CSV header ka order)
+EXPORT_COLUMNS: Dict[str, List[str]] = {
+    "covers": [
+        "id", "modelName", "canonicalModel", "coverType", "color", "price", "stock",
+        "genderPreference", "tags", "category_ids", "is_available", "imageUrl",
+        "createdAt", "updatedAt",
+    ],
+    "notifications": [
+        "id", "phone", "modelName", "canonicalModel", "status", "createdAt", "updatedAt",
+    ],
+}
+
+# Sirf zaroori fields database se aayein
+EXPORT_PROJECTIONS: Dict[str, Dict[str, int]] = {
+    name: {column: 1 for column in columns if column != "id"}
+    for name, columns in EXPORT_COLUMNS.items()
+}
+
+
+def _value(value: Any, for_csv: bool) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        return "|".join(str(item) for item in value) if for_csv else value
+    if value is None:
+        return "" if for_csv else None
+    return value
+
+
+def export_row(doc: Dict[str, Any], columns: List[str], for_csv: bool = False) -> Dict[str, Any]:
+    """Document ko export columns wali flat dict mein badalta hai ('_id' -> 'id')."""
+    row = {}
+    for column in columns:
+        raw = doc.get("_id") if column == "id" else doc.get(column)
+        row[column] = str(raw) if column == "id" else _value(raw, for_csv)
+    if "status" in columns and not doc.get("status"):
+        row["status"] = "Pending" # Purane notifications
+    return row
+
+
+async def stream_export(cursor, columns: List[str], fmt: str,
+                        batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[str]:
+    """
+    Cursor ke documents ko CSV / NDJSON chunks mein yield karta hai. Har chunk
+    ek batch hai - memory mein ek waqt par zyada se zyada ek batch rehta hai.
+    """
+    buffer = io.StringIO()
+    writer = None
+    if fmt == "csv":
+        writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        # Header turant bhejo - client ko pehla byte query ke saath hi milta hai
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    count = 0
+    try:
+        async for doc in cursor.batch_size(batch_size):
+            if writer:
+                writer.writerow(export_row(doc, columns, for_csv=True))
+            else:
+                buffer.write(json.dumps(export_row(doc, columns), ensure_ascii=False, default=str) + "\n")
+            count += 1
+            if count % batch_size == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+    except Exception as e:
+        # Response shuru ho chuka hai - status code ab badal nahi sakte, sirf log
+        print(f"[Export] Stream beech mein fail hua ({count} rows ke baad): {e}")
+        raise
+    finally:
+        await cursor.close()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+    print(f"[Export] {count} rows export hue ({fmt}).")
@@ -16,6 +16,8 @@ from config.db import collection
 from models.cover_model import CoverOut, cover_helper
 # Cloudinary upload utility
 from utils.upload_helper import upload_to_cloudinary
+# Indexed model search (regex ki jagah)
+from utils.search_helper import build_model_match
 # JSON encoding for price/stock
 import json
 
@@ -39,10 +41,9 @@ async def get_covers(
     """
     query: dict = {}
 
-    # 1. Model Name Filter (Case-insensitive fuzzy search)
+    # 1. Model Name Filter (indexed 'searchTokens' par, regex injection ka khatra nahi)
     if model:
-        # 'i' flag case-insensitivity ke liye hai
-        query["modelName"] = {"$regex": model, "$options": "i"}
+        query.update(build_model_match(model))
 
     # 2. Cover Type Filter (Agar multiple types select kiye hain)
     if coverType:
@@ -0,0 +1,296 @@
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from pymongo import UpdateOne
+
+from config.db import (
+    collection as cover_collection,
+    image_collection,
+    image_tombstone_collection
+)
+from utils.restock_worker import RateLimiter
+from utils.storage import get_storage
+from utils.upload_helper import run_in_upload_pool
+
+# --- Orphaned Image Garbage Collection ---
+# Cover delete hone par uski image storage (Cloudinary / local) mein padi reh jaati thi.
+# Ab delete hone layak assets ki keys 'image_tombstones' collection (queue) mein likhi
+# jaati hain - 'release_image()' aur 'delete_cover' yahi karte hain. Background GC job
+# in tombstones ko batches mein uthata hai, confirm karta hai ki koi cover / registry
+# entry ab bhi us key ko use nahi kar rahi, aur rate-limited deletes storage interface
+# (upload worker pool) se karta hai.
+#
+# Jo assets tombstone ke bina chhoot gaye (purane covers, crash), unke liye ek full
+# reconciliation scan hai: storage ke saare assets ko covers + registry ke references
+# se milata hai. Har run 'dry_run' mein chal sakta hai aur bytes reclaimed report deta hai.
+
+# Background GC kitne seconds baad chale
+IMAGE_GC_INTERVAL = float(os.getenv("IMAGE_GC_INTERVAL", "300"))
+IMAGE_GC_ENABLED = os.getenv("IMAGE_GC_ENABLED", "true").lower() == "true"
+# Ek batch mein kitne tombstones
+IMAGE_GC_BATCH_SIZE = int(os.getenv("IMAGE_GC_BATCH_SIZE", "100"))
+# Storage par har second zyada se zyada kitne deletes (Cloudinary Admin API limits)
+IMAGE_GC_RATE_PER_SECOND = float(os.getenv("IMAGE_GC_RATE_PER_SECOND", "5"))
+# Reconciliation is umar se nayi files nahi chhedta (upload ho chuki, cover abhi bana nahi)
+IMAGE_GC_GRACE_SECONDS = float(os.getenv("IMAGE_GC_GRACE_SECONDS", "3600"))
+# Itni baar fail hone ke baad tombstone chhod diya jaata hai (report mein dikhta hai)
+IMAGE_GC_MAX_ATTEMPTS = 5
+# Report mein zyada se zyada kitni keys (baaki sirf counts mein)
+REPORT_KEYS_LIMIT = 200
+
+
+async def tombstone_assets(assets: Iterable[Dict[str, Any]], reason: str) -> int:
+    """
+    Assets ({"key", "bytes"}) ko delete queue mein daalta hai. Same key dobara aaye
+    to ek hi tombstone rehta hai. Kitne naye tombstones bane, woh return karta hai.
+    """
+    now = datetime.utcnow()
+    ops = [
+        UpdateOne(
+            {"_id": asset["key"]},
+            {"$setOnInsert": {"bytes": asset.get("bytes", 0), "reason": reason,
+                              "createdAt": now, "attempts": 0}},
+            upsert=True
+        )
+        for asset in assets if asset.get("key")
+    ]
+    if not ops:
+        return 0
+    result = await image_tombstone_collection.bulk_write(ops, ordered=False)
+    image_gc.wake()
+    return result.upserted_count
+
+
+def cover_image_assets(doc: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Cover / registry document ke original + derivative assets ({"key", "bytes"})."""
+    assets = []
+    if doc.get("imageKey"):
+        assets.append({"key": doc["imageKey"], "bytes": doc.get("originalBytes", 0)})
+    for variant in (doc.get("images") or {}).get("variants", []):
+        if variant.get("key"):
+            assets.append({"key": variant["key"], "bytes": variant.get("bytes", 0)})
+    return assets
+
+
+async def referenced_keys(keys: List[str]) -> Set[str]:
+    """Diye gaye keys mein se kaunse ab bhi kisi cover ya registry entry mein hain."""
+    query = {"$or": [{"imageKey": {"$in": keys}}, {"images.variants.key": {"$in": keys}}]}
+    projection = {"imageKey": 1, "images.variants.key": 1}
+    found: Set[str] = set()
+    for coll in (cover_collection, image_collection):
+        async for doc in coll.find(query, projection):
+            found.update(asset["key"] for asset in cover_image_assets(doc))
+    return found & set(keys)
+
+
+def _empty_report(dry_run: bool) -> Dict[str, Any]:
+    return {
+        "dry_run": dry_run,
+        "checked": 0,
+        "deleted": 0,
+        "still_referenced": 0,
+        "failed": 0,
+        "bytes_reclaimed": 0,
+        "keys": [],
+    }
+
+
+def _note_key(report: Dict[str, Any], key: str) -> None:
+    if len(report["keys"]) < REPORT_KEYS_LIMIT:
+        report["keys"].append(key)
+
+
+class ImageGC:
+    """Tombstone queue ka background consumer + reconciliation scan."""
+
+    def __init__(self, batch_size: int = IMAGE_GC_BATCH_SIZE,
+                 rate_per_second: float = IMAGE_GC_RATE_PER_SECOND):
+        self.batch_size = batch_size
+        self.limiter = RateLimiter(rate_per_second)
+        self.bytes_reclaimed = 0
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    def start(self) -> None:
+        """Startup par call karein (event loop ke andar)."""
+        if not IMAGE_GC_ENABLED:
+            return
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        print(f"[ImageGC] Background GC shuru hua (har {IMAGE_GC_INTERVAL:.0f}s).")
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            print("[ImageGC] Background GC band hua.")
+
+    def wake(self) -> None:
+        """Naye tombstones aaye - agla run interval ka intezaar kiye bina."""
+        if self._wake is not None:
+            self._wake.set()
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=IMAGE_GC_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self.collect()
+            except Exception as e:
+                print(f"[ImageGC] Run fail hua: {e}")
+
+    async def collect(self, dry_run: bool = False, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Tombstone queue ko process karta hai. 'dry_run' mein kuch delete nahi hota,
+        sirf report milti hai ki kya delete hota aur kitne bytes bachte.
+        """
+        report = _empty_report(dry_run)
+        async with self._get_lock():
+            last_id = None
+            while limit is None or report["checked"] < limit:
+                size = self.batch_size if limit is None else min(self.batch_size, limit - report["checked"])
+                query: Dict[str, Any] = {"attempts": {"$lt": IMAGE_GC_MAX_ATTEMPTS}}
+                if last_id is not None:
+                    # Dry run / failed deletes ke tombstones queue mein rehte hain - aage badho
+                    query["_id"] = {"$gt": last_id}
+                batch = await image_tombstone_collection.find(query).sort("_id", 1) \
+                    .limit(size).to_list(length=size)
+                if not batch:
+                    break
+                last_id = batch[-1]["_id"]
+                await self._process_batch(batch, report)
+
+        if not dry_run:
+            self.bytes_reclaimed += report["bytes_reclaimed"]
+        if report["checked"]:
+            print(f"[ImageGC] {'(dry run) ' if dry_run else ''}{report['deleted']} assets delete, "
+                  f"{report['bytes_reclaimed']} bytes reclaimed.")
+        return report
+
+    async def _process_batch(self, batch: List[Dict[str, Any]], report: Dict[str, Any]) -> None:
+        keys = [doc["_id"] for doc in batch]
+        report["checked"] += len(batch)
+
+        # Delete se pehle dobara check: beech mein kisi cover ne same image le li ho
+        in_use = await referenced_keys(keys)
+        if in_use:
+            report["still_referenced"] += len(in_use)
+            if not report["dry_run"]:
+                await image_tombstone_collection.delete_many({"_id": {"$in": list(in_use)}})
+
+        storage = get_storage()
+        for doc in batch:
+            key = doc["_id"]
+            if key in in_use:
+                continue
+            if report["dry_run"]:
+                report["deleted"] += 1
+                report["bytes_reclaimed"] += doc.get("bytes", 0)
+                _note_key(report, key)
+                continue
+
+            await self.limiter.acquire()
+            try:
+                await run_in_upload_pool(storage.delete, key)
+            except Exception as e:
+                print(f"[ImageGC] '{key}' delete nahi hua: {e}")
+                report["failed"] += 1
+                await image_tombstone_collection.update_one(
+                    {"_id": key}, {"$inc": {"attempts": 1}, "$set": {"lastError": str(e)}}
+                )
+                continue
+            await image_tombstone_collection.delete_one({"_id": key})
+            report["deleted"] += 1
+            report["bytes_reclaimed"] += doc.get("bytes", 0)
+            _note_key(report, key)
+
+    async def reconcile(self, dry_run: bool = False,
+                        grace_seconds: float = IMAGE_GC_GRACE_SECONDS) -> Dict[str, Any]:
+        """
+        Full scan: storage ke jo assets kisi cover / registry entry mein nahi hain
+        (aur grace period se purane hain) unhe tombstone karke GC chalata hai.
+        """
+        storage = get_storage()
+        # Listing network / disk I/O hai - worker pool mein
+        assets = await run_in_upload_pool(lambda: list(storage.list_assets()))
+
+        keys: Set[str] = set()
+        urls: Set[str] = set()
+        projection = {"imageKey": 1, "imageUrl": 1, "images.variants.key": 1}
+        for coll in (cover_collection, image_collection):
+            async for doc in coll.find({}, projection):
+                keys.update(asset["key"] for asset in cover_image_assets(doc))
+                if doc.get("imageUrl"):
+                    # Purane covers mein sirf URL hai, key nahi
+                    urls.add(doc["imageUrl"])
+
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=grace_seconds)
+        orphans = [
+            asset for asset in assets
+            if asset["key"] not in keys and asset.get("url") not in urls and asset["created_at"] < cutoff
+        ]
+        print(f"[ImageGC] Reconciliation: {len(assets)} assets, {len(orphans)} orphaned.")
+
+        if dry_run:
+            report = _empty_report(True)
+            report["checked"] = report["deleted"] = len(orphans)
+            report["bytes_reclaimed"] = sum(asset.get("bytes", 0) for asset in orphans)
+            report["keys"] = [asset["key"] for asset in orphans[:REPORT_KEYS_LIMIT]]
+        else:
+            await tombstone_assets(orphans, reason="reconcile")
+            report = await self.collect()
+        report["scanned"] = len(assets)
+        report["orphaned"] = len(orphans)
+        return report
+
+    async def pending(self) -> Dict[str, Any]:
+        """Queue ka haal: kitne tombstones baaki hain, kitne bytes, kitne baar-baar fail."""
+        rows = await image_tombstone_collection.aggregate([
+            {"$group": {
+                "_id": {"$gte": ["$attempts", IMAGE_GC_MAX_ATTEMPTS]},
+                "count": {"$sum": 1},
+                "bytes": {"$sum": "$bytes"},
+            }},
+        ]).to_list(length=None)
+        by_state = {row["_id"]: row for row in rows}
+        return {
+            "pending": by_state.get(False, {}).get("count", 0),
+            "pending_bytes": by_state.get(False, {}).get("bytes", 0),
+            "given_up": by_state.get(True, {}).get("count", 0),
+            "bytes_reclaimed": self.bytes_reclaimed,
+        }
+
+
+image_gc = ImageGC()
+
+
+# --- CLI ---
+# python -m utils.image_gc                        -> tombstone queue process karein
+# python -m utils.image_gc --reconcile            -> full scan + GC
+# python -m utils.image_gc --reconcile --dry-run  -> sirf report, kuch delete nahi
+if __name__ == "__main__":
+    from config.cloudinary_config import setup_cloudinary
+    setup_cloudinary()
+    dry = "--dry-run" in sys.argv
+    if "--reconcile" in sys.argv:
+        result = asyncio.run(image_gc.reconcile(dry_run=dry))
+    else:
+        result = asyncio.run(image_gc.collect(dry_run=dry))
+    result.pop("keys", None)
+    print(result)
@@ -0,0 +1,100 @@
+import base64
+import io
+import os
+from typing import Any, Dict, List, Optional
+
+# --- Responsive Image Derivatives ---
+# Upload ke waqt original photo se chhote versions (thumb / card / full) bante hain,
+# taaki product grid poori phone photo download na kare. Har derivative ki URL,
+# width, height aur ek chhota blur placeholder cover document ke 'images' field
+# mein save hota hai; CoverOut isse srcset-ready structure banata hai.
+#
+# Resize CPU-bound hai, isliye yeh functions *synchronous* hain aur hamesha alag image
+# thread pool (utils/upload_helper.py: run_in_image_pool) mein chalte hain - na event loop
+# par, na uploads ke network slots mein.
+#
+# Pillow optional hai: install na ho to sirf original image save hoti hai.
+
+try:
+    from PIL import Image, ImageOps, features
+    PILLOW_AVAILABLE = True
+except ImportError: # pragma: no cover - Pillow ke bina bhi app chalta hai
+    Image = ImageOps = features = None
+    PILLOW_AVAILABLE = False
+
+# Derivative naam -> max width (px). Original isse chhota ho to upscale nahi hota.
+DERIVATIVE_WIDTHS: Dict[str, int] = {
+    "thumb": int(os.getenv("IMAGE_THUMB_WIDTH", "160")),
+    "card": int(os.getenv("IMAGE_CARD_WIDTH", "480")),
+    "full": int(os.getenv("IMAGE_FULL_WIDTH", "1200")),
+}
+IMAGE_QUALITY = int(os.getenv("IMAGE_QUALITY", "80"))
+# Blur placeholder ki width (px) - data URI ~1KB se kam rehta hai
+PLACEHOLDER_WIDTH = 16
+
+
+def _output_format() -> str:
+    """WebP jahaan Pillow support karta ho, warna JPEG."""
+    return "WEBP" if features.check("webp") else "JPEG"
+
+
+def _encode(img, fmt: str, quality: int = IMAGE_QUALITY) -> bytes:
+    buffer = io.BytesIO()
+    if fmt == "JPEG" and img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")
+    img.save(buffer, format=fmt, quality=quality, optimize=True)
+    return buffer.getvalue()
+
+
+def _resized(img, width: int):
+    if img.width <= width:
+        return img
+    height = max(1, round(img.height * width / img.width))
+    return img.resize((width, height), Image.LANCZOS)
+
+
+def build_derivatives(data: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Original image bytes se derivatives banata hai.
+    Return: {"width", "height", "placeholder", "derivatives": [{"name", "data", "width",
+    "height", "format", "content_type"}]} - ya None (Pillow nahi hai / image padh nahi paaye).
+    """
+    if not PILLOW_AVAILABLE:
+        return None
+    try:
+        with Image.open(io.BytesIO(data)) as opened:
+            # Phone photos ka EXIF rotation pixels par lagao
+            img = ImageOps.exif_transpose(opened)
+            img.load()
+    except Exception as e:
+        print(f"[Images] Derivatives nahi ban paaye (image padh nahi paaye): {e}")
+        return None
+
+    if img.mode not in ("RGB", "RGBA", "L"):
+        img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+
+    fmt = _output_format()
+    derivatives: List[Dict[str, Any]] = []
+    seen_widths = set()
+    for name, max_width in sorted(DERIVATIVE_WIDTHS.items(), key=lambda item: item[1]):
+        resized = _resized(img, max_width)
+        if resized.width in seen_widths:
+            # Chhoti original image: same size ka derivative dobara nahi
+            continue
+        seen_widths.add(resized.width)
+        derivatives.append({
+            "name": name,
+            "data": _encode(resized, fmt),
+            "width": resized.width,
+            "height": resized.height,
+            "format": fmt.lower(),
+            "content_type": f"image/{fmt.lower()}",
+        })
+
+    placeholder = _encode(_resized(img, PLACEHOLDER_WIDTH), "JPEG", quality=40)
+    return {
+        "width": img.width,
+        "height": img.height,
+        "placeholder": "data:image/jpeg;base64," + base64.b64encode(placeholder).decode("ascii"),
+        "derivatives": derivatives,
+    }
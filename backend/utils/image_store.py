@@ -0,0 +1,87 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from pymongo import ReturnDocument
+
+from config.db import image_collection
+from utils.image_gc import tombstone_assets, cover_image_assets
+
+# --- Content-Hash Image Registry ---
+# 'images' collection mein har unique image (sha256 of bytes) ka ek document hai:
+# stored URLs, storage keys, derivatives aur 'refCount' (kitne covers ise use karte hain).
+# Same photo dobara upload hone par storage tak jaaye bina wahi URLs reuse hote hain.
+#
+# Reference lena ('acquire_image') aur chhodna ('release_image') dono atomic
+# findOneAndUpdate se hote hain, isliye ek saath chalne wale uploads/deletes mein
+# koi image galti se delete nahi hoti. Storage se asli delete background GC
+# (utils/image_gc.py) tombstone queue ke through karta hai.
+
+# Cover document mein copy hone wale fields
+IMAGE_FIELDS = ("imageUrl", "imageKey", "images")
+
+
+def cover_image_fields(image_doc: Dict[str, Any]) -> Dict[str, Any]:
+    fields = {field: image_doc.get(field) for field in IMAGE_FIELDS}
+    fields["imageHash"] = image_doc["_id"]
+    return fields
+
+
+async def acquire_image(content_hash: str) -> Optional[Dict[str, Any]]:
+    """
+    Hash pehle se registry mein ho to uska refCount badhakar cover fields return karta hai.
+    Nahi ho to None (tab upload karna padega).
+    """
+    doc = await image_collection.find_one_and_update(
+        {"_id": content_hash},
+        {"$inc": {"refCount": 1}, "$set": {"lastUsedAt": datetime.utcnow()}},
+        return_document=ReturnDocument.AFTER
+    )
+    return cover_image_fields(doc) if doc else None
+
+
+async def register_image(content_hash: str, fields: Dict[str, Any], original_bytes: int) -> Dict[str, Any]:
+    """
+    Naye upload ko registry mein daalta hai (refCount 1). Agar isi beech kisi doosre
+    request ne same image register kar di, to uski entry use hoti hai aur hamari
+    upload ki hui copy GC ke liye tombstone ho jaati hai.
+    """
+    now = datetime.utcnow()
+    doc = await image_collection.find_one_and_update(
+        {"_id": content_hash},
+        {
+            "$setOnInsert": {**fields, "originalBytes": original_bytes, "createdAt": now},
+            "$inc": {"refCount": 1},
+            "$set": {"lastUsedAt": now},
+        },
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    if doc.get("imageKey") != fields.get("imageKey"):
+        await tombstone_assets(cover_image_assets({**fields, "originalBytes": original_bytes}), reason="upload_race")
+    return cover_image_fields(doc)
+
+
+async def release_image(content_hash: Optional[str]) -> None:
+    """
+    Ek cover ka reference chhodta hai. Aakhri reference jaane par registry entry
+    aur storage assets (original + derivatives) GC queue mein jaate hain.
+    """
+    if not content_hash:
+        return
+    await image_collection.update_one({"_id": content_hash}, {"$inc": {"refCount": -1}})
+    # Beech mein kisi ne reference le liya ho to refCount > 0 hoga aur yeh match nahi karega
+    orphan = await image_collection.find_one_and_delete({"_id": content_hash, "refCount": {"$lte": 0}})
+    if orphan:
+        await tombstone_assets(cover_image_assets(orphan), reason="released")
+
+
+async def release_cover_image(cover: Dict[str, Any], reason: str = "cover_deleted") -> None:
+    """
+    Delete / badle gaye cover ki image chhodta hai. Registry wale covers ka reference
+    count ghatta hai; purane covers (bina 'imageHash') ke assets seedha tombstone hote hain.
+    GC delete se pehle check karta hai ki koi aur cover ab bhi woh key use nahi kar raha.
+    """
+    if cover.get("imageHash"):
+        await release_image(cover["imageHash"])
+    else:
+        await tombstone_assets(cover_image_assets(cover), reason=reason)
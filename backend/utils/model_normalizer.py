@@ -0,0 +1,214 @@
+import re
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+# --- Model Name Normalization ---
+# Customers ek hi phone ko kai tarah likhte hain: "iphone14", "I Phone 14",
+# "Samsung Galaxy A15", "A15". Write time par har naam se ek canonical key
+# (brand + series + number + suffix) banti hai, jaise "apple iphone 14" ya
+# "samsung galaxy a 15". Lookup us key par exact (indexed) equality se hota hai.
+#
+# Jo variants rules se pakde nahi jaate unke liye editable alias table hai
+# ('model_aliases' collection). Aliases memory mein rehte hain aur startup par /
+# admin ke badlav par reload hote hain.
+
+# Backfill mein ek baar mein kitne documents update karenge
+BACKFILL_BATCH_SIZE = 500
+
+_NON_ALNUM = re.compile(r"[^a-z0-9+]+")
+_LETTER_DIGIT = re.compile(r"(?<=[a-z])(?=[0-9])|(?<=[0-9])(?=[a-z])")
+
+# Brand ke alag-alag naam -> canonical brand
+BRANDS: Dict[str, str] = {
+    "apple": "apple",
+    "samsung": "samsung",
+    "xiaomi": "xiaomi",
+    "mi": "xiaomi",
+    "google": "google",
+    "oneplus": "oneplus",
+    "realme": "realme",
+    "oppo": "oppo",
+    "vivo": "vivo",
+    "motorola": "motorola",
+    "nokia": "nokia",
+    "nothing": "nothing",
+    "infinix": "infinix",
+    "tecno": "tecno",
+    "iqoo": "iqoo",
+    "honor": "honor",
+    "huawei": "huawei",
+}
+
+# Series jisse brand pata chal jaata hai (brand na likha ho tab)
+SERIES_BRANDS: Dict[str, str] = {
+    "iphone": "apple",
+    "galaxy": "samsung",
+    "redmi": "xiaomi",
+    "poco": "xiaomi",
+    "pixel": "google",
+    "nord": "oneplus",
+    "narzo": "realme",
+    "moto": "motorola",
+}
+
+# Samsung ki single-letter series ("A15", "M34", "S23")
+SAMSUNG_SERIES_LETTERS = {"a", "m", "s", "f", "z"}
+
+# Log aksar brand/series ko tod kar likhte hain ("i phone", "one plus")
+_SPLIT_WORDS = {
+    ("i", "phone"): "iphone",
+    ("one", "plus"): "oneplus",
+    ("red", "mi"): "redmi",
+}
+
+# Network suffix ("5 g" -> "5g")
+_NETWORK_SUFFIXES = {("4", "g"): "4g", ("5", "g"): "5g"}
+
+
+def normalize_model_name(name: str) -> str:
+    """
+    Model name ko lowercase, saaf-suthre words mein badalta hai.
+    e.g. "iPhone14 Pro-Max" -> "iphone 14 pro max"
+    """
+    if not name:
+        return ""
+    text = _NON_ALNUM.sub(" ", name.lower())
+    text = text.replace("+", " plus ")
+    text = _LETTER_DIGIT.sub(" ", text)
+    return " ".join(text.split())
+
+
+class ModelParts(NamedTuple):
+    brand: Optional[str]
+    series: Optional[str]
+    number: Optional[str]
+    suffix: List[str]
+
+    @property
+    def key(self) -> str:
+        return " ".join(filter(None, [self.brand, self.series, self.number, *self.suffix]))
+
+
+def _merge_words(words: List[str]) -> List[str]:
+    merged: List[str] = []
+    i = 0
+    while i < len(words):
+        pair = tuple(words[i:i + 2])
+        joined = _SPLIT_WORDS.get(pair) or _NETWORK_SUFFIXES.get(pair)
+        if joined:
+            merged.append(joined)
+            i += 2
+        else:
+            merged.append(words[i])
+            i += 1
+    return merged
+
+
+def parse_model_name(name: str) -> ModelParts:
+    """Normalized naam ko brand / series / number / suffix mein todta hai."""
+    words = _merge_words(normalize_model_name(name).split())
+
+    brand = None
+    if words and words[0] in BRANDS:
+        brand = BRANDS[words.pop(0)]
+
+    # Pehle number tak ke words series hain, uske baad ke suffix
+    series_words: List[str] = []
+    number = None
+    suffix: List[str] = []
+    for word in words:
+        if number is None and word.isdigit():
+            number = word
+        elif number is None:
+            series_words.append(word)
+        else:
+            suffix.append(word)
+
+    if brand is None and series_words:
+        brand = SERIES_BRANDS.get(series_words[0])
+        if brand is None and number and len(series_words) == 1 and series_words[0] in SAMSUNG_SERIES_LETTERS:
+            brand = "samsung"
+    if brand == "samsung" and series_words and series_words[0] != "galaxy":
+        series_words.insert(0, "galaxy")
+
+    return ModelParts(brand, " ".join(series_words) or None, number, suffix)
+
+
+# --- Alias Table ---
+# alias (normalized text ya computed key) -> canonical key
+_aliases: Dict[str, str] = {}
+
+
+def canonical_model_key(name: str) -> str:
+    """
+    Model name ki canonical key. Pehle alias table dekhi jaati hai (raw naam, phir
+    rules se bani key), warna rules wali key hi canonical hai.
+    """
+    normalized = normalize_model_name(name)
+    if not normalized:
+        return ""
+    if normalized in _aliases:
+        return _aliases[normalized]
+    key = parse_model_name(normalized).key
+    return _aliases.get(key, key)
+
+
+def set_aliases(aliases: Dict[str, str]) -> None:
+    global _aliases
+    _aliases = {normalize_model_name(alias): canonical for alias, canonical in aliases.items()}
+
+
+async def load_aliases(collection) -> int:
+    """'model_aliases' collection se in-memory alias table dobara banata hai."""
+    aliases = {}
+    async for doc in collection.find({}, {"canonical": 1}):
+        aliases[doc["_id"]] = doc["canonical"]
+    set_aliases(aliases)
+    print(f"[Models] {len(aliases)} model aliases load hue.")
+    return len(aliases)
+
+
+# (document _id, naya canonicalModel) jinka write unique index ne roka
+ConflictHandler = Callable[[object, List[Tuple[object, str]]], Awaitable[None]]
+
+
+async def _write_backfill_batch(collection, batch: List[UpdateOne], keys: List[Tuple[object, str]],
+                                on_conflict: Optional[ConflictHandler]) -> None:
+    try:
+        await collection.bulk_write(batch, ordered=False)
+    except BulkWriteError as e:
+        errors = e.details.get("writeErrors") or []
+        if on_conflict is None or not errors or any(err.get("code") != 11000 for err in errors):
+            raise
+        # Baaki rows likh chuki hain (ordered=False); sirf takraane wali rows handler ko
+        await on_conflict(collection, [keys[err["index"]] for err in errors])
+
+
+async def backfill_canonical_models(collection, force: bool = False,
+                                    on_conflict: Optional[ConflictHandler] = None) -> int:
+    """
+    Kisi bhi collection (jaise notifications) ke documents par 'canonicalModel'
+    bharta hai. Bina 'force' ke sirf woh documents jin par field nahi hai.
+    Naya key kisi unique index se takraaye to woh rows 'on_conflict' ko milti hain
+    (na diya ho to error upar jaata hai).
+    Covers ke liye 'search_helper.backfill_search_fields' use karein.
+    """
+    updated = 0
+    batch, keys = [], []
+    query = {} if force else {"canonicalModel": {"$exists": False}}
+    async for doc in collection.find(query, {"modelName": 1}):
+        key = canonical_model_key(doc.get("modelName", ""))
+        batch.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"canonicalModel": key}}))
+        keys.append((doc["_id"], key))
+        if len(batch) >= BACKFILL_BATCH_SIZE:
+            await _write_backfill_batch(collection, batch, keys, on_conflict)
+            updated += len(batch)
+            batch, keys = [], []
+    if batch:
+        await _write_backfill_batch(collection, batch, keys, on_conflict)
+        updated += len(batch)
+    if updated:
+        print(f"[Models] {collection.name}: {updated} documents ka canonicalModel backfill hua.")
+    return updated
@@ -0,0 +1,63 @@
+import base64
+from typing import Dict, Any, Optional
+
+from bson import json_util
+from fastapi import HTTPException, status
+
+# --- Keyset (Cursor) Pagination Helper ---
+# Cursor ek opaque, URL-safe string hai jisme pichle page ke aakhri document ki
+# sort keys (createdAt, _id, aur search mein rank) hoti hain. 'json_util' ka
+# istemal isliye ki datetime aur ObjectId apne asli type mein wapas aayein.
+
+# Default page size aur server-side cap
+DEFAULT_PAGE_SIZE = 24
+MAX_PAGE_SIZE = 100
+
+
+def clamp_limit(limit: Optional[int]) -> int:
+    """Client ki di hui limit ko 1..MAX_PAGE_SIZE ke beech rakhta hai."""
+    if not limit or limit < 1:
+        return DEFAULT_PAGE_SIZE
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    """Sort keys ko opaque cursor string mein badalta hai."""
+    raw = json_util.dumps(values).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Cursor string ko wapas sort keys mein badalta hai. Galat cursor par 400."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json_util.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, dict) or "i" not in values:
+            raise ValueError("cursor mein '_id' nahi hai")
+        return values
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor."
+        )
+
+
+def keyset_after(created_at: Any, doc_id: Any) -> Dict[str, Any]:
+    """
+    (createdAt DESC, _id DESC) sort mein diye gaye document ke *baad* wale documents ka filter.
+    Purane documents jinka createdAt null hai, woh sort mein sabse aakhir mein aate hain.
+    """
+    if created_at is None:
+        return {"createdAt": None, "_id": {"$lt": doc_id}}
+    return {
+        "$or": [
+            {"createdAt": {"$lt": created_at}},
+            {"createdAt": None},
+            {"createdAt": created_at, "_id": {"$lt": doc_id}},
+        ]
+    }
+
+
+def ranked_keyset_after(rank: int, created_at: Any, doc_id: Any) -> Dict[str, Any]:
+    """(_rank ASC, createdAt DESC, _id DESC) sort ke liye keyset filter."""
+    return {"$or": [{"_rank": {"$gt": rank}}, {"_rank": rank, **keyset_after(created_at, doc_id)}]}
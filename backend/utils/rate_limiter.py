@@ -0,0 +1,189 @@
+import math
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from fastapi import HTTPException, Request, status
+from pymongo import ReturnDocument
+
+# --- Rate Limiting (GCRA) ---
+# Public write endpoints (POST /api/notify, POST /api/auth/login) par per-client
+# limit. GCRA (Generic Cell Rate Algorithm) har key ke liye sirf ek number rakhta hai -
+# 'TAT' (theoretical arrival time) - isliye har request O(1) hai.
+#
+# Limit "N requests per P seconds" hai, 'burst' tak ek saath allow. Har route ki
+# limit env variable se badli ja sakti hai: RATE_LIMIT_<NAME>="N/P" (e.g. "20/60").
+#
+# Backend pluggable hai ('RATE_LIMIT_BACKEND'): "memory" (ek process) ya "mongo"
+# (saare uvicorn workers ki combined limit, ek atomic findOneAndUpdate se).
+
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory").lower()
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+# Proxy (jaise Render) ke peeche ho to client IP 'X-Forwarded-For' se lein
+RATE_LIMIT_TRUST_PROXY = os.getenv("RATE_LIMIT_TRUST_PROXY", "false").lower() == "true"
+# Memory backend mein zyada se zyada kitni keys
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    requests: int
+    per_seconds: float
+    burst: Optional[int] = None
+
+    @property
+    def emission_interval(self) -> float:
+        """Do requests ke beech ka 'ideal' gap (seconds)."""
+        return self.per_seconds / self.requests
+
+    @property
+    def tolerance(self) -> float:
+        return self.emission_interval * (self.burst or self.requests)
+
+
+def _from_env(name: str, default: RateLimit) -> RateLimit:
+    value = os.getenv(f"RATE_LIMIT_{name.upper()}")
+    if not value:
+        return default
+    try:
+        requests, per_seconds = value.split("/")
+        return RateLimit(int(requests), float(per_seconds))
+    except ValueError:
+        print(f"[RateLimit] Warning: RATE_LIMIT_{name.upper()}='{value}' galat hai, default use hoga.")
+        return default
+
+
+# Har route/key-type ki limit
+RATE_LIMITS: Dict[str, RateLimit] = {
+    name: _from_env(name, default)
+    for name, default in {
+        "notify_ip": RateLimit(20, 60),
+        "notify_phone": RateLimit(5, 3600),
+        "login_ip": RateLimit(10, 300),
+        "login_user": RateLimit(5, 300),
+    }.items()
+}
+
+
+class RateLimitBackend:
+    """GCRA state (har key ka TAT) rakhne ka base interface."""
+
+    name = "base"
+
+    async def hit(self, key: str, limit: RateLimit, now: float) -> Tuple[bool, float]:
+        """Ek request record karta hai. (allowed, retry_after_seconds) return karta hai."""
+        raise NotImplementedError
+
+
+class MemoryBackend(RateLimitBackend):
+    """Process ke andar dict. Read aur write ke beech koi 'await' nahi, isliye atomic."""
+
+    name = "memory"
+
+    def __init__(self, max_keys: int = RATE_LIMIT_MAX_KEYS):
+        self.max_keys = max_keys
+        self._tats: "OrderedDict[str, float]" = OrderedDict()
+
+    async def hit(self, key: str, limit: RateLimit, now: float) -> Tuple[bool, float]:
+        tat = max(self._tats.get(key, now), now)
+        new_tat = tat + limit.emission_interval
+        if new_tat - now > limit.tolerance:
+            return False, new_tat - limit.tolerance - now
+        self._tats[key] = new_tat
+        self._tats.move_to_end(key)
+        if len(self._tats) > self.max_keys:
+            self._tats.popitem(last=False)
+        return True, 0.0
+
+
+class MongoBackend(RateLimitBackend):
+    """
+    'rate_limits' collection mein TAT. Poora GCRA step ek pipeline update
+    (findOneAndUpdate) mein hota hai, isliye workers ke beech race nahi hoti.
+    Purani keys 'expiresAt' TTL index se apne aap hat jaati hain.
+    """
+
+    name = "mongo"
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def hit(self, key: str, limit: RateLimit, now: float) -> Tuple[bool, float]:
+        T, tolerance = limit.emission_interval, limit.tolerance
+        doc = await self.collection.find_one_and_update(
+            {"_id": key},
+            [
+                {"$set": {"_base": {"$max": [{"$ifNull": ["$tat", now]}, now]}}},
+                {"$set": {"allowed": {"$lte": [{"$subtract": [{"$add": ["$_base", T]}, now]}, tolerance]}}},
+                {"$set": {
+                    "tat": {"$cond": ["$allowed", {"$add": ["$_base", T]}, "$_base"]},
+                }},
+                {"$set": {"expiresAt": {"$toDate": {"$multiply": ["$tat", 1000]}}}},
+                {"$unset": "_base"},
+            ],
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        if doc["allowed"]:
+            return True, 0.0
+        return False, doc["tat"] + T - tolerance - now
+
+
+_backend: Optional[RateLimitBackend] = None
+
+
+def get_rate_limit_backend() -> RateLimitBackend:
+    """Configured backend (singleton) return karta hai."""
+    global _backend
+    if _backend is None:
+        if RATE_LIMIT_BACKEND == "mongo":
+            from config.db import db
+            _backend = MongoBackend(db.get_collection("rate_limits"))
+        else:
+            _backend = MemoryBackend()
+    return _backend
+
+
+def set_rate_limit_backend(backend: RateLimitBackend) -> None:
+    """Backend badalta hai (jaise tests mein)."""
+    global _backend
+    _backend = backend
+
+
+def client_ip(request: Request) -> str:
+    if RATE_LIMIT_TRUST_PROXY:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            # Sabse aakhri entry hamare proxy ne joda hai (pehli client spoof kar sakta hai)
+            return forwarded.split(",")[-1].strip()
+    return request.client.host if request.client else "unknown"
+
+
+async def enforce_rate_limit(name: str, key: str) -> None:
+    """
+    'name' wali limit ko 'key' (IP, phone, ...) ke liye check karta hai.
+    Limit paar hone par 429 + 'Retry-After'. Backend fail ho to request allow hoti hai.
+    """
+    if not RATE_LIMIT_ENABLED or not key:
+        return
+    limit = RATE_LIMITS[name]
+    try:
+        allowed, retry_after = await get_rate_limit_backend().hit(f"{name}:{key}", limit, time.time())
+    except Exception as e:
+        print(f"[RateLimit] Backend error, request allow ki gayi: {e}")
+        return
+    if not allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Bahut zyada requests. Thodi der baad try karein.",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+
+def rate_limit_by_ip(name: str):
+    """Route dependency: client IP par limit. e.g. dependencies=[Depends(rate_limit_by_ip("login_ip"))]"""
+    async def dependency(request: Request) -> None:
+        await enforce_rate_limit(name, client_ip(request))
+    return dependency
@@ -0,0 +1,371 @@
+import asyncio
+import json
+import os
+import socket
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from config.db import notification_collection, restock_pending_collection
+
+# --- Restock Notification Fan-out ---
+# Jab kisi model ka stock badhta hai (add_cover / update_cover), uski canonical key
+# ek in-memory queue mein daal di jaati hai. Background worker us model ke 'Pending'
+# notifications ko batches mein (indexed canonicalModel + status lookup) nikaalta hai,
+# dispatcher ko bhejta hai aur unhe "In Progress" kar deta hai.
+#
+# Request path sirf 'enqueue()' karta hai (ek marker upsert + put_nowait) - worker ka
+# kaam kabhi response ko nahi rokta. Dispatcher pluggable hai: abhi "log" aur "file" sinks hain,
+# baad mein SMS/WhatsApp provider isi interface par lag sakta hai.
+#
+# Koi model khona nahi chahiye: 'enqueue()' in-memory queue se pehle 'restock_pending'
+# collection mein marker likhta hai, aur marker sirf safal dispatch ke baad hat'ta hai -
+# crash / restart / fail hua dispatch, sab mein model wahin rehta hai. Har dispatch pehle
+# marker ko lease ke saath claim karta hai (owner + leaseUntil), isliye kai workers ek hi
+# model do baar nahi bhejte. Worker har RESTOCK_SWEEP_SECONDS mein aise markers uthata hai
+# jinki lease khatam ho gayi (crash hua worker, backoff wala retry, doosre worker ki request).
+# Worker ke bina (CLI import, scripts) enqueue hue models 'flush()' par dispatch hote hain.
+
+# Dispatcher: "log" (console) ya "file" (JSON lines outbox)
+RESTOCK_DISPATCHER = os.getenv("RESTOCK_DISPATCHER", "log").lower()
+RESTOCK_OUTBOX_FILE = os.getenv(
+    "RESTOCK_OUTBOX_FILE",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "restock_outbox.jsonl")
+)
+# Ek batch mein kitne notifications
+RESTOCK_BATCH_SIZE = int(os.getenv("RESTOCK_BATCH_SIZE", "500"))
+# Dispatcher ko har second zyada se zyada kitne messages (rate limit)
+RESTOCK_RATE_PER_SECOND = float(os.getenv("RESTOCK_RATE_PER_SECOND", "50"))
+# Fail hua model itni baar dobara try hota hai (phir marker agle start tak rehta hai)
+RESTOCK_MAX_ATTEMPTS = int(os.getenv("RESTOCK_MAX_ATTEMPTS", "5"))
+# Pehle retry se pehle ka wait (seconds); har retry par double hota hai
+RESTOCK_RETRY_BACKOFF = float(os.getenv("RESTOCK_RETRY_BACKOFF", "5"))
+# Claim kitni der valid hai (har batch par badhti hai); isse zyada chup worker ko crashed maana jaata hai
+RESTOCK_LEASE_SECONDS = float(os.getenv("RESTOCK_LEASE_SECONDS", "120"))
+# Kitni der mein ek baar bina-lease wale markers dhoondhe jaate hain
+RESTOCK_SWEEP_SECONDS = float(os.getenv("RESTOCK_SWEEP_SECONDS", "5"))
+
+# Lease "khaali" hone ka time (is se pehle ki koi bhi leaseUntil = koi owner nahi)
+_LEASE_FREE = datetime(1970, 1, 1)
+
+
+class Dispatcher:
+    """Restock messages bhejne ka base interface."""
+
+    name = "base"
+
+    async def send(self, model_key: str, notifications: List[Dict[str, Any]]) -> None:
+        """Ek batch ke saare customers ko message bhejta hai. Fail hone par exception."""
+        raise NotImplementedError
+
+
+class LogDispatcher(Dispatcher):
+    """Development stub: messages sirf console par print hote hain."""
+
+    name = "log"
+
+    async def send(self, model_key: str, notifications: List[Dict[str, Any]]) -> None:
+        for notif in notifications:
+            print(f"[Restock] -> {notif.get('phone')}: '{notif.get('modelName')}' wapas stock mein hai!")
+
+
+class FileDispatcher(Dispatcher):
+    """Har message ko ek JSON line ki tarah outbox file mein likhta hai."""
+
+    name = "file"
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def _append(self, lines: List[str]) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.writelines(lines)
+
+    async def send(self, model_key: str, notifications: List[Dict[str, Any]]) -> None:
+        sent_at = datetime.utcnow().isoformat()
+        lines = [
+            json.dumps({
+                "notification_id": str(notif["_id"]),
+                "phone": notif.get("phone"),
+                "modelName": notif.get("modelName"),
+                "canonicalModel": model_key,
+                "sentAt": sent_at,
+            }) + "\n"
+            for notif in notifications
+        ]
+        # File write event loop par nahi
+        await asyncio.to_thread(self._append, lines)
+
+
+class RateLimiter:
+    """Simple token bucket: 'rate' tokens per second, 'burst' tak jama ho sakte hain."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    async def acquire(self, count: int = 1) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Batch bucket se bada ho sakta hai - tab poori bucket le lete hain
+            needed = min(count, self.capacity)
+            if self.tokens >= needed:
+                self.tokens -= needed
+                count -= needed
+                if count <= 0:
+                    return
+            else:
+                await asyncio.sleep((needed - self.tokens) / self.rate)
+
+
+def stock_raised(before: Optional[dict], after: Optional[dict]) -> bool:
+    """
+    Kya is write ke baad model kharidne layak hua / uska stock badha?
+    (naya available cover, stock badha, ya unavailable se available hua)
+    """
+    if not after or not after.get("is_available", True) or after.get("stock", 0) <= 0:
+        return False
+    if before is None:
+        return True
+    if not before.get("is_available", True):
+        return True
+    return after.get("stock", 0) > before.get("stock", 0)
+
+
+class RestockWorker:
+    """Queue + background task jo restocked models ke notifications fan-out karta hai."""
+
+    def __init__(self, dispatcher: Dispatcher, batch_size: int = RESTOCK_BATCH_SIZE,
+                 rate_per_second: float = RESTOCK_RATE_PER_SECOND):
+        self.dispatcher = dispatcher
+        self.batch_size = batch_size
+        self.limiter = RateLimiter(rate_per_second)
+        self.collection = None
+        self.pending = restock_pending_collection
+        # Markers par claim isi naam se (kai workers / processes)
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{ObjectId()}"
+        self._queue: Optional[asyncio.Queue] = None
+        self._queued: Set[str] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._last_sweep = 0.0
+        self.dispatched = 0
+
+    def start(self, collection) -> None:
+        """Startup par call karein (event loop ke andar)."""
+        self.collection = collection
+        self._queue = asyncio.Queue()
+        # Worker se pehle enqueue hue models bhi isi queue mein
+        for model_key in self._queued:
+            self._queue.put_nowait(model_key)
+        self._task = asyncio.create_task(self._run())
+        print(f"[Restock] Worker shuru hua (dispatcher: {self.dispatcher.name}).")
+
+    async def stop(self) -> None:
+        """
+        Shutdown par call karein. Queue mein bache models ke markers pehle se database
+        mein hain; is worker ke claims chhod diye jaate hain taaki doosra / agla worker
+        unhe turant utha sake.
+        """
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.pending.update_many(
+                {"owner": self.worker_id},
+                {"$set": {"leaseUntil": _LEASE_FREE}, "$unset": {"owner": ""}}
+            )
+        except Exception as e:
+            print(f"[Restock] Claims nahi chhode ja sake (lease khatam hone par uthenge): {e}")
+        self._queue = None
+        print("[Restock] Worker band hua.")
+
+    async def enqueue(self, model_key: Optional[str]) -> None:
+        """
+        Model ko fan-out queue mein daalta hai. Pehle database mein marker likhta hai
+        (ek chhota upsert), phir in-memory queue - process beech mein mare to bhi model
+        marker se wapas aata hai. Worker start nahi hua ho to model 'flush()' tak yaad rehta hai.
+        """
+        if not model_key:
+            return
+        try:
+            await self._mark_pending(model_key)
+        except Exception as e:
+            print(f"[Restock] '{model_key}' ka pending marker nahi likha: {e}")
+        self._queue_local(model_key)
+
+    def _queue_local(self, model_key: str) -> None:
+        if model_key in self._queued:
+            return
+        self._queued.add(model_key)
+        if self._queue is not None:
+            self._queue.put_nowait(model_key)
+
+    async def flush(self) -> int:
+        """
+        Worker ke bina (CLI / scripts) enqueue hue models ko abhi dispatch karta hai.
+        Fail hone wale models ka marker rehta hai - server ka worker unhe baad mein uthata hai.
+        """
+        total = 0
+        for model_key in list(self._queued):
+            self._queued.discard(model_key)
+            total += await self._dispatch(model_key)
+        return total
+
+    async def _mark_pending(self, model_key: str) -> None:
+        # 'requestedAt' har enqueue par badalta hai: dispatch ke dauraan aayi nayi request
+        # marker ko delete hone se bachati hai
+        await self.pending.update_one(
+            {"_id": model_key},
+            {"$set": {"requestedAt": datetime.utcnow()},
+             "$setOnInsert": {"queuedAt": datetime.utcnow(), "attempts": 0, "leaseUntil": _LEASE_FREE}},
+            upsert=True
+        )
+
+    async def _claim(self, model_key: str) -> Optional[dict]:
+        """
+        Marker ko atomically claim karta hai (owner + leaseUntil). Kisi aur worker ki
+        lease chal rahi ho to None. Marker na ho (jaise enqueue ka write fail hua) to ban jaata hai.
+        """
+        now = datetime.utcnow()
+        try:
+            return await self.pending.find_one_and_update(
+                {"_id": model_key, "leaseUntil": {"$lte": now}},
+                {"$set": {"owner": self.worker_id, "leaseUntil": now + timedelta(seconds=RESTOCK_LEASE_SECONDS)},
+                 "$setOnInsert": {"queuedAt": now, "requestedAt": now, "attempts": 0}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+        except DuplicateKeyError:
+            # Marker hai par lease kisi aur ke paas
+            return None
+
+    async def renew_lease(self, model_key: str) -> None:
+        """Lambe fan-out mein har batch par lease aage badhati hai."""
+        await self.pending.update_one(
+            {"_id": model_key, "owner": self.worker_id},
+            {"$set": {"leaseUntil": datetime.utcnow() + timedelta(seconds=RESTOCK_LEASE_SECONDS)}}
+        )
+
+    async def _dispatch(self, model_key: str) -> int:
+        """Ek model ka fan-out (claim ke baad); fail hone par marker backoff ke saath rehta hai."""
+        try:
+            claim = await self._claim(model_key)
+        except Exception as e:
+            print(f"[Restock] '{model_key}' claim nahi hua (sweep dobara try karega): {e}")
+            return 0
+        if claim is None:
+            return 0
+        claimed_at = datetime.utcnow()
+        attempt = claim.get("attempts", 0) + 1
+        try:
+            total = await self.process_model(model_key)
+        except Exception as e:
+            print(f"[Restock] '{model_key}' ka fan-out fail hua (attempt {attempt}): {e}")
+            retry_at = claimed_at + timedelta(seconds=RESTOCK_RETRY_BACKOFF * (2 ** (attempt - 1)))
+            try:
+                # Lease hi agla attempt hai: sweep ise 'retry_at' ke baad uthata hai
+                await self.pending.update_one(
+                    {"_id": model_key, "owner": self.worker_id},
+                    {"$set": {"lastError": str(e), "failedAt": claimed_at, "leaseUntil": retry_at},
+                     "$inc": {"attempts": 1}, "$unset": {"owner": ""}}
+                )
+            except Exception as mark_error:
+                print(f"[Restock] '{model_key}' ka marker update nahi hua: {mark_error}")
+            return 0
+        try:
+            done = await self.pending.delete_one(
+                {"_id": model_key, "owner": self.worker_id, "requestedAt": {"$lte": claimed_at}}
+            )
+            if not done.deleted_count:
+                # Dispatch ke dauraan nayi request aayi - claim chhodo, marker agle round ke liye
+                await self.pending.update_one(
+                    {"_id": model_key, "owner": self.worker_id},
+                    {"$set": {"leaseUntil": _LEASE_FREE, "attempts": 0}, "$unset": {"owner": ""}}
+                )
+        except Exception as e:
+            print(f"[Restock] '{model_key}' ka marker saaf nahi hua (dobara bhejne par kuch Pending nahi milega): {e}")
+        return total
+
+    async def _sweep(self, include_exhausted: bool = False) -> None:
+        """
+        Bina lease wale markers (crash hua worker, backoff ke baad retry, doosre worker ki
+        request) queue mein. Startup par RESTOCK_MAX_ATTEMPTS paar kar chuke bhi.
+        """
+        self._last_sweep = time.monotonic()
+        query: Dict[str, Any] = {"leaseUntil": {"$lte": datetime.utcnow()}}
+        if not include_exhausted:
+            query["attempts"] = {"$lt": RESTOCK_MAX_ATTEMPTS}
+        async for doc in self.pending.find(query, {"_id": 1}):
+            self._queue_local(doc["_id"])
+
+    async def _run(self) -> None:
+        try:
+            await self._sweep(include_exhausted=True)
+        except Exception as e:
+            print(f"[Restock] Pending markers load nahi hue: {e}")
+        while True:
+            if time.monotonic() - self._last_sweep >= RESTOCK_SWEEP_SECONDS:
+                try:
+                    await self._sweep()
+                except Exception as e:
+                    self._last_sweep = time.monotonic()
+                    print(f"[Restock] Pending markers sweep fail hua: {e}")
+            try:
+                model_key = await asyncio.wait_for(self._queue.get(), timeout=RESTOCK_SWEEP_SECONDS)
+            except asyncio.TimeoutError:
+                continue
+            self._queued.discard(model_key)
+            await self._dispatch(model_key)
+
+    async def process_model(self, model_key: str) -> int:
+        """
+        Ek model ke saare Pending notifications batches mein dispatch karta hai.
+        Har batch "In Progress" ho jaata hai, isliye agli query apne aap agla batch deti hai.
+        """
+        collection = self.collection if self.collection is not None else notification_collection
+        total = 0
+        while True:
+            batch = await collection.find(
+                {"canonicalModel": model_key, "status": "Pending"},
+                {"phone": 1, "modelName": 1}
+            ).sort("createdAt", 1).limit(self.batch_size).to_list(length=self.batch_size)
+            if not batch:
+                break
+
+            await self.limiter.acquire(len(batch))
+            await self.dispatcher.send(model_key, batch)
+            await collection.update_many(
+                {"_id": {"$in": [doc["_id"] for doc in batch]}, "status": "Pending"},
+                {"$set": {"status": "In Progress", "updatedAt": datetime.utcnow()}}
+            )
+            total += len(batch)
+            self.dispatched += len(batch)
+            await self.renew_lease(model_key)
+
+        if total:
+            print(f"[Restock] '{model_key}': {total} customers ko message bheja gaya.")
+        return total
+
+
+def get_dispatcher() -> Dispatcher:
+    """'RESTOCK_DISPATCHER' env variable ke hisaab se dispatcher banata hai."""
+    if RESTOCK_DISPATCHER == "file":
+        return FileDispatcher(RESTOCK_OUTBOX_FILE)
+    return LogDispatcher()
+
+
+restock_worker = RestockWorker(get_dispatcher())
@@ -0,0 +1,132 @@
+import re
+from typing import List, Dict, Any
+from pymongo import UpdateOne
+
+from utils.model_normalizer import normalize_model_name, canonical_model_key
+
+# --- Model Name Search Helper ---
+# Har cover par write-time par ek normalized 'modelKey' aur 'searchTokens'
+# (edge n-grams) save kiye jaate hain. Search in indexed fields par hota hai,
+# isliye user ka input kabhi regex ki tarah execute nahi hota.
+
+# Ek token ke kitne characters tak prefixes banayenge
+MAX_PREFIX_LENGTH = 20
+
+# Compact (bina space wale) prefixes ko word prefixes se alag rakhne ke liye marker
+COMPACT_MARKER = "~"
+
+# Backfill mein ek baar mein kitne documents update karenge
+BACKFILL_BATCH_SIZE = 500
+
+
+def _prefixes(word: str) -> List[str]:
+    return [word[:i] for i in range(1, min(len(word), MAX_PREFIX_LENGTH) + 1)]
+
+
+def build_search_tokens(model_name: str) -> List[str]:
+    """
+    Model name se edge n-grams banata hai jo 'searchTokens' field mein save hote hain.
+    Har word ke prefixes + poore compact naam ke prefixes (COMPACT_MARKER ke saath).
+    """
+    normalized = normalize_model_name(model_name)
+    tokens = set()
+    for word in normalized.split():
+        tokens.update(_prefixes(word))
+    compact = normalized.replace(" ", "")
+    tokens.update(COMPACT_MARKER + p for p in _prefixes(compact))
+    return sorted(tokens)
+
+
+def search_fields(model_name: str) -> Dict[str, Any]:
+    """Cover document mein save hone wale search fields."""
+    return {
+        "modelKey": normalize_model_name(model_name),
+        "canonicalModel": canonical_model_key(model_name),
+        "searchTokens": build_search_tokens(model_name),
+    }
+
+
+def build_phone_tokens(phone: str) -> List[str]:
+    """
+    Phone number ke digits ke prefixes ('phoneTokens' field). Poore number ("91987...")
+    aur national number (aakhri 10 digits) dono ke, taaki "+91 98765" aur "98765"
+    dono mil jaayein. '+', space, '-' ignore hote hain.
+    """
+    digits = re.sub(r"\D", "", phone or "")
+    tokens = set(_prefixes(digits))
+    tokens.update(_prefixes(digits[-10:]))
+    return sorted(tokens)
+
+
+def phone_query_digits(text: str) -> str:
+    """Search text phone number jaisa ho ("+91 98765-43") to uske digits, warna ""."""
+    digits = re.sub(r"[\s+-]", "", text or "")
+    return digits[:MAX_PREFIX_LENGTH] if digits.isdigit() else ""
+
+
+def build_model_match(query: str) -> Dict[str, Any]:
+    """
+    User ke search text se ek index-friendly MongoDB filter banata hai.
+    Canonical key par exact match ("I Phone 14" == "iphone14" == "Apple iPhone 14"),
+    ya saare words kisi word ke prefix hon, ya compact query compact naam ka prefix ho.
+    """
+    normalized = normalize_model_name(query)
+    if not normalized:
+        return {}
+    words = [w[:MAX_PREFIX_LENGTH] for w in normalized.split()]
+    compact = normalized.replace(" ", "")[:MAX_PREFIX_LENGTH]
+    return {
+        "$or": [
+            {"canonicalModel": canonical_model_key(query)},
+            {"searchTokens": {"$all": words}},
+            {"searchTokens": COMPACT_MARKER + compact},
+        ]
+    }
+
+
+def build_rank_expression(query: str) -> Dict[str, Any]:
+    """
+    Relevance rank ka aggregation expression:
+    0 = exact model (ya same canonical model), 1 = prefix match, 2 = fuzzy (words/compact match).
+    """
+    normalized = normalize_model_name(query)
+    return {
+        "$switch": {
+            "branches": [
+                {"case": {"$eq": ["$canonicalModel", canonical_model_key(query)]}, "then": 0},
+                {"case": {"$eq": ["$modelKey", normalized]}, "then": 0},
+                {"case": {"$eq": [{"$indexOfCP": [{"$ifNull": ["$modelKey", ""]}, normalized]}, 0]}, "then": 1},
+            ],
+            "default": 2,
+        }
+    }
+
+
+async def backfill_search_fields(collection, force: bool = False) -> int:
+    """
+    Purane covers (jin par 'searchTokens' / 'canonicalModel' nahi hai) ke liye search
+    fields bharta hai. Idempotent hai, isliye startup par chalana safe hai.
+    'force=True' saare covers dobara compute karta hai (jaise alias table badalne par).
+    """
+    updated = 0
+    batch = []
+    missing = {"$or": [
+        {"searchTokens": {"$exists": False}},
+        {"canonicalModel": {"$exists": False}},
+    ]}
+    cursor = collection.find({} if force else missing, {"modelName": 1})
+    async for doc in cursor:
+        batch.append(UpdateOne(
+            {"_id": doc["_id"]},
+            {"$set": search_fields(doc.get("modelName", ""))}
+        ))
+        if len(batch) >= BACKFILL_BATCH_SIZE:
+            await collection.bulk_write(batch, ordered=False)
+            updated += len(batch)
+            batch = []
+    if batch:
+        await collection.bulk_write(batch, ordered=False)
+        updated += len(batch)
+    if updated:
+        print(f"[Search] {updated} covers ke search fields backfill kiye gaye.")
+    return updated
@@ -0,0 +1,162 @@
+import io
+import os
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Any, Iterator, Optional
+
+import cloudinary.api
+import cloudinary.uploader
+
+# --- Pluggable Image Storage ---
+# Upload pipeline sirf is interface se baat karta hai. Production mein Cloudinary,
+# aur local development / tests mein filesystem backend istemal hota hai.
+# Backend 'STORAGE_BACKEND' env variable se chuna jaata hai ("cloudinary" ya "local").
+#
+# Har method *synchronous* hai - inhe hamesha upload worker pool se chalaya jaata hai
+# (utils/upload_helper.py), event loop par kabhi nahi.
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class StorageBackend:
+    """Image storage ka base interface."""
+
+    name = "base"
+
+    def upload(self, data: bytes, filename: str, content_type: Optional[str] = None,
+               timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Bytes ko store karta hai aur {"url", "key", "bytes"} return karta hai.
+        'key' wahi hai jo baad mein delete() ko diya jaayega.
+        'timeout' (seconds) network wale backends ka apna request timeout hai -
+        worker thread ko bahar se cancel nahi kiya ja sakta.
+        """
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """Stored asset ko uski key se delete karta hai."""
+        raise NotImplementedError
+
+    def list_assets(self) -> Iterator[Dict[str, Any]]:
+        """
+        Saare stored assets: {"key", "url", "bytes", "created_at" (UTC datetime)}.
+        Orphaned-image GC ka reconciliation scan isse chalta hai (utils/image_gc.py).
+        """
+        raise NotImplementedError
+
+
+class CloudinaryStorage(StorageBackend):
+    """Cloudinary par 'mobile_covers' folder mein images rakhta hai."""
+
+    name = "cloudinary"
+
+    def __init__(self, folder: str = "mobile_covers"):
+        self.folder = folder
+
+    def upload(self, data: bytes, filename: str, content_type: Optional[str] = None,
+               timeout: Optional[float] = None) -> Dict[str, Any]:
+        options: Dict[str, Any] = {"timeout": timeout} if timeout else {}
+        upload_result: Dict[str, Any] = cloudinary.uploader.upload(
+            io.BytesIO(data),
+            folder=self.folder,
+            resource_type="image",
+            **options
+        )
+        secure_url = upload_result.get("secure_url")
+        if not secure_url:
+            raise RuntimeError("Cloudinary upload failed: No secure URL returned.")
+        return {
+            "url": secure_url,
+            "key": upload_result.get("public_id"),
+            "bytes": upload_result.get("bytes", len(data)),
+        }
+
+    def delete(self, key: str) -> None:
+        cloudinary.uploader.destroy(key, resource_type="image")
+
+    def list_assets(self) -> Iterator[Dict[str, Any]]:
+        # Admin API pages mein deta hai ('next_cursor')
+        next_cursor = None
+        while True:
+            page = cloudinary.api.resources(
+                type="upload",
+                resource_type="image",
+                prefix=f"{self.folder}/",
+                max_results=500,
+                next_cursor=next_cursor
+            )
+            for resource in page.get("resources", []):
+                yield {
+                    "key": resource["public_id"],
+                    "url": resource.get("secure_url"),
+                    "bytes": resource.get("bytes", 0),
+                    "created_at": datetime.fromisoformat(resource["created_at"].replace("Z", "+00:00")),
+                }
+            next_cursor = page.get("next_cursor")
+            if not next_cursor:
+                break
+
+
+class LocalStorage(StorageBackend):
+    """
+    Images ko local folder mein save karta hai. FastAPI app inhe '/media' par serve karta hai.
+    """
+
+    name = "local"
+
+    def __init__(self, root: str, base_url: str):
+        self.root = root
+        self.base_url = base_url.rstrip("/")
+        os.makedirs(self.root, exist_ok=True)
+
+    def upload(self, data: bytes, filename: str, content_type: Optional[str] = None,
+               timeout: Optional[float] = None) -> Dict[str, Any]:
+        # Local disk write - timeout ki zaroorat nahi
+        ext = os.path.splitext(filename or "")[1].lower() or ".jpg"
+        key = f"{uuid.uuid4().hex}{ext}"
+        with open(os.path.join(self.root, key), "wb") as f:
+            f.write(data)
+        return {"url": f"{self.base_url}/{key}", "key": key, "bytes": len(data)}
+
+    def delete(self, key: str) -> None:
+        # Key mein koi path component nahi hona chahiye
+        path = os.path.join(self.root, os.path.basename(key))
+        if os.path.exists(path):
+            os.remove(path)
+
+    def list_assets(self) -> Iterator[Dict[str, Any]]:
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+                yield {
+                    "key": entry.name,
+                    "url": f"{self.base_url}/{entry.name}",
+                    "bytes": stat.st_size,
+                    "created_at": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+                }
+
+
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "cloudinary").lower()
+LOCAL_MEDIA_DIR = os.getenv("LOCAL_MEDIA_DIR", os.path.join(BASE_DIR, "media"))
+LOCAL_MEDIA_BASE_URL = os.getenv("LOCAL_MEDIA_BASE_URL", "http://127.0.0.1:8000/media")
+
+_storage: Optional[StorageBackend] = None
+
+
+def get_storage() -> StorageBackend:
+    """Configured storage backend (singleton) return karta hai."""
+    global _storage
+    if _storage is None:
+        if STORAGE_BACKEND == "local":
+            _storage = LocalStorage(LOCAL_MEDIA_DIR, LOCAL_MEDIA_BASE_URL)
+        else:
+            _storage = CloudinaryStorage()
+    return _storage
+
+
+def set_storage(storage: StorageBackend) -> None:
+    """Storage backend ko badalta hai (jaise tests mein LocalStorage lagane ke liye)."""
+    global _storage
+    _storage = storage
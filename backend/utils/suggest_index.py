@@ -0,0 +1,163 @@
+import asyncio
+import os
+import time
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Set, Tuple
+
+from utils.search_helper import normalize_model_name
+
+# --- Model Name Typeahead Index ---
+# Available covers ke distinct (normalized) model names aur unke product counts
+# ek sorted list mein rehte hain. Prefix lookup 'bisect' se O(log n + limit) hai,
+# isliye har keystroke par database tak jaane ki zaroorat nahi.
+#
+# Write endpoints (add/update/delete cover) index ko incrementally update karte hain.
+# Doosre workers ke writes dekhne ke liye index har SUGGEST_REBUILD_SECONDS par
+# background mein database se dobara banta hai. Rebuild ke dauraan jo models badle
+# ('apply_change'), woh aggregation ke baad dobara gine jaate hain - naya index unhe khota nahi.
+
+SUGGEST_REBUILD_SECONDS = float(os.getenv("SUGGEST_REBUILD_SECONDS", "300"))
+# Rebuild ke dauraan badle models ko kitni baar dobara ginenge (har round chhota, indexed 'modelKey')
+SUGGEST_RECOUNT_ROUNDS = 3
+
+
+class ModelSuggestIndex:
+    """Sorted array + bisect par bana prefix index."""
+
+    def __init__(self):
+        self._keys: List[str] = []
+        # key -> [display name, available product count]
+        self._entries: Dict[str, List] = {}
+        self.built_at: float = 0.0
+        # Rebuild chal raha ho to badle hue models ki keys (warna None)
+        self._touched: Optional[Set[str]] = None
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, model_name: str, count: int = 1) -> None:
+        key = normalize_model_name(model_name)
+        if not key:
+            return
+        entry = self._entries.get(key)
+        if entry is None:
+            self._entries[key] = [model_name.strip(), count]
+            insort(self._keys, key)
+        else:
+            entry[0] = model_name.strip() # Sabse naya naam dikhayenge
+            entry[1] += count
+
+    def remove(self, model_name: str, count: int = 1) -> None:
+        key = normalize_model_name(model_name)
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        entry[1] -= count
+        if entry[1] <= 0:
+            del self._entries[key]
+            index = bisect_left(self._keys, key)
+            if index < len(self._keys) and self._keys[index] == key:
+                self._keys.pop(index)
+
+    def apply_change(self, before: Optional[dict], after: Optional[dict]) -> None:
+        """
+        Ek cover ke pehle/baad wale document se index update karta hai.
+        Sirf available covers gine jaate hain.
+        """
+        if self._touched is not None:
+            for doc in (before, after):
+                if doc and doc.get("modelName"):
+                    self._touched.add(normalize_model_name(doc["modelName"]))
+        if before and before.get("is_available", True) and before.get("modelName"):
+            self.remove(before["modelName"])
+        if after and after.get("is_available", True) and after.get("modelName"):
+            self.add(after["modelName"])
+
+    def suggest(self, prefix: str, limit: int = 8) -> List[Tuple[str, int]]:
+        """Normalized prefix se shuru hone wale models (alphabetical order mein)."""
+        key = normalize_model_name(prefix)
+        if not key:
+            return []
+        results = []
+        index = bisect_left(self._keys, key)
+        while index < len(self._keys) and len(results) < limit:
+            candidate = self._keys[index]
+            if not candidate.startswith(key):
+                break
+            name, count = self._entries[candidate]
+            results.append((name, count))
+            index += 1
+        return results
+
+    @staticmethod
+    async def _count(collection, match: dict) -> Dict[str, List]:
+        """Available covers ke model names ginta hai: normalized key -> [display name, count]."""
+        entries: Dict[str, List] = {}
+        pipeline = [
+            {"$match": match},
+            {"$group": {"_id": "$modelName", "count": {"$sum": 1}}},
+        ]
+        async for row in collection.aggregate(pipeline):
+            name = row["_id"]
+            key = normalize_model_name(name or "")
+            if not key:
+                continue
+            if key in entries:
+                entries[key][1] += row["count"]
+            else:
+                entries[key] = [name.strip(), row["count"]]
+        return entries
+
+    async def rebuild(self, collection) -> None:
+        """
+        Database se poora index dobara banata hai (ek aggregation). Is dauraan badle models
+        phir se gine jaate hain aur aakhri swap bina 'await' ke hota hai, isliye beech ke
+        'apply_change' khote nahi. Ek waqt mein ek hi rebuild chalta hai.
+        """
+        async with self._lock:
+            self._touched = set()
+            try:
+                entries = await self._count(collection, {"is_available": True})
+                for _ in range(SUGGEST_RECOUNT_ROUNDS):
+                    touched, self._touched = self._touched, set()
+                    if not touched:
+                        break
+                    fresh = await self._count(
+                        collection, {"is_available": True, "modelKey": {"$in": sorted(touched)}}
+                    )
+                    for key in touched:
+                        entries.pop(key, None)
+                    entries.update(fresh)
+                # Aakhri round ke dauraan bhi badle (bahut busy) - unke liye live index ki value
+                for key in self._touched:
+                    live = self._entries.get(key)
+                    if live is None:
+                        entries.pop(key, None)
+                    else:
+                        entries[key] = list(live)
+                self._entries = entries
+                self._keys = sorted(entries)
+                self.built_at = time.monotonic()
+            finally:
+                self._touched = None
+        print(f"[Suggest] Index bana: {len(self._keys)} models.")
+
+    def refresh_if_stale(self, collection) -> None:
+        """Index purana ho gaya ho to background mein rebuild shuru karta hai."""
+        if self._task is not None and not self._task.done():
+            return
+        if time.monotonic() - self.built_at < SUGGEST_REBUILD_SECONDS:
+            return
+        # Task ka reference rakhna zaroori hai (warna beech mein garbage-collect ho sakta hai)
+        self._task = asyncio.create_task(self._background_rebuild(collection))
+
+    async def _background_rebuild(self, collection) -> None:
+        try:
+            await self.rebuild(collection)
+        except Exception as e:
+            print(f"[Suggest] Rebuild fail hua: {e}")
+
+
+suggest_index = ModelSuggestIndex()
@@ -1,34 +1,266 @@
-import cloudinary.uploader
+import asyncio
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from fastapi import UploadFile, HTTPException, status
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
-async def upload_to_cloudinary(file: UploadFile) -> str:
+from utils.storage import get_storage
+from utils.image_pipeline import build_derivatives
+
+# --- Non-blocking Upload Pipeline ---
+# Storage SDK (jaise cloudinary.uploader.upload) synchronous hai. Use seedha 'async'
+# function mein chalane se poora event loop ruk jaata tha. Ab har upload ek bounded
+# thread pool mein chalta hai, timeout aur retry (exponential backoff) ke saath.
+#
+# Thread ko bahar se cancel nahi kiya ja sakta, isliye timeout SDK ko hi diya jaata hai.
+# Agar thread phir bhi grace ke baad tak chale to: concurrency slot thread khatam hone
+# tak pakda rehta hai, aur uska der se aaya result GC ke liye tombstone hota hai
+# (retry ne us beech apni copy upload kar di hogi).
+#
+# Upload pool ka har kaam (upload, GC delete/list) concurrency slot lekar chalta hai.
+# Derivatives ka resize CPU-bound hai - woh alag, chhote image pool mein chalta hai.
+
+# Ek saath kitne uploads chal sakte hain
+UPLOAD_CONCURRENCY = int(os.getenv("UPLOAD_CONCURRENCY", "10"))
+# Ek attempt ka timeout (seconds)
+UPLOAD_TIMEOUT = float(os.getenv("UPLOAD_TIMEOUT", "30"))
+# SDK timeout ke upar kitna extra wait, phir attempt ko fail maana jaata hai
+UPLOAD_TIMEOUT_GRACE = float(os.getenv("UPLOAD_TIMEOUT_GRACE", "5"))
+# Fail hone par kitni baar aur try karein
+UPLOAD_RETRIES = int(os.getenv("UPLOAD_RETRIES", "2"))
+# Pehle retry se pehle ka wait (seconds); har retry par double hota hai
+UPLOAD_BACKOFF = float(os.getenv("UPLOAD_BACKOFF", "0.5"))
+# Upload ko hash karte waqt ek baar mein kitne bytes padhein
+HASH_CHUNK_SIZE = 1024 * 1024
+# Image resize (CPU) ke liye alag threads - uploads ke network slots inse nahi bharte
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+_executor = ThreadPoolExecutor(max_workers=UPLOAD_CONCURRENCY, thread_name_prefix="upload")
+_image_executor = ThreadPoolExecutor(max_workers=IMAGE_WORKERS, thread_name_prefix="image")
+_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    # Semaphore running event loop ke andar hi banna chahiye
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+    return _semaphore
+
+
+async def run_in_upload_pool(func, *args, **kwargs):
+    """
+    Blocking storage call (delete, list...) ko upload thread pool mein chalata hai -
+    uploads wale concurrency slot ke saath, taaki pool ki queue bounded rahe.
+    """
+    async with _get_semaphore():
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_executor, partial(func, *args, **kwargs))
+
+
+async def run_in_image_pool(func, *args, **kwargs):
+    """CPU-bound image kaam (resize / encode) ko alag image thread pool mein chalata hai."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_image_executor, partial(func, *args, **kwargs))
+
+
+def _tombstone_late_upload(future: "asyncio.Future") -> None:
+    """Timeout ke baad poora hua upload kisi cover mein nahi jaayega - GC queue mein daalo."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    result = future.result()
+    # Circular import se bachne ke liye (image_gc is module ka pool use karta hai)
+    from utils.image_gc import tombstone_assets
+    print(f"[Upload] Timeout ke baad upload poora hua, '{result.get('key')}' tombstone ho raha hai.")
+    asyncio.ensure_future(tombstone_assets([result], reason="upload_timeout"))
+
+
+async def _upload_attempt(storage, data: bytes, filename: str, content_type: Optional[str]) -> Dict[str, Any]:
+    semaphore = _get_semaphore()
+    await semaphore.acquire()
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(
+        _executor, partial(storage.upload, data, filename, content_type, timeout=UPLOAD_TIMEOUT)
+    )
+    # Slot thread ke sach mein khatam hone par hi chhoot-ta hai (timeout ke baad bhi)
+    future.add_done_callback(lambda _: semaphore.release())
+    try:
+        return await asyncio.wait_for(asyncio.shield(future), timeout=UPLOAD_TIMEOUT + UPLOAD_TIMEOUT_GRACE)
+    except asyncio.TimeoutError:
+        future.add_done_callback(_tombstone_late_upload)
+        raise
+
+
+async def store_bytes(data: bytes, filename: str, content_type: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Bytes ko configured storage backend par upload karta hai.
+    Concurrency limit, per-attempt timeout aur retry with backoff ke saath.
+    Return: {"url", "key", "bytes"}
+    """
+    storage = get_storage()
+    last_error: Optional[Exception] = None
+
+    for attempt in range(UPLOAD_RETRIES + 1):
+        try:
+            return await _upload_attempt(storage, data, filename, content_type)
+        except asyncio.TimeoutError:
+            last_error = TimeoutError(f"Upload {UPLOAD_TIMEOUT}s mein poora nahi hua")
+        except Exception as e:
+            last_error = e
+        if attempt < UPLOAD_RETRIES:
+            delay = UPLOAD_BACKOFF * (2 ** attempt)
+            print(f"[Upload] Attempt {attempt + 1} fail ({last_error}), {delay}s baad retry...")
+            await asyncio.sleep(delay)
+
+    raise last_error
+
+
+async def upload_image(file: UploadFile) -> str:
     """
-    File (image) ko Cloudinary par upload karta hai aur uska secure URL return karta hai.
+    File (image) ko storage par upload karta hai aur uska URL return karta hai.
     """
     try:
-        # File ko Cloudinary par upload karna
-        # Humne ek 'mobile_covers' folder specify kiya hai taaki sab saaf-suthra rahe
-        upload_result: Dict[str, Any] = cloudinary.uploader.upload(
-            file.file, 
-            folder="mobile_covers",
-            resource_type="image"
+        # File async read hoti hai; worker thread sirf bytes dekhta hai
+        data = await file.read()
+        result = await store_bytes(data, file.filename, file.content_type)
+        return result["url"]
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        # Agar koi error aaye (jaise credentials galat hain ya timeout)
+        print(f"Image upload error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An error occurred during file upload: {e}"
         )
-        
-        # Upload se mila 'secure_url' (HTTPS URL) return karna
-        secure_url = upload_result.get("secure_url")
-        if not secure_url:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Cloudinary upload failed: No secure URL returned."
-            )
-            
-        return secure_url
 
+
+async def _tombstone_uploaded(assets, reason: str) -> None:
+    """Fail hue store ke upload ho chuke assets GC queue mein (cancel hone par bhi)."""
+    # Circular import se bachne ke liye (image_gc is module ka pool use karta hai)
+    from utils.image_gc import tombstone_assets
+    try:
+        await asyncio.shield(tombstone_assets(assets, reason=reason))
+    except Exception as e:
+        # Queue na likh paaye to reconciliation scan inhe baad mein pakadta hai
+        print(f"[Upload] {len(assets)} assets tombstone nahi ho paaye: {e}")
+
+
+async def store_image_with_derivatives(data: bytes, filename: str, content_type: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Original + derivatives (thumb/card/full) upload karta hai. Resize image pool mein,
+    uploads concurrently. Return: cover document mein merge hone wale fields
+    {"imageUrl", "imageKey", "images"} ('images' None ho sakta hai - Pillow nahi hai).
+    """
+    processed, original = await asyncio.gather(
+        run_in_image_pool(build_derivatives, data),
+        store_bytes(data, filename, content_type),
+        return_exceptions=True
+    )
+    if isinstance(original, BaseException):
+        raise original
+    # Original store ho chuka hai: aage kuch bhi fail ho (resize, derivative upload) to jo
+    # assets upload hue woh kisi cover mein nahi jaayenge - GC queue mein
+    uploaded = [original]
+    try:
+        if isinstance(processed, BaseException):
+            raise processed
+        fields: Dict[str, Any] = {"imageUrl": original["url"], "imageKey": original["key"], "images": None}
+        if not processed:
+            return fields
+
+        base_name = os.path.splitext(filename or "image")[0]
+        stored = await asyncio.gather(*(
+            store_bytes(d["data"], f"{base_name}_{d['name']}.{d['format']}", d["content_type"])
+            for d in processed["derivatives"]
+        ), return_exceptions=True)
+        uploaded += [result for result in stored if not isinstance(result, BaseException)]
+        failed = [result for result in stored if isinstance(result, BaseException)]
+        if failed:
+            raise failed[0]
+        fields["images"] = {
+            "width": processed["width"],
+            "height": processed["height"],
+            "placeholder": processed["placeholder"],
+            "variants": [
+                {
+                    "name": d["name"],
+                    "url": result["url"],
+                    "key": result["key"],
+                    "width": d["width"],
+                    "height": d["height"],
+                    "format": d["format"],
+                    "bytes": result.get("bytes", len(d["data"])),
+                }
+                for d, result in zip(processed["derivatives"], stored)
+            ],
+        }
+        return fields
+    except BaseException:
+        await _tombstone_uploaded(uploaded, reason="derivative_failed")
+        raise
+
+
+async def read_and_hash(file: UploadFile) -> Tuple[bytes, str]:
+    """
+    UploadFile ko chunks mein padhta hai aur saath hi sha256 banata hai (ek hi pass).
+    Return: (bytes, hex digest)
+    """
+    digest = hashlib.sha256()
+    chunks = []
+    while chunk := await file.read(HASH_CHUNK_SIZE):
+        digest.update(chunk)
+        chunks.append(chunk)
+    return b"".join(chunks), digest.hexdigest()
+
+
+async def store_cover_image_bytes(data: bytes, filename: str, content_type: Optional[str] = None,
+                                  content_hash: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Image bytes ko content-hash registry ke through store karta hai: same bytes pehle
+    upload ho chuke hon to storage par dobara nahi jaate - purane URLs/derivatives reuse hote hain.
+    Return: {"imageUrl", "imageKey", "images", "imageHash"} - seedha cover document mein jaate hain.
+    Cover delete/fail hone par 'release_image(imageHash)' call karna zaroori hai.
+    """
+    # Circular import se bachne ke liye (image_store is module ka pool use karta hai)
+    from utils.image_store import acquire_image, register_image
+
+    content_hash = content_hash or hashlib.sha256(data).hexdigest()
+    existing = await acquire_image(content_hash)
+    if existing:
+        print(f"[Upload] Same image pehle se hai ({content_hash[:12]}), upload skip.")
+        return existing
+    fields = await store_image_with_derivatives(data, filename, content_type)
+    try:
+        return await register_image(content_hash, fields, len(data))
+    except BaseException:
+        # Registry mein nahi gaya to koi cover in assets ko use nahi karega
+        from utils.image_gc import cover_image_assets
+        await _tombstone_uploaded(cover_image_assets({**fields, "originalBytes": len(data)}),
+                                  reason="register_failed")
+        raise
+
+
+async def upload_cover_image(file: UploadFile) -> Dict[str, Any]:
+    """
+    Cover ki image (derivatives ke saath, content-hash dedup ke saath) upload karta hai.
+    Return: store_cover_image_bytes() jaisa.
+    """
+    try:
+        data, content_hash = await read_and_hash(file)
+        return await store_cover_image_bytes(data, file.filename, file.content_type, content_hash)
+    except HTTPException:
+        raise
     except Exception as e:
-        # Agar koi error aaye (jaise credentials galat hain)
-        print(f"Cloudinary upload error: {e}")
+        print(f"Image upload error: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An error occurred during file upload: {e}"
-        )
\ No newline at end of file
+        )
+
+
+# Purana naam (controllers isi naam se import karte the)
+upload_to_cloudinary = upload_image
@@ -25,14 +25,24 @@ function App() {
   };
   const handleCloseModal = () => setModal({ show: false, modelName: '' });
   
-  const handleOrderSubmit = async (phone, modelName) => {
+  const handleOrderSubmit = async (phone, modelName, idempotencyKey) => {
     try {
-      await axios.post(`${API_URL}/notify`, { phone, modelName });
+      await axios.post(
+        `${API_URL}/notify`,
+        { phone, modelName },
+        { headers: idempotencyKey ? { 'Idempotency-Key': idempotencyKey } : {} }
+      );
       handleCloseModal();
       setToast({ show: true, message: "Request save ho gayi!" });
     } catch (err) {
       console.error("Order Submit Error:", err);
-      alert("Request submit nahi ho paayi. Server se connect nahi ho pa raha.");
+      if (err.response?.status === 429) {
+        // Rate limit (Retry-After seconds mein)
+        const wait = err.response.headers?.['retry-after'];
+        alert(`Bahut saari requests aa gayi hain. ${wait ? `${wait} second baad` : 'Thodi der baad'} dobara try karein.`);
+      } else {
+        alert("Request submit nahi ho paayi. Server se connect nahi ho pa raha.");
+      }
     }
   };
 
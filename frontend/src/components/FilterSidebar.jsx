@@ -21,8 +21,20 @@ const genderOptions = [
   { value: 'Unisex', label: 'Unisex' },
 ];
 
+// Facet list ({ value, count }[]) ko { value: count } map mein badalna
+const toCountMap = (rows) => {
+  const map = {};
+  (rows || []).forEach(row => { map[row.value] = row.count; });
+  return map;
+};
+
+// Count ho to " (12)" jaisa label, warna kuch nahi
+const countLabel = (map, value) => (
+  map && map[value] !== undefined ? ` (${map[value]})` : ''
+);
+
 // --- Main Sidebar Component ---
-function FilterSidebar({ categories, onFilterChange, isOpen, onClose }) {
+function FilterSidebar({ categories, facets, onFilterChange, isOpen, onClose }) {
   
   const sidebarVariants = {
     open: {
@@ -40,7 +52,7 @@ function FilterSidebar({ categories, onFilterChange, isOpen, onClose }) {
       {/* --- Desktop Sidebar --- */}
       <aside className="hidden md:block w-full md:w-1/4 p-6 bg-white rounded-xl shadow-lg h-fit sticky top-24">
         <h3 className="text-2xl font-bold mb-6 border-b pb-3">Filters</h3>
-        <FilterForm categories={categories} onFilterChange={onFilterChange} />
+        <FilterForm categories={categories} facets={facets} onFilterChange={onFilterChange} />
       </aside>
 
       {/* --- Mobile Sidebar --- */}
@@ -57,7 +69,7 @@ function FilterSidebar({ categories, onFilterChange, isOpen, onClose }) {
               <IoClose />
             </button>
           </div>
-          <FilterForm categories={categories} onFilterChange={onFilterChange} />
+          <FilterForm categories={categories} facets={facets} onFilterChange={onFilterChange} />
         </div>
       </motion.aside>
     </>
@@ -108,7 +120,12 @@ function AccordionSection({ title, children, defaultOpen = false }) {
 
 
 // --- Naya Component: Filter Form ---
-function FilterForm({ categories, onFilterChange }) {
+function FilterForm({ categories, facets, onFilterChange }) {
+  
+  // Server se aaye counts (jab tak search nahi hua, facets null hai)
+  const categoryCounts = facets ? toCountMap(facets.category) : null;
+  const genderCounts = facets ? toCountMap(facets.gender) : null;
+  const colorCounts = facets ? toCountMap(facets.color) : null;
   
   // State to track selected color
   const [selectedColor, setSelectedColor] = useState('all');
@@ -153,7 +170,7 @@ function FilterForm({ categories, onFilterChange }) {
           {/* Agar id nahi hai, to hum ek random key (index) ka istemal karenge. */}
           {categories.map((cat, index) => (
             <option key={cat.id || `cat-${index}`} value={cat.id}> {/* <-- YEH HAI 100% FIX */}
-              {cat.name}
+              {cat.name}{categoryCounts ? ` (${categoryCounts[cat.id] || 0})` : ''}
             </option>
           ))}
           {/* --- END OF FIX --- */}
@@ -179,7 +196,7 @@ function FilterForm({ categories, onFilterChange }) {
                 htmlFor={`gender-${gender.value}`}
                 className="gender-label cursor-pointer px-4 py-2 border rounded-lg transition-all duration-200 capitalize"
               >
-                {gender.label}
+                {gender.label}{gender.value === 'all' ? '' : countLabel(genderCounts, gender.value)}
               </label>
             </React.Fragment>
           ))}
@@ -207,7 +224,7 @@ function FilterForm({ categories, onFilterChange }) {
                   : 'hover:scale-110' // Hover state
                 }
               `}
-              title={color.name}
+              title={`${color.name}${color.hex === 'all' ? '' : countLabel(colorCounts, color.hex)}`}
             >
               {/* 'All' button ke liye icon */}
               {color.hex === 'all' && (
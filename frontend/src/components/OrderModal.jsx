@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react'; // useEffect ko import karein
+import React, { useState, useEffect, useRef } from 'react'; // useEffect ko import karein
 import { motion, AnimatePresence } from 'framer-motion';
 import { IoCloseCircleOutline } from 'react-icons/io5'; // Close icon
 
@@ -10,14 +10,35 @@ function OrderModal({ show, modelName, onClose, onSubmit }) {
   // Model name ke liye local state, taaki user ise edit kar sake
   const [localModelName, setLocalModelName] = useState(modelName);
 
+  // Idempotency-Key ek hi payload (phone + model) ke liye hai: double tap / retry par
+  // wahi key jaati hai aur server wahi request wapas deta hai. Phone ya model badla to
+  // nayi key (server purani key ko doosre payload ke saath 422 karta hai)
+  const idempotency = useRef({ key: '', payload: '' });
+
+  const keyFor = (payload) => {
+    if (idempotency.current.payload !== payload) {
+      idempotency.current = {
+        key: window.crypto?.randomUUID
+          ? window.crypto.randomUUID()
+          : `${Date.now()}-${Math.random().toString(36).slice(2)}`,
+        payload,
+      };
+    }
+    return idempotency.current.key;
+  };
+
   // Jab bhi 'modelName' prop (bahar se) badalta hai, local state ko update karein
   useEffect(() => {
     setLocalModelName(modelName);
+    if (show) {
+      idempotency.current = { key: '', payload: '' };
+    }
   }, [modelName, show]); // 'show' par bhi depend karein taaki modal khulne par reset ho
   // --- END OF FEATURE ---
 
   const handleSubmit = async (e) => {
     e.preventDefault();
+    if (isSubmitting) return; // Double tap
     
     // --- NAYA VALIDATION ---
     if (!localModelName.trim()) {
@@ -33,7 +54,7 @@ function OrderModal({ show, modelName, onClose, onSubmit }) {
     
     setIsSubmitting(true);
     // Submit karte waqt local (edited) model name bhejein
-    await onSubmit(phone, localModelName);
+    await onSubmit(phone, localModelName, keyFor(`${phone}|${localModelName.trim()}`));
     setIsSubmitting(false);
     
     // Form ko reset karein
@@ -1,7 +1,18 @@
-import React from 'react';
+import React, { useState } from 'react';
+
+// Server ke 'images.variants' mein se naam wala (ya sabse bada) variant
+export const imageVariant = (product, name) => {
+  const variants = product.images?.variants || [];
+  return variants.find(v => v.name === name) || variants[variants.length - 1];
+};
 
 // Naya prop 'onImageClick' add kiya gaya hai
 function ProductCard({ product, onOrderNow, onImageClick }) {
+  const [imageLoaded, setImageLoaded] = useState(false);
+  const images = product.images;
+  // Modal mein sabse badi (full) image, warna original
+  const fullImageUrl = imageVariant(product, 'full')?.url || product.imageUrl;
+
   // Helper function: Stock ke hisaab se color return karega
   const getStockColor = () => {
     if (product.stock === 0) return 'text-red-600';
@@ -21,10 +32,25 @@ function ProductCard({ product, onOrderNow, onImageClick }) {
       {/* Product Image Container */}
       <div 
         className="w-full h-64 bg-white overflow-hidden cursor-zoom-in group"
-        onClick={() => onImageClick(product.imageUrl, product.modelName)} // Naya click handler
+        onClick={() => onImageClick(fullImageUrl, product.modelName)} // Naya click handler
+        // Image load hone tak chhota blurred placeholder
+        style={images?.placeholder && !imageLoaded ? {
+          backgroundImage: `url(${images.placeholder})`,
+          backgroundSize: 'contain',
+          backgroundPosition: 'center',
+          backgroundRepeat: 'no-repeat',
+        } : undefined}
       >
         <img
-          src={product.imageUrl}
+          // Grid card ~ 1/4 screen; browser srcset se sahi size chunta hai
+          src={imageVariant(product, 'card')?.url || product.imageUrl}
+          srcSet={images?.srcset}
+          sizes="(min-width: 1024px) 25vw, (min-width: 640px) 50vw, 100vw"
+          width={images?.width}
+          height={images?.height}
+          loading="lazy"
+          decoding="async"
+          onLoad={() => setImageLoaded(true)}
           alt={product.modelName}
           // --- YEH "BEHTREEN" (AWESOME) FIX HAI ---
           // 'object-cover' (jo image kaat raha tha) ko 'object-contain' se badal diya hai
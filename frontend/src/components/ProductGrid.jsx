@@ -1,12 +1,27 @@
-import React from 'react';
+import React, { useEffect, useRef } from 'react';
 import ProductCard from './ProductCard'; 
 import SkeletonCard from './SkeletonCard'; 
 import { motion } from 'framer-motion'; 
 
 // "Behtreen" (Awesome) Update:
 // Humne 'error' ko 'message' (ek object) se badal diya hai
-function ProductGrid({ loading, message, products, onOrderNow, searchTerm, onImageClick }) {
+function ProductGrid({ loading, message, products, onOrderNow, searchTerm, onImageClick, hasMore, loadingMore, onLoadMore }) {
   
+  // --- Infinite Scroll ---
+  // Grid ke neeche ek "sentinel" div hai; jab woh screen par aaye to agla page mangwao
+  const sentinelRef = useRef(null);
+  useEffect(() => {
+    const node = sentinelRef.current;
+    if (!node || !hasMore || !onLoadMore) return;
+    const observer = new IntersectionObserver((entries) => {
+      if (entries[0].isIntersecting) {
+        onLoadMore();
+      }
+    }, { rootMargin: '400px' });
+    observer.observe(node);
+    return () => observer.disconnect();
+  }, [hasMore, onLoadMore, products.length]);
+
   // Loading State
   if (loading) {
     return (
@@ -72,7 +87,7 @@ function ProductGrid({ loading, message, products, onOrderNow, searchTerm, onIma
             key={product.id || `product-${index}`} // <-- YEH HAI 100% FIX
             initial={{ opacity: 0, y: 20 }}
             animate={{ opacity: 1, y: 0 }}
-            transition={{ duration: 0.3, delay: index * 0.05 }}
+            transition={{ duration: 0.3, delay: (index % 24) * 0.05 }}
           >
             <ProductCard 
               product={product} 
@@ -82,7 +97,11 @@ function ProductGrid({ loading, message, products, onOrderNow, searchTerm, onIma
           </motion.div>
           // --- END OF FIX ---
         ))}
+        {loadingMore && [...Array(3)].map((_, i) => (
+          <SkeletonCard key={`more-${i}`} />
+        ))}
       </div>
+      {hasMore && <div ref={sentinelRef} className="h-4" />}
     </div>
   );
 }
@@ -1,7 +1,36 @@
-import React from 'react';
+import React, { useState, useRef } from 'react';
+import axios from 'axios';
 import { FaSearch } from 'react-icons/fa'; // Search icon ke liye
 
+// API URL ko .env file se import karna
+const API_URL = import.meta.env.VITE_API_BASE_URL;
+
 function SearchBar({ onSearchChange }) {
+  // Typeahead: server ke in-memory index se model suggestions
+  const [suggestions, setSuggestions] = useState([]);
+  const timerRef = useRef(null);
+
+  const fetchSuggestions = (text) => {
+    clearTimeout(timerRef.current);
+    if (!text.trim()) {
+      setSuggestions([]);
+      return;
+    }
+    timerRef.current = setTimeout(async () => {
+      try {
+        const response = await axios.get(`${API_URL}/covers/suggest`, { params: { q: text.trim() } });
+        setSuggestions(response.data.suggestions);
+      } catch (err) {
+        setSuggestions([]);
+      }
+    }, 150);
+  };
+
+  const handleChange = (e) => {
+    onSearchChange(e.target.value);
+    fetchSuggestions(e.target.value);
+  };
+
   return (
     <div className="mb-8 p-6 bg-white rounded-xl shadow-lg">
       <h2 className="text-3xl font-bold text-gray-800 mb-4 text-center">
@@ -13,10 +42,18 @@ function SearchBar({ onSearchChange }) {
         </span>
         <input
           type="text"
-          onChange={(e) => onSearchChange(e.target.value)}
+          list="model-suggestions"
+          onChange={handleChange}
           placeholder="e.g., iPhone 14, Samsung A15..."
           className="w-full pl-12 pr-4 py-3 border border-gray-300 rounded-lg shadow-sm text-lg focus:outline-none focus:ring-2 focus:ring-blue-500"
         />
+        <datalist id="model-suggestions">
+          {suggestions.map(s => (
+            <option key={s.modelName} value={s.modelName}>
+              {s.count} cover(s)
+            </option>
+          ))}
+        </datalist>
       </div>
     </div>
   );
@@ -7,13 +7,10 @@ import { BarChart, Bar, XAxis, YAxis, Tooltip, Legend, ResponsiveContainer } fro
 // API URL ko .env file se import karna
 const API_URL = import.meta.env.VITE_API_BASE_URL;
 
-// --- "BEHTREEN" (AWESOME) 100% FIX (Redirect Error) ---
-// Humne URL ke aakhir se "/" (slash) HATA diya hai
-// Taaki yeh Python backend se 100% match kare
-const COVERS_API_URL = `${API_URL}/covers`;
-const CATEGORIES_API_URL = `${API_URL}/categories`;
-const NOTIFY_API_URL = `${API_URL}/notify`;
-// --- END OF FIX ---
+// Dashboard ka saara data ek hi chhote endpoint se aata hai
+const STATS_API_URL = `${API_URL}/admin/stats`;
+// Demand report: sabse zyada maange gaye models + unka current stock
+const DEMAND_API_URL = `${API_URL}/admin/demand`;
 
 // Helper function: Date ko format karne ke liye
 const formatDate = (isoString) => {
@@ -31,62 +28,32 @@ function AdminDashboard({ activeTab }) {
   const [stats, setStats] = useState({ covers: 0, categories: 0, notifications: 0 });
   const [lowStockProducts, setLowStockProducts] = useState([]);
   const [recentNotifications, setRecentNotifications] = useState([]);
+  const [demandRows, setDemandRows] = useState([]);
   const [loading, setLoading] = useState(true);
 
   // --- "BEHTREEN" (AWESOME) DATA FETCHING ---
   const fetchData = async () => {
     setLoading(true);
     try {
-      // --- "BEHTREEN" (AWESOME) 100% FIX (Params + Cache) ---
-      // 1. Covers config (admin_mode ke saath)
-      const coversConfig = {
-        params: { admin_mode: true }, // admin_mode ko params mein bhejein
-        headers: {
-          'Cache-Control': 'no-cache',
-          'Pragma': 'no-cache',
-          'Expires': '0',
-        }
-      };
-      
-      // 2. Normal config (baaki calls ke liye)
-      const config = {
-        headers: {
-          'Cache-Control': 'no-cache',
-          'Pragma': 'no-cache',
-          'Expires': '0',
-        }
-      };
-      // --- END OF FIX ---
-
-      // Teeno API calls ek saath (parallel) bhejenge
-      const [coversRes, categoriesRes, notificationsRes] = await Promise.all([
-        // --- "BEHTREEN" (AWESOME) 100% FIX ---
-        // Humne URL se '?admin_mode=true' hata diya aur 'coversConfig' pass kiya
-        axios.get(COVERS_API_URL, coversConfig), 
-        axios.get(CATEGORIES_API_URL, config),
-        axios.get(NOTIFY_API_URL, config)
-        // --- END OF FIX ---
+      // Server ek hi aggregation se counts, low-stock aur recent orders bhejta hai
+      const [{ data }, demand] = await Promise.all([
+        axios.get(STATS_API_URL),
+        axios.get(DEMAND_API_URL, { params: { days: 30, limit: 10 } }).catch(() => ({ data: { rows: [] } }))
       ]);
-      
-      const allProducts = coversRes.data;
-      const allNotifications = notificationsRes.data;
+      setDemandRows(demand.data.rows);
 
       // 1. Stats set karein
       setStats({
-        covers: allProducts.length,
-        categories: categoriesRes.data.length,
-        notifications: allNotifications.filter(n => n.status === 'Pending').length // Sirf 'Pending' count karein
+        covers: data.covers,
+        categories: data.categories,
+        notifications: data.notifications_by_status.Pending || 0 // Sirf 'Pending' count karein
       });
 
-      // 2. "Behtreen" (Awesome) Chart Data: Stock < 10 wale products
-      const lowStock = allProducts
-        .filter(p => p.stock < 10)
-        .sort((a, b) => a.stock - b.stock) // Sabse kam stock wale pehle
-        .slice(0, 5); // Sirf top 5
-      setLowStockProducts(lowStock);
+      // 2. "Behtreen" (Awesome) Chart Data: Stock < 10 wale products (top 5)
+      setLowStockProducts(data.low_stock);
       
       // 3. "Behtreen" (Awesome) Recent Orders Data
-      setRecentNotifications(allNotifications.slice(0, 5)); // Naye 5
+      setRecentNotifications(data.recent_notifications);
 
     } catch (err) {
       console.error("Stats fetch karne mein error:", err);
@@ -180,6 +147,42 @@ function AdminDashboard({ activeTab }) {
 
       </div>
       {/* --- END OF NAYA LAYOUT --- */}
+
+      {/* 3. Demand: sabse zyada maange gaye models (pichle 30 din) */}
+      <div className="bg-white p-6 rounded-lg shadow-md mt-8">
+        <h2 className="text-2xl font-bold mb-4">Most Requested Models (30 days)</h2>
+        {loading ? (
+          <AdminLoading />
+        ) : (
+          <table className="min-w-full divide-y divide-gray-200">
+            <thead className="bg-gray-50">
+              <tr>
+                <th className="px-4 py-2 text-left text-xs font-medium text-gray-500 uppercase">Model</th>
+                <th className="px-4 py-2 text-left text-xs font-medium text-gray-500 uppercase">Open Requests</th>
+                <th className="px-4 py-2 text-left text-xs font-medium text-gray-500 uppercase">Stock</th>
+              </tr>
+            </thead>
+            <tbody className="divide-y divide-gray-200">
+              {demandRows.length === 0 && (
+                <tr><td colSpan="3" className="px-4 py-3 text-gray-500">Koi open requests nahi hain.</td></tr>
+              )}
+              {demandRows.map(row => (
+                <tr key={row.canonicalModel}>
+                  <td className="px-4 py-2 text-sm font-medium text-gray-900">{row.modelName}</td>
+                  <td className="px-4 py-2 text-sm text-gray-700">{row.total}</td>
+                  <td className="px-4 py-2 text-sm">
+                    <span className={`px-2 py-1 text-xs font-semibold rounded-full ${
+                      row.low_stock ? 'bg-red-100 text-red-800' : 'bg-green-100 text-green-800'
+                    }`}>
+                      {row.stock}
+                    </span>
+                  </td>
+                </tr>
+              ))}
+            </tbody>
+          </table>
+        )}
+      </div>
     </div>
   );
 }
@@ -138,6 +138,15 @@ function AdminManageProducts({ activeTab }) {
   const [error, setError] = useState(null);
   const [searchTerm, setSearchTerm] = useState('');
   const [editingModal, setEditingModal] = useState({ show: false, product: null });
+  // Products ab pages mein aate hain; agle page ka cursor
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+  // Bulk update (PATCH /covers/bulk) ke liye chune gaye IDs
+  const [selected, setSelected] = useState([]);
+  const [pricePercent, setPricePercent] = useState('');
+  const [bulkStock, setBulkStock] = useState('');
+  const [bulkLoading, setBulkLoading] = useState(false);
+  const [bulkMessage, setBulkMessage] = useState('');
 
   // Products aur Categories fetch karne ke liye function
   const fetchData = async (search = '') => {
@@ -167,10 +176,11 @@ function AdminManageProducts({ activeTab }) {
       ]);
       // --- END OF FIX ---
 
-      setProducts(productsRes.data);
+      setProducts(productsRes.data.items);
+      setNextCursor(productsRes.data.next_cursor);
       setCategories(categoriesRes.data);
       
-      if (productsRes.data.length === 0) {
+      if (productsRes.data.items.length === 0) {
         setError('Is search ke liye koi product nahi mila.');
       }
     } catch (err) {
@@ -186,11 +196,84 @@ function AdminManageProducts({ activeTab }) {
     }
   }, [activeTab]); 
 
+  // Agla page (same search ke saath) fetch karna
+  const fetchMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const params = new URLSearchParams();
+      params.append('admin_mode', true);
+      params.append('cursor', nextCursor);
+      if (searchTerm) {
+        params.append('model', searchTerm);
+      }
+      const response = await axios.get(COVERS_API_URL_SLASH, { params });
+      setProducts(prev => [...prev, ...response.data.items]);
+      setNextCursor(response.data.next_cursor);
+    } catch (err) {
+      setError('Aur products load nahi ho paaye.');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleSearch = (e) => {
     e.preventDefault();
+    setSelected([]);
     fetchData(searchTerm);
   };
 
+  const toggleSelected = (id) => {
+    setSelected(prev => prev.includes(id) ? prev.filter(x => x !== id) : [...prev, id]);
+  };
+
+  // Bulk update: chune hue products, ya (kuch nahi chuna to) current search ke saare matching.
+  // Ek hi request - sequential PUTs nahi.
+  const handleBulkUpdate = async (operation, label) => {
+    const useIds = selected.length > 0;
+    if (!useIds && !searchTerm.trim()) {
+      setError('Pehle products select kijiye ya model search kijiye.');
+      return;
+    }
+    const target = useIds ? `${selected.length} selected product(s)` : `'${searchTerm.trim()}' ke saare products`;
+    if (!window.confirm(`${target} par "${label}" lagana hai?`)) return;
+
+    setBulkLoading(true);
+    setError(null);
+    setBulkMessage('');
+    try {
+      const filter = useIds ? { ids: selected } : { model: searchTerm.trim() };
+      const response = await axios.patch(`${COVERS_API_URL_NOSLASH}/bulk`, { filter, ...operation });
+      const { modified, errors } = response.data;
+      setBulkMessage(`${modified} product(s) update ho gaye.${errors.length ? ` ${errors.length} error(s): ${errors[0].error}` : ''}`);
+      setSelected([]);
+      fetchData(searchTerm);
+    } catch (err) {
+      const detail = err.response?.data?.detail;
+      setError(typeof detail === 'string' ? detail : 'Bulk update nahi ho paaya.');
+    } finally {
+      setBulkLoading(false);
+    }
+  };
+
+  const handleBulkPrice = () => {
+    const percent = parseFloat(pricePercent);
+    if (Number.isNaN(percent) || percent === 0) {
+      setError('Price change % dijiye (jaise -10 ya 15).');
+      return;
+    }
+    handleBulkUpdate({ price_percent: percent }, `price ${percent > 0 ? '+' : ''}${percent}%`);
+  };
+
+  const handleBulkStock = () => {
+    const stock = parseInt(bulkStock, 10);
+    if (Number.isNaN(stock) || stock < 0) {
+      setError('Stock 0 ya usse zyada hona chahiye.');
+      return;
+    }
+    handleBulkUpdate({ $set: { stock } }, `stock = ${stock}`);
+  };
+
   // Product Delete Karna (FIXED)
   const handleDelete = async (id, name) => {
     if (!window.confirm(`Kya aap waqai '${name}' product ko delete karna chahte hain?`)) {
@@ -282,6 +365,64 @@ function AdminManageProducts({ activeTab }) {
         </button>
       </div>
 
+      {/* --- BULK ACTION BAR --- */}
+      <div className="mb-6 flex flex-wrap items-center gap-2 bg-white p-4 rounded-lg shadow-md">
+        <span className="text-sm text-gray-700">
+          {selected.length > 0 ? `${selected.length} selected` : 'Search ke saare products'}:
+        </span>
+        <input
+          type="number"
+          step="any"
+          value={pricePercent}
+          onChange={(e) => setPricePercent(e.target.value)}
+          placeholder="Price %"
+          className="w-24 p-2 border rounded-lg"
+        />
+        <button
+          onClick={handleBulkPrice}
+          disabled={bulkLoading}
+          className="px-3 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 disabled:bg-gray-400"
+        >
+          Price Badlein
+        </button>
+        <input
+          type="number"
+          min="0"
+          value={bulkStock}
+          onChange={(e) => setBulkStock(e.target.value)}
+          placeholder="Stock"
+          className="w-24 p-2 border rounded-lg"
+        />
+        <button
+          onClick={handleBulkStock}
+          disabled={bulkLoading}
+          className="px-3 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 disabled:bg-gray-400"
+        >
+          Stock Set Karein
+        </button>
+        <button
+          onClick={() => handleBulkUpdate({ $set: { is_available: true } }, 'Available')}
+          disabled={bulkLoading}
+          className="px-3 py-2 bg-green-600 text-white rounded-lg hover:bg-green-700 disabled:bg-gray-400"
+        >
+          Available
+        </button>
+        <button
+          onClick={() => handleBulkUpdate({ $set: { is_available: false } }, 'Unavailable')}
+          disabled={bulkLoading}
+          className="px-3 py-2 bg-gray-500 text-white rounded-lg hover:bg-gray-600 disabled:bg-gray-400"
+        >
+          Unavailable
+        </button>
+        {bulkLoading && <span className="text-sm text-gray-500">Updating...</span>}
+      </div>
+
+      {bulkMessage && (
+        <div className="p-4 rounded-md mb-6 bg-green-100 text-green-800">
+          {bulkMessage}
+        </div>
+      )}
+
       {/* Error Message */}
       {error && (
         <div className="p-4 rounded-md mb-6 bg-red-100 text-red-800">
@@ -295,6 +436,13 @@ function AdminManageProducts({ activeTab }) {
           <table className="min-w-full divide-y divide-gray-200">
             <thead className="bg-gray-50">
               <tr>
+                <th className="px-4 py-3">
+                  <input
+                    type="checkbox"
+                    checked={products.length > 0 && selected.length === products.length}
+                    onChange={(e) => setSelected(e.target.checked ? products.map(p => p.id) : [])}
+                  />
+                </th>
                 <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Image</th>
                 <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Model Name / Color</th>
                 <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Price / Stock</th>
@@ -305,13 +453,25 @@ function AdminManageProducts({ activeTab }) {
             <tbody className="bg-white divide-y divide-gray-200">
               {loading && (
                 <tr>
-                  <td colSpan="5" className="text-center p-4">Loading products...</td>
+                  <td colSpan="6" className="text-center p-4">Loading products...</td>
                 </tr>
               )}
               {products.map(product => (
                 <tr key={product.id} className={!product.is_available ? 'bg-gray-100 opacity-60' : ''}>
+                  <td className="px-4 py-4">
+                    <input
+                      type="checkbox"
+                      checked={selected.includes(product.id)}
+                      onChange={() => toggleSelected(product.id)}
+                    />
+                  </td>
                   <td className="px-6 py-4 whitespace-nowrap">
-                    <img src={product.imageUrl} alt={product.modelName} className="w-12 h-12 object-cover rounded-md" />
+                    <img
+                      src={product.images?.variants?.[0]?.url || product.imageUrl}
+                      alt={product.modelName}
+                      loading="lazy"
+                      className="w-12 h-12 object-cover rounded-md"
+                    />
                   </td>
                   <td className="px-6 py-4 whitespace-nowrap">
                     <div className="text-sm font-medium text-gray-900">{product.modelName}</div>
@@ -353,6 +513,17 @@ function AdminManageProducts({ activeTab }) {
             </tbody>
           </table>
         </div>
+        {nextCursor && (
+          <div className="p-4 text-center border-t border-gray-200">
+            <button
+              onClick={fetchMore}
+              disabled={loadingMore}
+              className="px-6 py-2 bg-gray-200 text-gray-700 rounded-md hover:bg-gray-300 disabled:opacity-50"
+            >
+              {loadingMore ? 'Loading...' : 'Load More'}
+            </button>
+          </div>
+        )}
       </div>
 
       <EditProductModal
@@ -5,21 +5,47 @@ import { FaBell, FaSync, FaSpinner } from 'react-icons/fa';
 // API URL ko .env file se import karna
 const API_URL = import.meta.env.VITE_API_BASE_URL;
 
+// Ek baar mein kitne notifications mangwane hain
+const PAGE_SIZE = 50;
+
 function AdminNotifications() {
   const [notifications, setNotifications] = useState([]);
   const [loading, setLoading] = useState(false);
   const [message, setMessage] = useState({ type: '', text: '' });
   const [filter, setFilter] = useState('Pending'); // Naya state filter ke liye
+  const [search, setSearch] = useState(''); // Phone ya model search
+  const [total, setTotal] = useState(0);
+  const [totalCapped, setTotalCapped] = useState(false); // Server ne ginti limit par rok di
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [selected, setSelected] = useState([]); // Bulk update ke liye chune gaye IDs
+  const [bulkStatus, setBulkStatus] = useState('Completed');
+  const [bulkLoading, setBulkLoading] = useState(false);
+
+  // Filtering, search aur pagination ab server par hote hain
+  const buildParams = (cursor) => {
+    const params = { limit: PAGE_SIZE };
+    if (filter !== 'All') params.status = filter;
+    if (search.trim()) params.q = search.trim();
+    if (cursor) params.cursor = cursor;
+    return params;
+  };
+
+  // "1000+" jab server ne ginti limit par rok di
+  const totalLabel = `${total}${totalCapped ? '+' : ''}`;
 
-  // Notifications fetch karne ke liye function
+  // Notifications fetch karne ke liye function (pehla page)
   const fetchNotifications = async () => {
     setLoading(true);
     setMessage({ type: '', text: '' });
     try {
-      // Humne backend ko update kar diya hai, ab yeh sabhi notifications layega
-      const response = await axios.get(`${API_URL}/notify`);
-      setNotifications(response.data);
-      if (response.data.length === 0) {
+      const response = await axios.get(`${API_URL}/notify`, { params: buildParams() });
+      setNotifications(response.data.items);
+      setSelected([]);
+      setNextCursor(response.data.next_cursor);
+      setTotal(response.data.total ?? 0);
+      setTotalCapped(response.data.total_capped);
+      if (response.data.items.length === 0) {
         setMessage({ type: 'info', text: 'Koi pre-order requests nahi hain.' });
       }
     } catch (err) {
@@ -29,10 +55,27 @@ function AdminNotifications() {
     }
   };
 
-  // Page load par notifications fetch karein
+  // Agla page (keyset cursor se)
+  const fetchMoreNotifications = async () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const response = await axios.get(`${API_URL}/notify`, { params: buildParams(nextCursor) });
+      setNotifications(prev => [...prev, ...response.data.items]);
+      setNextCursor(response.data.next_cursor);
+      // Total sirf pehle page par aata hai
+    } catch (err) {
+      setMessage({ type: 'error', text: 'Aur pre-orders load nahi ho pa rahe.' });
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  // Page load aur filter/search badalne par notifications fetch karein
   useEffect(() => {
-    fetchNotifications();
-  }, []);
+    const timer = setTimeout(fetchNotifications, 300); // Search typing ke liye debounce
+    return () => clearTimeout(timer);
+  }, [filter, search]);
 
   // --- NAYA FUNCTION: Status Update Karne Ke Liye ---
   const handleStatusChange = async (id, newStatus) => {
@@ -58,6 +101,44 @@ function AdminNotifications() {
   };
   // --- NAYA FUNCTION ---
 
+  const toggleSelected = (id) => {
+    setSelected(prev => prev.includes(id) ? prev.filter(x => x !== id) : [...prev, id]);
+  };
+
+  // Bulk status update: chune hue IDs, ya (kuch nahi chuna to) current filter ke saare matching
+  const handleBulkUpdate = async () => {
+    const useIds = selected.length > 0;
+    const filterPayload = {};
+    if (filter !== 'All') filterPayload.status = [filter];
+    if (search.trim()) filterPayload.q = search.trim();
+    if (!useIds && Object.keys(filterPayload).length === 0) {
+      setMessage({ type: 'error', text: 'Pehle status filter ya search chuniye, ya rows select kijiye.' });
+      return;
+    }
+    const count = useIds ? selected.length : totalLabel;
+    if (!window.confirm(`${count} request(s) ko '${bulkStatus}' mark karna hai?`)) return;
+
+    setBulkLoading(true);
+    setMessage({ type: '', text: '' });
+    try {
+      const payload = useIds
+        ? { ids: selected, status: bulkStatus }
+        : { filter: filterPayload, status: bulkStatus };
+      const response = await axios.put(`${API_URL}/notify/bulk`, payload);
+      const { modified, conflicts = [], failed = [] } = response.data;
+      const skipped = conflicts.length + failed.length;
+      setMessage(skipped > 0
+        ? { type: 'error', text: `${modified} request(s) '${bulkStatus}' ho gayi; ${skipped} nahi ho paayi (usi phone + model ki open request pehle se hai).` }
+        : { type: 'success', text: `${modified} request(s) '${bulkStatus}' ho gayi!` });
+      fetchNotifications();
+    } catch (err) {
+      console.error("Bulk Update Error:", err);
+      setMessage({ type: 'error', text: 'Bulk update nahi ho paaya.' });
+    } finally {
+      setBulkLoading(false);
+    }
+  };
+
   // Helper function: Date ko format karne ke liye
   const formatDate = (isoString) => {
     try {
@@ -88,12 +169,6 @@ function AdminNotifications() {
     }
   };
 
-  // Filtered notifications
-  const filteredNotifications = notifications.filter(notif => {
-    if (filter === 'All') return true;
-    return notif.status === filter;
-  });
-
   return (
     <div>
       <div className="flex justify-between items-center mb-8">
@@ -109,7 +184,7 @@ function AdminNotifications() {
       </div>
 
       {/* --- NAYA FILTER BAR --- */}
-      <div className="mb-6 flex gap-2">
+      <div className="mb-6 flex flex-wrap items-center gap-2">
         {['Pending', 'In Progress', 'Completed', 'Cancelled', 'All'].map(status => (
           <button
             key={status}
@@ -123,9 +198,41 @@ function AdminNotifications() {
             {status}
           </button>
         ))}
+        <input
+          type="text"
+          value={search}
+          onChange={(e) => setSearch(e.target.value)}
+          placeholder="Phone ya model search karein..."
+          className="ml-auto px-4 py-2 border border-gray-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500"
+        />
+        <span className="text-sm text-gray-600">{totalLabel} request(s)</span>
       </div>
       {/* --- NAYA FILTER BAR --- */}
 
+      {/* --- BULK ACTION BAR --- */}
+      <div className="mb-6 flex flex-wrap items-center gap-2 bg-white p-4 rounded-lg shadow">
+        <span className="text-sm text-gray-700">
+          {selected.length > 0 ? `${selected.length} selected` : `Filter ke saare ${totalLabel} request(s)`} ko mark karein:
+        </span>
+        <select
+          value={bulkStatus}
+          onChange={(e) => setBulkStatus(e.target.value)}
+          className="p-2 border rounded-lg"
+        >
+          <option value="Pending">Pending</option>
+          <option value="In Progress">In Progress</option>
+          <option value="Completed">Completed</option>
+          <option value="Cancelled">Cancelled</option>
+        </select>
+        <button
+          onClick={handleBulkUpdate}
+          disabled={bulkLoading || (selected.length === 0 && total === 0)}
+          className="px-4 py-2 bg-green-600 text-white rounded-lg shadow hover:bg-green-700 disabled:bg-gray-400"
+        >
+          {bulkLoading ? 'Updating...' : 'Apply'}
+        </button>
+      </div>
+
       {/* Success/Error Message Box */}
       {message.text && (
         <div className={`p-4 rounded-md mb-6 ${
@@ -142,6 +249,13 @@ function AdminNotifications() {
           <table className="min-w-full divide-y divide-gray-200">
             <thead className="bg-gray-50">
               <tr>
+                <th className="px-4 py-3">
+                  <input
+                    type="checkbox"
+                    checked={notifications.length > 0 && selected.length === notifications.length}
+                    onChange={(e) => setSelected(e.target.checked ? notifications.map(n => n.id) : [])}
+                  />
+                </th>
                 <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Phone Number</th>
                 <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Model Name</th>
                 <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Request Date</th>
@@ -152,13 +266,20 @@ function AdminNotifications() {
             <tbody className="bg-white divide-y divide-gray-200">
               {loading && !message.text && (
                 <tr>
-                  <td colSpan="5" className="text-center py-4">
+                  <td colSpan="6" className="text-center py-4">
                     <FaSpinner className="animate-spin text-2xl text-gray-400 mx-auto" />
                   </td>
                 </tr>
               )}
-              {filteredNotifications.map(notification => (
+              {notifications.map(notification => (
                 <tr key={notification.id}>
+                  <td className="px-4 py-4">
+                    <input
+                      type="checkbox"
+                      checked={selected.includes(notification.id)}
+                      onChange={() => toggleSelected(notification.id)}
+                    />
+                  </td>
                   <td className="px-6 py-4 whitespace-nowrap">
                     <div className="text-sm font-medium text-gray-900">{notification.phone}</div>
                   </td>
@@ -195,6 +316,17 @@ function AdminNotifications() {
             </tbody>
           </table>
         </div>
+        {nextCursor && (
+          <div className="text-center mt-6">
+            <button
+              onClick={fetchMoreNotifications}
+              disabled={loadingMore}
+              className="px-6 py-2 bg-gray-100 text-gray-800 rounded-lg hover:bg-gray-200 disabled:opacity-50"
+            >
+              {loadingMore ? 'Loading...' : `Load More (${notifications.length} / ${totalLabel})`}
+            </button>
+          </div>
+        )}
       </div>
     </div>
   );
@@ -97,34 +97,35 @@ function AdminUpload() {
     setLoading(true);
     setMessage({ type: 'info', text: `Uploading ${variants.length} variants...` });
 
-    let successfulUploads = 0;
+    // --- Naya Logic: Saare variants ek hi bulk request mein ---
+    // Server images ko ek saath upload karta hai aur har variant ka result batata hai
+    const formData = new FormData();
     
-    // --- Naya Logic: Har variant ke liye ek-ek karke API call karein ---
-    for (const variant of variants) {
-      const formData = new FormData();
-      
-      // Common details
-      formData.append('modelName', modelName);
-      formData.append('coverType', coverType);
-      formData.append('price', price);
-      formData.append('genderPreference', genderPreference);
-      formData.append('tags', JSON.stringify(tags.split(',').map(t => t.trim()).filter(t => t)));
-      formData.append('category_ids', JSON.stringify(selectedCategories));
-      
-      // Variant-specific details
-      formData.append('color', variant.color);
-      formData.append('stock', variant.stock);
-      formData.append('image', variant.file);
+    // Common details
+    formData.append('modelName', modelName);
+    formData.append('coverType', coverType);
+    formData.append('price', price);
+    formData.append('genderPreference', genderPreference);
+    formData.append('tags', JSON.stringify(tags.split(',').map(t => t.trim()).filter(t => t)));
+    formData.append('category_ids', JSON.stringify(selectedCategories));
+    
+    // Variant-specific details (images isi order mein)
+    formData.append('variants', JSON.stringify(
+      variants.map(v => ({ color: v.color, stock: Number(v.stock) }))
+    ));
+    variants.forEach(v => formData.append('images', v.file));
 
-      try {
-        await axios.post(`${API_URL}/covers`, formData, {
-          headers: { 'Content-Type': 'multipart/form-data' },
-        });
-        successfulUploads++;
-      } catch (err) {
-        console.error(`Upload Error for ${variant.color}:`, err);
-        // Agar ek fail ho jaaye, to bhi continue karein
-      }
+    let successfulUploads = 0;
+    let failedVariants = [];
+    try {
+      const response = await axios.post(`${API_URL}/covers/bulk`, formData, {
+        headers: { 'Content-Type': 'multipart/form-data' },
+      });
+      successfulUploads = response.data.created;
+      failedVariants = response.data.results.filter(r => !r.success);
+      failedVariants.forEach(r => console.error(`Upload Error for ${r.color}:`, r.error));
+    } catch (err) {
+      console.error('Bulk Upload Error:', err);
     }
     
     setLoading(false);
@@ -139,7 +140,13 @@ function AdminUpload() {
       setSelectedCategories([]);
       setVariants([]);
     } else {
-      setMessage({ type: 'error', text: `${successfulUploads} / ${variants.length} covers upload hue. Kuch fail ho gaye (console check karein).` });
+      const failedColors = failedVariants.map(r => r.color).join(', ');
+      setMessage({ type: 'error', text: `${successfulUploads} / ${variants.length} covers upload hue. Fail hue: ${failedColors || 'sabhi'} (console check karein).` });
+      // Sirf fail hue variants form mein rehne dein taaki dobara try ho sake
+      const failedIndexes = new Set(failedVariants.map(r => r.index));
+      if (successfulUploads > 0) {
+        setVariants(prev => prev.filter((_, i) => failedIndexes.has(i)));
+      }
     }
   };
 
@@ -62,6 +62,12 @@ function HomePage({ onOrderNow }) {
     const [products, setProducts] = useState([]);
     const [categories, setCategories] = useState([]);
     const [loading, setLoading] = useState(true);
+    // Infinite scroll ke liye: agle page ka cursor aur "aur load ho raha hai" state
+    const [nextCursor, setNextCursor] = useState(null);
+    const [loadingMore, setLoadingMore] = useState(false);
+    const [lastParams, setLastParams] = useState(null);
+    // Sidebar ke har option ke saamne product count
+    const [facets, setFacets] = useState(null);
     // --- "BEHTREEN" (AWESOME) UPDATE ---
     // Hum 'error' ko 'message' (ek object) se badal rahe hain
     const [message, setMessage] = useState({ type: '', text: '' });
@@ -104,6 +110,8 @@ function HomePage({ onOrderNow }) {
         // Agar model, category, gender, color sab "all" hai, to request na bhejein
         if (!currentFilters.model.trim() && currentFilters.category_id === 'all' && currentFilters.gender === 'all' && !currentFilters.color) {
             setProducts([]);
+            setNextCursor(null);
+            setFacets(null);
             setLoading(false);
             // --- "BEHTREEN" (AWESOME) UPDATE ---
             // 'info' type ka message set karein
@@ -128,10 +136,18 @@ function HomePage({ onOrderNow }) {
         params.append('maxPrice', currentFilters.maxPrice);
 
         try {
-            const response = await axios.get(`${API_URL}/covers/`, { params });
-            setProducts(response.data);
+            // Products aur facet counts ek saath (parallel) mangwayein
+            const [response, facetsResponse] = await Promise.all([
+                axios.get(`${API_URL}/covers/`, { params }),
+                axios.get(`${API_URL}/covers/facets`, { params }).catch(() => null),
+            ]);
+            setFacets(facetsResponse ? facetsResponse.data : null);
+            // API ab ek page bhejta hai: { items, next_cursor }
+            setProducts(response.data.items);
+            setNextCursor(response.data.next_cursor);
+            setLastParams(params);
             
-            if (response.data.length === 0) {
+            if (response.data.items.length === 0) {
                 // --- "BEHTREEN" (AWESOME) UPDATE ---
                 // 'info' type ka message set karein
                 setMessage({ type: 'info', text: "Mila nahi? Fikr not! 'Custom Order' button dabayein aur humein batayein." });
@@ -148,6 +164,24 @@ function HomePage({ onOrderNow }) {
         }
     };
 
+    // --- Infinite Scroll: Agla page fetch karna ---
+    const fetchMoreProducts = async () => {
+        if (!nextCursor || loadingMore || !lastParams) return;
+        setLoadingMore(true);
+        try {
+            const params = new URLSearchParams(lastParams);
+            params.set('cursor', nextCursor);
+            const response = await axios.get(`${API_URL}/covers/`, { params });
+            setProducts(prev => [...prev, ...response.data.items]);
+            setNextCursor(response.data.next_cursor);
+        } catch (err) {
+            console.error("Load More Error:", err);
+            setNextCursor(null);
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     // Page load par categories fetch karein
     useEffect(() => {
         fetchCategories();
@@ -230,6 +264,7 @@ function HomePage({ onOrderNow }) {
                         )}
                         <FilterSidebar 
                             categories={categories} 
+                            facets={facets}
                             onFilterChange={handleFilterChange}
                             isOpen={isFilterOpen} // Naya prop pass karein
                             onClose={handleFilterToggle} // Naya prop pass karein
@@ -244,6 +279,9 @@ function HomePage({ onOrderNow }) {
                         onOrderNow={onOrderNow}
                         searchTerm={filters.model} 
                         onImageClick={handleImageClick}
+                        hasMore={!!nextCursor}
+                        loadingMore={loadingMore}
+                        onLoadMore={fetchMoreProducts}
                     />
                 </div>
             </main>